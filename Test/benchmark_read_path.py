@@ -0,0 +1,176 @@
+"""
+Benchmark de la ruta de lectura de los listados.
+
+Compara, para 1k, 10k y 100k filas, las filas por segundo de:
+
+- orm: Videojuego.query + to_dict() (la ruta anterior de get_all)
+- core_mappings: VideojuegoService.read_rows() (select() de Core con .mappings())
+- core_json: VideojuegoService._load_all() (filas de Core serializadas a JSON)
+
+Por defecto usa una base de datos SQLite temporal; con --database-url se
+puede apuntar a otra base de datos, cuya tabla de videojuegos se vacía.
+
+Uso:
+    python Test/benchmark_read_path.py
+    python Test/benchmark_read_path.py --sizes 1000,10000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Agregar el directorio raíz al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CATEGORIAS = ['Acción', 'Aventura', 'RPG', 'Deportes', 'Estrategia', 'Simulación', 'Plataformas']
+
+def parse_args():
+    """
+    Lee los argumentos de la línea de comandos.
+    
+    Returns:
+        argparse.Namespace: Argumentos del benchmark
+    """
+    parser = argparse.ArgumentParser(description='Benchmark de la ruta de lectura de los listados')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Número de filas separados por comas')
+    parser.add_argument('--repeat', type=int, default=3, help='Repeticiones por medición (se usa la mejor)')
+    parser.add_argument('--database-url', help='URL de la base de datos (por defecto SQLite temporal)')
+    return parser.parse_args()
+
+def fill_table(total):
+    """
+    Deja la tabla de videojuegos con exactamente `total` filas.
+    
+    Args:
+        total (int): Número de filas
+    """
+    from src.Config.Database import db
+    from src.Models.Videojuego import Videojuego
+    
+    db.session.execute(Videojuego.__table__.delete())
+    inicio = datetime.utcnow() - timedelta(seconds=total)
+    rows = [
+        {
+            'nombre': f'Videojuego {i:06d}',
+            'categoria': CATEGORIAS[i % len(CATEGORIAS)],
+            'precio': 5 + (i % 60) + 0.99,
+            'valoracion': (i % 100) / 10,
+            'fecha_creacion': inicio + timedelta(seconds=i),
+            'fecha_actualizacion': inicio + timedelta(seconds=i),
+        }
+        for i in range(total)
+    ]
+    for start in range(0, total, 5000):
+        db.session.execute(Videojuego.__table__.insert(), rows[start:start + 5000])
+    db.session.commit()
+
+def read_orm(total):
+    """
+    Ruta anterior: objetos ORM convertidos con to_dict().
+    
+    Args:
+        total (int): Número de filas a leer
+    
+    Returns:
+        int: Filas leídas
+    """
+    from src.Config.Database import db
+    from src.Models.Videojuego import Videojuego
+    
+    videojuegos = Videojuego.query.order_by(
+        Videojuego.fecha_creacion.desc(),
+        Videojuego.id.desc()
+    ).limit(total).all()
+    data = [videojuego.to_dict() for videojuego in videojuegos]
+    db.session.expunge_all()
+    return len(data)
+
+def read_core_mappings(total):
+    """
+    Capa de solo lectura de Core convertida al formato de to_dict().
+    
+    Args:
+        total (int): Número de filas a leer
+    
+    Returns:
+        int: Filas leídas
+    """
+    from src.Services.VideojuegoService import VideojuegoService
+    
+    data = [VideojuegoService.row_to_dict(row) for row in VideojuegoService.read_rows(limit=total)]
+    return len(data)
+
+def read_core_json(total):
+    """
+    Ruta actual de los listados: filas de Core serializadas directamente a JSON.
+    
+    Args:
+        total (int): Número de filas a leer
+    
+    Returns:
+        int: Filas leídas
+    """
+    from src.Services.VideojuegoService import VideojuegoService
+    
+    result = VideojuegoService._load_all(per_page=total, include_total=False)
+    return total if result['videojuegos'] else 0
+
+STRATEGIES = [
+    ('orm', read_orm),
+    ('core_mappings', read_core_mappings),
+    ('core_json', read_core_json),
+]
+
+def measure(function, total, repeat):
+    """
+    Mide las filas por segundo de una ruta de lectura.
+    
+    Args:
+        function (callable): Ruta de lectura
+        total (int): Número de filas
+        repeat (int): Repeticiones (se devuelve la mejor)
+    
+    Returns:
+        float: Filas por segundo
+    """
+    function(total)  # Calentamiento
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = function(total)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return rows / best
+
+def main():
+    """
+    Función principal del benchmark.
+    """
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    
+    os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+    os.environ['AUTOCOMPLETE_WARMUP'] = 'false'
+    
+    from app import create_app
+    from src.Config.Database import db
+    
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        
+        print(f"🎮 Benchmark de lectura ({db.engine.dialect.name})")
+        print(f"{'filas':>8} " + ' '.join(f'{name:>15}' for name, _ in STRATEGIES) + f" {'mejora':>8}")
+        
+        for total in sizes:
+            fill_table(total)
+            results = [measure(function, total, args.repeat) for _, function in STRATEGIES]
+            speedup = results[-1] / results[0]
+            print(f"{total:>8} " + ' '.join(f'{rate:>11,.0f} f/s' for rate in results) + f" {speedup:>7.1f}x")
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
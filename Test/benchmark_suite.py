@@ -0,0 +1,456 @@
+"""
+Suite de benchmarks de la API y de la capa de servicios.
+
+Para cada tamaño de catálogo (por defecto 1k y 100k filas; con --sizes se
+puede añadir 1000000) se carga un catálogo sintético y se mide:
+
+- service: métodos de VideojuegoService sin caché (_load_*) y con caché
+- serialization: Videojuego.to_dict, VideojuegoDTO.to_dict y serialize_rows
+- client: peticiones a la aplicación con el cliente de pruebas de Flask
+- http: carga concurrente por HTTP contra un servidor local (o --url)
+
+De cada caso se obtienen p50, p95, p99, media y operaciones por segundo.
+Con --output los resultados se guardan en un fichero JSON que sirve de
+línea base; con --compare se comparan con una línea base anterior y el
+script termina con código 1 si algún caso empeora más de --tolerance.
+
+Por defecto usa una base de datos SQLite temporal; con --database-url se
+puede apuntar a un PostgreSQL local, cuya tabla de videojuegos se vacía.
+
+Uso:
+    python Test/benchmark_suite.py --output baseline.json
+    python Test/benchmark_suite.py --sizes 1000 --compare baseline.json
+    python Test/benchmark_suite.py --sizes 1000,100000,1000000 --database-url postgresql://localhost/bench
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+# Agregar el directorio raíz al path para importar módulos
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+CATEGORIAS = ['Acción', 'Aventura', 'RPG', 'Deportes', 'Estrategia', 'Simulación', 'Plataformas']
+
+# Filas por lote al cargar el catálogo
+SEED_BATCH_SIZE = 5000
+
+# Filas por operación en los benchmarks de serialización
+SERIALIZATION_ROWS = 1000
+
+# Peticiones de la prueba de carga HTTP (se reparten por turnos)
+HTTP_PATHS = [
+    '/api/videojuegos?limit=20',
+    '/api/videojuegos?categoria=RPG&limit=20',
+    '/api/videojuegos?buscar=Videojuego%20000&limit=20',
+    '/api/videojuegos/categorias',
+    '/api/videojuegos/estadisticas',
+    '/health',
+]
+
+def parse_args():
+    """
+    Lee los argumentos de la línea de comandos.
+    
+    Returns:
+        argparse.Namespace: Argumentos del benchmark
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks de la API y de la capa de servicios')
+    parser.add_argument('--sizes', default='1000,100000', help='Tamaños del catálogo separados por comas')
+    parser.add_argument('--iterations', type=int, default=200, help='Repeticiones de cada caso de service/serialization/client')
+    parser.add_argument('--requests', type=int, default=2000, help='Peticiones de la prueba de carga HTTP')
+    parser.add_argument('--concurrency', type=int, default=8, help='Clientes concurrentes de la prueba de carga HTTP')
+    parser.add_argument('--groups', default='service,serialization,client,http', help='Grupos de casos a ejecutar')
+    parser.add_argument('--database-url', help='URL de la base de datos (por defecto SQLite temporal)')
+    parser.add_argument('--url', help='URL base de un servidor ya arrancado para la prueba HTTP (no se carga el catálogo en él)')
+    parser.add_argument('--output', help='Fichero JSON donde guardar los resultados')
+    parser.add_argument('--compare', help='Fichero JSON de una ejecución anterior con el que comparar')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Empeoramiento permitido al comparar (0.2 = 20%%)')
+    return parser.parse_args()
+
+def percentile(sorted_values, fraction):
+    """
+    Calcula un percentil por el método del rango más cercano.
+    
+    Args:
+        sorted_values (list): Valores ordenados de menor a mayor
+        fraction (float): Percentil entre 0 y 1
+    
+    Returns:
+        float: Valor del percentil
+    """
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def summarize(latencies, elapsed):
+    """
+    Resume las latencias de un caso.
+    
+    Args:
+        latencies (list): Segundos de cada operación
+        elapsed (float): Segundos totales (de reloj) de todas las operaciones
+    
+    Returns:
+        dict: Número de operaciones, percentiles y media en milisegundos y operaciones por segundo
+    """
+    ordered = sorted(latencies)
+    return {
+        'n': len(ordered),
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 4),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 4),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 4),
+        'mean_ms': round(sum(ordered) / len(ordered) * 1000, 4),
+        'ops_per_sec': round(len(ordered) / elapsed, 2) if elapsed else None
+    }
+
+def run_case(function, iterations):
+    """
+    Ejecuta un caso secuencialmente midiendo cada operación.
+    
+    Args:
+        function (callable): Operación a medir; recibe el número de iteración
+        iterations (int): Repeticiones
+    
+    Returns:
+        dict: Resumen de las latencias
+    """
+    function(0)  # Calentamiento
+    latencies = []
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        operation_start = time.perf_counter()
+        function(iteration)
+        latencies.append(time.perf_counter() - operation_start)
+    return summarize(latencies, time.perf_counter() - start)
+
+def seed_catalog(total):
+    """
+    Deja el catálogo con exactamente `total` videojuegos y reconstruye las estadísticas.
+    
+    Args:
+        total (int): Número de videojuegos
+    """
+    from src.Config.Cache import response_cache, videojuego_cache
+    from src.Config.Database import db
+    from src.Models.Videojuego import Videojuego
+    from src.Services.EstadisticasService import EstadisticasService
+    
+    table = Videojuego.__table__
+    db.session.execute(table.delete())
+    inicio = datetime.utcnow() - timedelta(seconds=total)
+    for batch_start in range(0, total, SEED_BATCH_SIZE):
+        db.session.execute(table.insert(), [
+            {
+                'nombre': f'Videojuego {i:07d}',
+                'categoria': CATEGORIAS[i % len(CATEGORIAS)],
+                'precio': 5 + (i % 60) + 0.99,
+                'valoracion': (i % 100) / 10,
+                'fecha_creacion': inicio + timedelta(seconds=i),
+                'fecha_actualizacion': inicio + timedelta(seconds=i),
+            }
+            for i in range(batch_start, min(batch_start + SEED_BATCH_SIZE, total))
+        ])
+    db.session.commit()
+    
+    EstadisticasService.rebuild()
+    response_cache.bump_version()
+    videojuego_cache.clear()
+
+def service_cases(total, iterations):
+    """
+    Mide los métodos de VideojuegoService.
+    
+    Los casos *_uncached llaman a los métodos _load_* (consultas sin caché);
+    el resto usan la ruta pública, con la caché ya caliente.
+    
+    Args:
+        total (int): Tamaño del catálogo
+        iterations (int): Repeticiones por caso
+    
+    Returns:
+        dict: Resumen por caso
+    """
+    from src.Config.Cache import videojuego_cache
+    from src.Config.Database import db
+    from src.Models.Videojuego import Videojuego
+    from src.Services.VideojuegoService import VideojuegoService
+    
+    first_id = db.session.execute(db.select(db.func.min(Videojuego.id))).scalar()
+    ids = [first_id + random.randrange(total) for _ in range(iterations + 1)]
+    
+    def detail_uncached(iteration):
+        videojuego_cache.clear()
+        VideojuegoService.get_dto_by_id(ids[iteration])
+    
+    cases = {
+        'get_all_uncached': lambda i: VideojuegoService._load_all(page=1 + i % 10, per_page=20),
+        'get_page_uncached': lambda i: VideojuegoService._load_page(categoria=CATEGORIAS[i % len(CATEGORIAS)], limit=20),
+        'search_uncached': lambda i: VideojuegoService._load_search(f'Videojuego {i % 100:03d}', limit=20),
+        'get_statistics_uncached': lambda i: VideojuegoService._load_statistics(),
+        'get_dto_by_id_uncached': detail_uncached,
+        'get_all_cached': lambda i: VideojuegoService.get_all(page=1, per_page=20),
+        'get_dto_by_id_cached': lambda i: VideojuegoService.get_dto_by_id(ids[0]),
+    }
+    
+    results = {}
+    for name, function in cases.items():
+        results[name] = run_case(function, iterations)
+        db.session.rollback()
+    return results
+
+def serialization_cases(iterations):
+    """
+    Mide la serialización de SERIALIZATION_ROWS videojuegos por operación.
+    
+    Args:
+        iterations (int): Repeticiones por caso
+    
+    Returns:
+        dict: Resumen por caso
+    """
+    from src.Config.Database import db
+    from src.Config.Json import serialize_rows
+    from src.Models.Videojuego import Videojuego
+    from src.Models.VideojuegoDTO import VideojuegoDTO
+    from src.Services.VideojuegoService import LIST_COLUMNS, LIST_KEYS, VideojuegoService
+    
+    models = Videojuego.query.limit(SERIALIZATION_ROWS).all()
+    rows = db.session.execute(db.select(*LIST_COLUMNS).limit(SERIALIZATION_ROWS)).all()
+    dtos = [VideojuegoDTO.from_row(row) for row in VideojuegoService.read_rows(limit=SERIALIZATION_ROWS)]
+    
+    cases = {
+        'model_to_dict': lambda i: [videojuego.to_dict() for videojuego in models],
+        'dto_to_dict': lambda i: [dto.to_dict() for dto in dtos],
+        'serialize_rows': lambda i: serialize_rows(rows, LIST_KEYS),
+    }
+    
+    results = {name: run_case(function, iterations) for name, function in cases.items()}
+    db.session.expunge_all()
+    return results
+
+def client_cases(app, iterations):
+    """
+    Mide peticiones completas con el cliente de pruebas de Flask.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+        iterations (int): Repeticiones por caso
+    
+    Returns:
+        dict: Resumen por caso
+    """
+    client = app.test_client()
+    
+    def request(path):
+        def function(iteration):
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f'{path} devolvió {response.status_code}')
+        return function
+    
+    return {path: run_case(request(path), iterations) for path in HTTP_PATHS}
+
+def start_server(app):
+    """
+    Arranca un servidor HTTP local (multihilo) en un puerto libre.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    
+    Returns:
+        tuple: (servidor, URL base)
+    """
+    from werkzeug.serving import make_server
+    
+    # Sin una línea de log por petición
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+def http_load(base_url, total_requests, concurrency):
+    """
+    Genera carga HTTP concurrente contra un servidor.
+    
+    Args:
+        base_url (str): URL base del servidor
+        total_requests (int): Número de peticiones
+        concurrency (int): Clientes concurrentes
+    
+    Returns:
+        dict: Resumen de las latencias y número de errores
+    """
+    def fetch(index):
+        path = HTTP_PATHS[index % len(HTTP_PATHS)]
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url + path, timeout=30) as response:
+                response.read()
+                ok = response.status == 200
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+    
+    for index in range(len(HTTP_PATHS)):  # Calentamiento
+        fetch(index)
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(fetch, range(total_requests)))
+    elapsed = time.perf_counter() - start
+    
+    result = summarize([latency for latency, _ in outcomes], elapsed)
+    result['errors'] = sum(1 for _, ok in outcomes if not ok)
+    result['concurrency'] = concurrency
+    return result
+
+def compare(results, baseline, tolerance):
+    """
+    Compara los resultados con una línea base y muestra las diferencias.
+    
+    Un caso empeora si su p95 crece o sus operaciones por segundo bajan
+    más de la tolerancia.
+    
+    Args:
+        results (dict): Resultados de esta ejecución
+        baseline (dict): Resultados de la ejecución anterior
+        tolerance (float): Empeoramiento permitido (0.2 = 20%)
+    
+    Returns:
+        list: Casos que empeoran
+    """
+    regressions = []
+    print(f"\n📊 Comparación con la línea base (tolerancia {tolerance:.0%})")
+    print(f"{'caso':<70} {'p95 base':>10} {'p95':>10} {'ops/s base':>12} {'ops/s':>12}")
+    
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        
+        slower = current['p95_ms'] > previous['p95_ms'] * (1 + tolerance)
+        fewer = bool(previous.get('ops_per_sec')) and (current['ops_per_sec'] or 0) < previous['ops_per_sec'] * (1 - tolerance)
+        icon = '❌' if slower or fewer else '✅'
+        if slower or fewer:
+            regressions.append(name)
+        
+        print(
+            f"{icon} {name:<67} {previous['p95_ms']:>10.3f} {current['p95_ms']:>10.3f} "
+            f"{previous.get('ops_per_sec') or 0:>12,.1f} {current['ops_per_sec'] or 0:>12,.1f}"
+        )
+    
+    return regressions
+
+def git_revision():
+    """
+    Obtiene el commit actual del repositorio.
+    
+    Returns:
+        str or None: Hash corto del commit o None si no está disponible
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    """
+    Función principal del benchmark.
+    """
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    groups = {group.strip() for group in args.groups.split(',')}
+    
+    os.environ['DATABASE_URL'] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+    os.environ['AUTOCOMPLETE_WARMUP'] = 'false'
+    os.environ.setdefault('ACCESS_LOG_ENABLED', 'false')
+    
+    from app import create_app
+    from src.Config.Database import db
+    
+    app = create_app()
+    results = {}
+    
+    def record(size, group, cases):
+        for name, summary in cases.items():
+            key = f'{group}:{size}:{name}'
+            results[key] = summary
+            print(
+                f"   {group:<14} {name:<50} p50 {summary['p50_ms']:>9.3f} ms  "
+                f"p95 {summary['p95_ms']:>9.3f} ms  p99 {summary['p99_ms']:>9.3f} ms  "
+                f"{summary['ops_per_sec'] or 0:>10,.1f} ops/s"
+            )
+    
+    with app.app_context():
+        db.create_all()
+        dialect = db.engine.dialect.name
+    
+    print(f"🎮 Benchmarks ({dialect}, {args.iterations} repeticiones, HTTP {args.requests} peticiones x {args.concurrency})")
+    
+    server, base_url = (None, args.url) if args.url else start_server(app) if 'http' in groups else (None, None)
+    try:
+        for size in sizes:
+            print(f"\n📦 Catálogo de {size:,} videojuegos")
+            with app.app_context():
+                start = time.perf_counter()
+                seed_catalog(size)
+                print(f"   Carga: {time.perf_counter() - start:.1f} s")
+                
+                if 'service' in groups:
+                    record(size, 'service', service_cases(size, args.iterations))
+                if 'serialization' in groups:
+                    record(size, 'serialization', serialization_cases(args.iterations))
+            
+            if 'client' in groups:
+                record(size, 'client', client_cases(app, args.iterations))
+            if 'http' in groups:
+                record(size, 'http', {'mixed': http_load(base_url, args.requests, args.concurrency)})
+    finally:
+        if server is not None:
+            server.shutdown()
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump({
+                'meta': {
+                    'fecha': datetime.now(timezone.utc).isoformat(),
+                    'commit': git_revision(),
+                    'python': platform.python_version(),
+                    'plataforma': platform.platform(),
+                    'dialecto': dialect,
+                    'sizes': sizes,
+                    'iterations': args.iterations,
+                    'requests': args.requests,
+                    'concurrency': args.concurrency,
+                },
+                'results': results
+            }, output, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados guardados en {args.output}")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} casos empeoran: {', '.join(regressions)}")
+            return 1
+        print("\n✅ Sin regresiones")
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app import create_app
 from src.Config.Database import db
 from src.Models.Videojuego import Videojuego
+from src.Services.EstadisticasService import EstadisticasService
 
 def create_sample_data():
     """
@@ -99,6 +100,9 @@ def create_sample_data():
         # Confirmar cambios
         db.session.commit()
         
+        # Reconstruir el resumen de estadísticas tras la carga directa
+        EstadisticasService.rebuild()
+        
         print(f"✅ Se crearon {len(videojuegos_ejemplo)} videojuegos de ejemplo exitosamente")
         
         # Mostrar estadísticas
@@ -8,9 +8,17 @@ from dotenv import load_dotenv
 
 # Importar módulos de la aplicación
 from src.Config.Database import init_db, create_tables
+from src.Config.Json import init_json
+from src.Config.Replicas import setup_replica_routing
 from src.Routes import register_blueprints
+from src.Commands import register_commands
+from src.Services.AutocompleteService import AutocompleteService
 from src.Schemas import get_swagger_config, get_swagger_template
-from src.Middlewares.error_handler import register_error_handlers, setup_logging, log_request_info, setup_cors
+from src.Middlewares.error_handler import register_error_handlers, setup_logging, setup_cors
+from src.Middlewares.access_log import setup_access_log
+from src.Middlewares.compression import setup_compression
+from src.Middlewares.metrics import setup_metrics
+from src.Middlewares.profiler import setup_sql_profiler
 
 # Cargar variables de entorno
 load_dotenv()
@@ -28,6 +36,9 @@ def create_app():
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['DEBUG'] = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     
+    # Registrar el proveedor JSON (orjson si está instalado)
+    init_json(app)
+    
     # Configurar Swagger
     # Inicializar Swagger
     Swagger(app, config=get_swagger_config(), template=get_swagger_template())
@@ -38,11 +49,23 @@ def create_app():
     # Registrar blueprints
     register_blueprints(app)
     
+    # Registrar comandos de consola
+    register_commands(app)
+    
+    # Construir el índice de autocompletado al arrancar
+    if os.getenv('AUTOCOMPLETE_WARMUP', 'true').lower() == 'true':
+        with app.app_context():
+            AutocompleteService.warm_up()
+    
     # Configurar middlewares
     register_error_handlers(app)
     setup_logging(app)
-    log_request_info(app)
+    setup_access_log(app)
     setup_cors(app)
+    setup_replica_routing(app)
+    setup_sql_profiler(app)
+    setup_metrics(app)
+    setup_compression(app)
     
     # Ruta raíz que redirige a la documentación
     @app.route('/')
@@ -0,0 +1,220 @@
+"""
+Configuración de Gunicorn para producción.
+
+Uso (Gunicorn también carga este fichero por defecto desde el directorio
+de trabajo):
+
+    gunicorn -c gunicorn.conf.py src.wsgi.wsgi:application
+
+Todos los valores se pueden ajustar con variables de entorno:
+    - PORT: Puerto de escucha (por defecto 5000)
+    - GUNICORN_WORKER_CLASS: sync, gthread o gevent (por defecto gthread)
+    - WORKERS / WEB_CONCURRENCY: Número de procesos (por defecto según las CPUs)
+    - GUNICORN_MAX_WORKERS: Límite del cálculo automático de procesos (por defecto 8)
+    - GUNICORN_THREADS: Hilos por proceso con gthread (por defecto 4)
+    - GUNICORN_WORKER_CONNECTIONS: Peticiones simultáneas por proceso con gevent (por defecto 1000)
+    - GUNICORN_PRELOAD: Cargar la aplicación en el maestro antes del fork
+      (por defecto true, salvo con gevent)
+    - TIMEOUT: Segundos antes de reiniciar un worker bloqueado (por defecto 120)
+    - GUNICORN_GRACEFUL_TIMEOUT: Segundos para terminar las peticiones en curso al parar (por defecto 30)
+    - GUNICORN_KEEPALIVE: Segundos que se mantiene abierta una conexión inactiva (por defecto 5)
+    - GUNICORN_MAX_REQUESTS: Peticiones antes de reciclar un worker, 0 desactiva (por defecto 1000)
+    - GUNICORN_MAX_REQUESTS_JITTER: Variación aleatoria de max_requests (por defecto 100)
+    - GUNICORN_LOG_LEVEL: Nivel del log de Gunicorn (por defecto info)
+
+Cada proceso tiene su propio pool de conexiones, así que el máximo contra
+PostgreSQL es workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW). Con gthread,
+GUNICORN_THREADS no debería superar DB_POOL_SIZE + DB_MAX_OVERFLOW para
+que los hilos no esperen por una conexión libre.
+"""
+import glob
+import os
+import sys
+
+def _env_bool(name, default):
+    """
+    Lee una variable de entorno booleana.
+    
+    Args:
+        name (str): Nombre de la variable
+        default (bool): Valor si no está definida
+    
+    Returns:
+        bool: Valor interpretado
+    """
+    return os.getenv(name, str(default)).strip().lower() in ('1', 'true', 'yes')
+
+def _cpu_count():
+    """
+    Obtiene las CPUs disponibles para el proceso (respeta la afinidad del contenedor).
+    
+    Returns:
+        int: Número de CPUs
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _default_workers(worker_class):
+    """
+    Calcula el número de procesos a partir de las CPUs.
+    
+    Con sync cada proceso atiende una sola petición, así que se usa la
+    fórmula habitual 2 * CPUs + 1; con gthread y gevent cada proceso ya
+    atiende varias a la vez y basta con uno por CPU más uno.
+    
+    Args:
+        worker_class (str): Tipo de worker
+    
+    Returns:
+        int: Número de procesos
+    """
+    cpus = _cpu_count()
+    workers = cpus * 2 + 1 if worker_class == 'sync' else cpus + 1
+    return min(workers, int(os.getenv('GUNICORN_MAX_WORKERS', 8)))
+
+# Servidor
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Modelo de workers
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.getenv('WORKERS') or os.getenv('WEB_CONCURRENCY') or _default_workers(worker_class))
+threads = int(os.getenv('GUNICORN_THREADS', 4)) if worker_class == 'gthread' else 1
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Con gevent el parcheo de la librería estándar se hace en cada worker,
+# después del fork: si la aplicación ya se cargó en el maestro, sus hilos
+# y locks no quedarían parcheados
+preload_app = _env_bool('GUNICORN_PRELOAD', worker_class != 'gevent')
+
+# Tiempos de espera y keep-alive
+timeout = int(os.getenv('TIMEOUT', 120))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+# Reciclado de workers (con variación para que no se reinicien todos a la vez)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Latido de los workers en memoria (evita bloqueos del disco en contenedores)
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+# Logs: la aplicación escribe su propio log de acceso (src/Middlewares/access_log.py)
+accesslog = None
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+def on_starting(server):
+    """
+    Prepara la caché y el directorio de métricas antes de cargar la aplicación.
+    
+    La caché compartida (SQLite o Redis) sobrevive a los reinicios: se
+    incrementa la versión del catálogo de esta base de datos para no
+    servir datos de la ejecución anterior si la base de datos cambió
+    mientras el servidor estaba parado. No se vacía: el fichero o el
+    servidor pueden guardar cachés de otras aplicaciones o bases de datos,
+    y durante un reinicio solapado (USR2, despliegue gradual) los workers
+    anteriores siguen usando la versión, que nunca debe retroceder. Las
+    entradas anteriores quedan inaccesibles y expiran con su TTL. Se
+    borran también los ficheros de métricas anteriores para que los PIDs
+    de procesos que ya no existen no se sumen a los contadores.
+    
+    Args:
+        server: Arbiter de Gunicorn
+    """
+    from src.Config.Cache import MemoryCacheBackend, response_cache
+    from src.Config.Database import get_database_url
+    if not isinstance(response_cache.backend, MemoryCacheBackend):
+        response_cache.set_database(get_database_url())
+        version = response_cache.bump_version()
+        server.log.info(f'Versión de la caché compartida ({response_cache.namespace}): {version}')
+    
+    metrics_dir = os.getenv('METRICS_MULTIPROC_DIR') or os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if not metrics_dir:
+        return
+    
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, '*metrics_*')):
+        os.remove(path)
+    server.log.info(f'Directorio de métricas preparado: {metrics_dir}')
+
+def when_ready(server):
+    """
+    Cierra en el maestro las conexiones abiertas al cargar la aplicación.
+    
+    Con preload_app, create_app() se ejecuta en el maestro (por ejemplo, el
+    índice de autocompletado consulta la base de datos) y los workers
+    heredarían esas conexiones.
+    
+    Args:
+        server: Arbiter de Gunicorn
+    """
+    if not server.cfg.preload_app:
+        return
+    
+    from src.Config.Database import dispose_engines
+    dispose_engines(server.app.wsgi())
+    server.log.info(f'Workers: {server.cfg.workers} x {server.cfg.worker_class_str} (threads={server.cfg.threads})')
+
+def post_fork(server, worker):
+    """
+    Descarta en cada worker los pools heredados del maestro.
+    
+    Se usa close=False: los sockets heredados son compartidos con el
+    maestro y con el resto de workers, así que no se cierran, solo se
+    olvidan; cada worker abre sus propias conexiones. El log en segundo
+    plano se reinicia solo (os.register_at_fork en access_log.py).
+    
+    Args:
+        server: Arbiter de Gunicorn
+        worker: Worker recién creado
+    """
+    if not server.cfg.preload_app:
+        return
+    
+    from src.Config.Database import dispose_engines
+    dispose_engines(server.app.wsgi(), close=False)
+
+def post_worker_init(worker):
+    """
+    Hace cooperativo el driver de PostgreSQL con gevent (si psycogreen está instalado).
+    
+    Args:
+        worker: Worker ya inicializado
+    """
+    if worker.cfg.worker_class_str != 'gevent':
+        return
+    
+    try:
+        from psycogreen.gevent import patch_psycopg
+    except ImportError:
+        worker.log.warning('psycogreen no está instalado: las consultas a PostgreSQL bloquearán el worker gevent')
+        return
+    patch_psycopg()
+
+def child_exit(server, worker):
+    """
+    Archiva en el maestro las métricas del worker que acaba de terminar.
+    
+    Sus contadores se suman al fichero acumulado y su fichero se borra, así
+    el directorio no crece al reciclar workers (max_requests).
+    
+    Args:
+        server: Arbiter de Gunicorn
+        worker: Worker terminado
+    """
+    from src.Middlewares.metrics import archive_process_metrics
+    archive_process_metrics([worker.pid])
+
+def worker_exit(server, worker):
+    """
+    Vuelca las métricas del worker antes de que termine.
+    
+    Args:
+        server: Arbiter de Gunicorn
+        worker: Worker que termina
+    """
+    metrics = sys.modules.get('src.Middlewares.metrics')
+    if metrics is not None:
+        metrics.metrics_registry.flush(force=True)
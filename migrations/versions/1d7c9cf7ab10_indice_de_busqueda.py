@@ -0,0 +1,64 @@
+"""indice de busqueda
+
+Revision ID: 1d7c9cf7ab10
+Revises: 98b2d5ccfeff
+Create Date: 2026-10-17 04:19:44.962975
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d7c9cf7ab10'
+down_revision = '98b2d5ccfeff'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_videojuegos_busqueda ON videojuegos "
+            "USING GIN (to_tsvector('simple'::regconfig, nombre || ' ' || categoria))"
+        )
+
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS videojuegos_fts USING fts5("
+            "nombre, categoria, content='videojuegos', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_ai AFTER INSERT ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_fts(rowid, nombre, categoria) VALUES (new.id, new.nombre, new.categoria); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_ad AFTER DELETE ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_fts(videojuegos_fts, rowid, nombre, categoria) "
+            "VALUES ('delete', old.id, old.nombre, old.categoria); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_au AFTER UPDATE ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_fts(videojuegos_fts, rowid, nombre, categoria) "
+            "VALUES ('delete', old.id, old.nombre, old.categoria); "
+            "INSERT INTO videojuegos_fts(rowid, nombre, categoria) VALUES (new.id, new.nombre, new.categoria); "
+            "END"
+        )
+        op.execute("INSERT INTO videojuegos_fts(videojuegos_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_videojuegos_busqueda")
+
+    elif dialect == 'sqlite':
+        for trigger in ('videojuegos_fts_ai', 'videojuegos_fts_ad', 'videojuegos_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS videojuegos_fts")
@@ -0,0 +1,35 @@
+"""crear tabla videojuegos
+
+Revision ID: 31665c301eab
+Revises: 
+Create Date: 2026-10-17 04:19:38.500837
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '31665c301eab'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'videojuegos',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('nombre', sa.String(length=100), nullable=False),
+        sa.Column('categoria', sa.String(length=50), nullable=False),
+        sa.Column('precio', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('valoracion', sa.Numeric(precision=3, scale=1), nullable=False),
+        sa.Column('fecha_creacion', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('fecha_actualizacion', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('nombre')
+    )
+
+
+def downgrade():
+    op.drop_table('videojuegos')
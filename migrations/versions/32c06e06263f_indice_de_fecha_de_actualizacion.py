@@ -0,0 +1,35 @@
+"""indice de fecha de actualizacion
+
+Revision ID: 32c06e06263f
+Revises: 1d7c9cf7ab10
+Create Date: 2026-10-17 04:23:02.417278
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '32c06e06263f'
+down_revision = '1d7c9cf7ab10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # max(fecha_actualizacion) forma parte del ETag del catálogo
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_videojuegos_fecha_actualizacion', 'videojuegos', ['fecha_actualizacion'],
+                postgresql_concurrently=True, if_not_exists=True
+            )
+    else:
+        op.create_index(
+            'ix_videojuegos_fecha_actualizacion', 'videojuegos', ['fecha_actualizacion'],
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    op.drop_index('ix_videojuegos_fecha_actualizacion', table_name='videojuegos')
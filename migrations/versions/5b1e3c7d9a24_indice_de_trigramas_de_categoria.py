@@ -0,0 +1,75 @@
+"""indice de trigramas de categoria
+
+Revision ID: 5b1e3c7d9a24
+Revises: 32c06e06263f
+Create Date: 2026-10-17 09:12:31.508914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1e3c7d9a24'
+down_revision = '32c06e06263f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # El filtro de categoría busca una subcadena sin distinguir mayúsculas
+    # (ILIKE '%x%'), que lower(categoria) no puede resolver: se sustituye por
+    # un índice de trigramas
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_videojuegos_categoria_lower")
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videojuegos_categoria_trgm ON videojuegos "
+                "USING GIN (categoria gin_trgm_ops)"
+            )
+
+    elif dialect == 'sqlite':
+        op.drop_index('ix_videojuegos_categoria_lower', table_name='videojuegos', if_exists=True)
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS videojuegos_categoria_fts USING fts5("
+            "categoria, content='videojuegos', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_ai AFTER INSERT ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_categoria_fts(rowid, categoria) VALUES (new.id, new.categoria); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_ad AFTER DELETE ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts, rowid, categoria) "
+            "VALUES ('delete', old.id, old.categoria); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_au AFTER UPDATE OF categoria ON videojuegos BEGIN "
+            "INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts, rowid, categoria) "
+            "VALUES ('delete', old.id, old.categoria); "
+            "INSERT INTO videojuegos_categoria_fts(rowid, categoria) VALUES (new.id, new.categoria); "
+            "END"
+        )
+        op.execute("INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_videojuegos_categoria_trgm")
+
+    elif dialect == 'sqlite':
+        for trigger in ('videojuegos_categoria_fts_ai', 'videojuegos_categoria_fts_ad', 'videojuegos_categoria_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS videojuegos_categoria_fts")
+
+    op.create_index(
+        'ix_videojuegos_categoria_lower', 'videojuegos',
+        [sa.text('lower(categoria)'), 'fecha_creacion', 'id'], if_not_exists=True
+    )
@@ -0,0 +1,44 @@
+"""indices de consultas
+
+Revision ID: 98b2d5ccfeff
+Revises: e854999fa350
+Create Date: 2026-10-17 04:19:42.763240
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '98b2d5ccfeff'
+down_revision = 'e854999fa350'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (lower(categoria), fecha_creacion, id) resuelve el filtro de categoría
+    # sin distinguir mayúsculas junto con el orden del listado; (fecha_creacion, id)
+    # se recorre hacia atrás para ORDER BY fecha_creacion DESC, id DESC y el
+    # cursor de la paginación keyset
+    indexes = [
+        ('ix_videojuegos_fecha_creacion_id', ['fecha_creacion', 'id']),
+        ('ix_videojuegos_categoria_lower', [sa.text('lower(categoria)'), 'fecha_creacion', 'id']),
+    ]
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Crear sin bloquear las escrituras en tablas grandes
+        with op.get_context().autocommit_block():
+            for name, columns in indexes:
+                op.create_index(
+                    name, 'videojuegos', columns,
+                    postgresql_concurrently=True, if_not_exists=True
+                )
+    else:
+        for name, columns in indexes:
+            op.create_index(name, 'videojuegos', columns, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_videojuegos_categoria_lower', table_name='videojuegos')
+    op.drop_index('ix_videojuegos_fecha_creacion_id', table_name='videojuegos')
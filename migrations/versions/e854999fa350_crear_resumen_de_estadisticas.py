@@ -0,0 +1,51 @@
+"""crear resumen de estadisticas
+
+Revision ID: e854999fa350
+Revises: 31665c301eab
+Create Date: 2026-10-17 04:19:40.634231
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e854999fa350'
+down_revision = '31665c301eab'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    summary = op.create_table(
+        'videojuegos_estadisticas',
+        sa.Column('categoria', sa.String(length=50), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('suma_precio', sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column('suma_valoracion', sa.Numeric(precision=12, scale=1), nullable=False),
+        sa.PrimaryKeyConstraint('categoria')
+    )
+
+    # Rellenar el resumen con los videojuegos que ya existen
+    videojuegos = sa.table(
+        'videojuegos',
+        sa.column('id'),
+        sa.column('categoria'),
+        sa.column('precio'),
+        sa.column('valoracion')
+    )
+    op.execute(
+        summary.insert().from_select(
+            ['categoria', 'total', 'suma_precio', 'suma_valoracion'],
+            sa.select(
+                videojuegos.c.categoria,
+                sa.func.count(videojuegos.c.id),
+                sa.func.sum(videojuegos.c.precio),
+                sa.func.sum(videojuegos.c.valoracion)
+            ).group_by(videojuegos.c.categoria)
+        )
+    )
+
+
+def downgrade():
+    op.drop_table('videojuegos_estadisticas')
@@ -0,0 +1,76 @@
+"""
+Comandos de consola (flask videojuegos ...) para tareas de mantenimiento.
+"""
+import click
+from flask.cli import AppGroup
+from src.Config.Cache import response_cache
+from src.Services.EstadisticasService import EstadisticasService
+from src.Services.ImportService import IMPORT_BATCH_SIZE, ImportService
+from src.Services.QueryPlanService import QueryPlanService
+
+# Grupo de comandos: flask videojuegos <comando>
+videojuegos_cli = AppGroup('videojuegos', help='Comandos de mantenimiento de videojuegos.')
+
+@videojuegos_cli.command('rebuild-stats')
+def rebuild_stats():
+    """Reconstruye el resumen de estadísticas por categoría."""
+    categorias = EstadisticasService.rebuild()
+    response_cache.bump_version()
+    click.echo(f"✅ Resumen de estadísticas reconstruido ({categorias} categorías)")
+
+@videojuegos_cli.command('check-indexes')
+def check_indexes():
+    """Comprueba con EXPLAIN que las consultas del servicio usan índices."""
+    results = QueryPlanService.check()
+    
+    for result in results:
+        icon = '✅' if result['usa_indice'] else '❌'
+        click.echo(f"{icon} {result['consulta']}")
+        for line in result['plan']:
+            click.echo(f"     {line}")
+    
+    failed = [result['consulta'] for result in results if not result['usa_indice']]
+    if failed:
+        raise click.ClickException(f"Consultas sin índice: {', '.join(failed)}")
+
+@videojuegos_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'ndjson']), help='Formato del fichero (por defecto según la extensión).')
+@click.option('--batch-size', type=click.IntRange(min=1), default=IMPORT_BATCH_SIZE, show_default=True, help='Filas por lote.')
+@click.option('--update', is_flag=True, help='Actualizar los videojuegos con nombre repetido en lugar de omitirlos.')
+@click.option('--truncate', is_flag=True, help='Vaciar el catálogo antes de importar.')
+def import_videojuegos(path, file_format, batch_size, update, truncate):
+    """Importa videojuegos desde un fichero CSV o NDJSON."""
+    def report(summary):
+        rate = summary['leidas'] / summary['segundos'] if summary['segundos'] else 0
+        click.echo(
+            f"   {summary['leidas']:,} leídas, {summary['escritas']:,} escritas, "
+            f"{summary['omitidas']:,} omitidas, {summary['invalidas']:,} inválidas ({rate:,.0f} filas/s)"
+        )
+    
+    file_format = file_format or ImportService.detect_format(path)
+    if file_format is None:
+        raise click.BadParameter('Formato no reconocido (use .csv, .ndjson o .jsonl, o --format)', param_hint='PATH')
+    
+    summary = ImportService.import_file(
+        path,
+        file_format=file_format,
+        batch_size=batch_size,
+        update=update,
+        truncate=truncate,
+        progress=report
+    )
+    
+    for error in summary['errores']:
+        click.echo(f"   ⚠️  Línea {error['linea']}: {'; '.join(error['errores'])}")
+    
+    if summary['interrumpida']:
+        raise click.ClickException(
+            f"Importación interrumpida tras {summary['leidas']:,} filas leídas: {summary['interrumpida']}. "
+            f"Quedaron confirmadas {summary['escritas']:,} filas de los lotes anteriores"
+        )
+    
+    click.echo(
+        f"✅ Importación terminada en {summary['segundos']:.1f} s: {summary['escritas']:,} escritas, "
+        f"{summary['omitidas']:,} omitidas, {summary['invalidas']:,} inválidas"
+    )
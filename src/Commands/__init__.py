@@ -0,0 +1,15 @@
+"""
+Registro de los comandos de consola de la aplicación.
+"""
+from .VideojuegoCommands import videojuegos_cli
+
+def register_commands(app):
+    """
+    Registra todos los grupos de comandos en la aplicación.
+    
+    Args:
+        app: Instancia de Flask
+    """
+    app.cli.add_command(videojuegos_cli)
+
+__all__ = ['register_commands']
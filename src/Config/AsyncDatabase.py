@@ -0,0 +1,105 @@
+"""
+Motor asíncrono de SQLAlchemy para el modo ASGI (src/wsgi/asgi.py).
+
+Usa la misma base de datos que la aplicación con un driver asíncrono:
+asyncpg para PostgreSQL y aiosqlite para SQLite (dependencias opcionales,
+solo necesarias en este modo). ASYNC_DATABASE_URL permite indicar la URL
+explícitamente.
+
+Cada petición asíncrona obtiene su AsyncSession con get_async_session()
+y la cierra al terminar con close_async_session(). Las lecturas
+asíncronas van siempre a la base de datos principal.
+"""
+import os
+from flask import current_app, g
+from src.Config.Pool import get_engine_options
+
+# Drivers asíncronos por esquema de la URL síncrona
+ASYNC_DRIVERS = {
+    'postgres': 'postgresql+asyncpg',
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+def get_async_database_url(database_url):
+    """
+    Convierte la URL de la base de datos a su equivalente con driver asíncrono.
+    
+    Args:
+        database_url (str): URL síncrona (SQLALCHEMY_DATABASE_URI)
+    
+    Returns:
+        str: URL con driver asíncrono (o ASYNC_DATABASE_URL si está definida)
+    
+    Raises:
+        ValueError: Si el esquema no tiene driver asíncrono conocido
+    """
+    if os.getenv('ASYNC_DATABASE_URL'):
+        return os.getenv('ASYNC_DATABASE_URL')
+    
+    scheme, separator, rest = database_url.partition('://')
+    if scheme not in ASYNC_DRIVERS:
+        raise ValueError(f"No hay driver asíncrono para '{scheme}'; defina ASYNC_DATABASE_URL")
+    return f'{ASYNC_DRIVERS[scheme]}{separator}{rest}'
+
+def init_async_db(app):
+    """
+    Crea el motor asíncrono y la fábrica de sesiones de la aplicación.
+    
+    Debe llamarse después de init_db (usa SQLALCHEMY_DATABASE_URI).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    
+    Returns:
+        AsyncEngine: Motor asíncrono
+    """
+    # Importación diferida: sqlalchemy.ext.asyncio necesita greenlet, que
+    # solo se instala para el modo asíncrono
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    
+    database_url = get_async_database_url(app.config['SQLALCHEMY_DATABASE_URI'])
+    
+    # El pool asíncrono lo elige SQLAlchemy (AsyncAdaptedQueuePool); el
+    # resto de opciones (tamaño, reciclado, pre-ping) son las mismas
+    options = get_engine_options(database_url)
+    options.pop('poolclass', None)
+    
+    engine = create_async_engine(database_url, **options)
+    app.extensions['async_db'] = {
+        'engine': engine,
+        'session_factory': async_sessionmaker(engine, expire_on_commit=False)
+    }
+    return engine
+
+def get_async_session():
+    """
+    Obtiene la AsyncSession de la petición actual (la crea si no existe).
+    
+    Returns:
+        AsyncSession: Sesión asíncrona de la petición
+    """
+    session = g.get('_async_session')
+    if session is None:
+        session = g._async_session = current_app.extensions['async_db']['session_factory']()
+    return session
+
+async def close_async_session():
+    """
+    Cierra la AsyncSession de la petición actual, si se abrió.
+    """
+    session = g.pop('_async_session', None)
+    if session is not None:
+        await session.close()
+
+async def dispose_async_engine(app):
+    """
+    Cierra las conexiones del motor asíncrono (al apagar el servidor).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    async_db = app.extensions.get('async_db')
+    if async_db is not None:
+        await async_db['engine'].dispose()
@@ -0,0 +1,647 @@
+"""
+Cachés de la API: caché en memoria del proceso y backends compartidos.
+
+El backend compartido se elige con CACHE_BACKEND:
+    - sqlite: fichero SQLite compartido entre todos los workers de la
+      máquina (por defecto)
+    - redis: servidor Redis, compartido también entre máquinas (requiere
+      el paquete opcional `redis`)
+    - memory: diccionario en memoria del proceso. Solo es correcto con un
+      único proceso: con varios workers, una escritura solo invalida la
+      caché del worker que la atiende
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - dependencia opcional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """
+    Caché LRU acotada con expiración por TTL y contadores de uso.
+    
+    Es segura entre hilos y vive dentro de cada proceso (cada worker de
+    Gunicorn mantiene su propia copia).
+    """
+    
+    def __init__(self, max_entries=1024, ttl=60):
+        """
+        Constructor de la caché.
+        
+        Args:
+            max_entries (int): Número máximo de entradas antes de desalojar
+            ttl (float): Segundos de vida de cada entrada (0 desactiva la expiración)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key):
+        """
+        Obtiene un valor de la caché.
+        
+        Args:
+            key: Clave a buscar
+        
+        Returns:
+            El valor almacenado o None si no existe o ha expirado
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key, value):
+        """
+        Almacena un valor desalojando la entrada menos usada si está llena.
+        
+        Args:
+            key: Clave del valor
+            value: Valor a almacenar
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def delete(self, key):
+        """
+        Elimina una entrada de la caché si existe.
+        
+        Args:
+            key: Clave a invalidar
+        """
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self):
+        """
+        Vacía la caché completa.
+        """
+        with self._lock:
+            self._data.clear()
+    
+    def stats(self):
+        """
+        Obtiene los contadores de uso de la caché.
+        
+        Returns:
+            dict: Estadísticas de la caché
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+class CacheBackend:
+    """
+    Interfaz común de los backends de caché compartida.
+    
+    Los valores deben ser serializables a JSON. Los fallos del backend
+    nunca deben romper una petición: se registran y se tratan como fallos
+    de caché. Los backends con blocking=True hacen E/S (fichero o red) y
+    el modo asíncrono los ejecuta en el pool de hilos del bucle de eventos.
+    """
+    
+    name = 'base'
+    blocking = True
+    
+    def get(self, key):
+        """
+        Obtiene un valor o None si no existe.
+        
+        Args:
+            key (str): Clave a buscar
+        """
+        raise NotImplementedError
+    
+    def set(self, key, value, ttl=None):
+        """
+        Almacena un valor.
+        
+        Args:
+            key (str): Clave del valor
+            value: Valor serializable a JSON
+            ttl (float): Segundos de vida de la entrada
+        """
+        raise NotImplementedError
+    
+    def delete(self, key):
+        """
+        Elimina una entrada.
+        
+        Args:
+            key (str): Clave a eliminar
+        """
+        raise NotImplementedError
+    
+    def incr(self, key):
+        """
+        Incrementa un contador de forma atómica.
+        
+        Args:
+            key (str): Clave del contador
+            
+        Returns:
+            int: Nuevo valor del contador
+        """
+        raise NotImplementedError
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Backend en memoria del proceso. No se comparte entre workers.
+    """
+    
+    name = 'memory'
+    blocking = False
+    
+    def __init__(self, max_entries=4096):
+        """
+        Constructor del backend.
+        
+        Args:
+            max_entries (int): Número máximo de entradas
+        """
+        self._cache = LRUCache(max_entries=max_entries, ttl=0)
+        self._counters = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        value = self._cache.get(key)
+        if value is None:
+            return None
+        
+        data, expires_at = value
+        if expires_at and expires_at < time.monotonic():
+            self._cache.delete(key)
+            return None
+        return data
+    
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._cache.set(key, (value, expires_at))
+    
+    def delete(self, key):
+        self._cache.delete(key)
+        with self._lock:
+            self._counters.pop(key, None)
+    
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+    
+    def get_counter(self, key):
+        """
+        Obtiene el valor actual de un contador.
+        
+        Args:
+            key (str): Clave del contador
+            
+        Returns:
+            int: Valor del contador
+        """
+        with self._lock:
+            return self._counters.get(key, 0)
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Backend compartido sobre un fichero SQLite local.
+    
+    Todos los workers de la máquina que apunten al mismo fichero ven las
+    mismas entradas y contadores. Sirve como sustituto local de Redis.
+    """
+    
+    name = 'sqlite'
+    
+    # Cada cuántas escrituras se purgan las entradas expiradas
+    PURGE_EVERY = 500
+    
+    def __init__(self, path):
+        """
+        Constructor del backend.
+        
+        Args:
+            path (str): Ruta del fichero SQLite
+        """
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        self._connection().execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)'
+        )
+    
+    def _connection(self):
+        """
+        Obtiene la conexión del hilo actual, abriéndola tras un fork.
+        
+        Returns:
+            sqlite3.Connection: Conexión al fichero de caché
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    def get(self, key):
+        try:
+            row = self._connection().execute(
+                'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f'Error leyendo la caché compartida: {e}')
+            return None
+        
+        if row is None or (row[1] and row[1] < time.time()):
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        try:
+            connection = self._connection()
+            connection.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value, separators=(',', ':')), expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                connection.execute('DELETE FROM cache WHERE expires_at < ?', (time.time(),))
+        except sqlite3.Error as e:
+            logger.warning(f'Error escribiendo en la caché compartida: {e}')
+    
+    def delete(self, key):
+        try:
+            self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+        except sqlite3.Error as e:
+            logger.warning(f'Error eliminando de la caché compartida: {e}')
+    
+    def incr(self, key):
+        row = self._connection().execute(
+            "INSERT INTO cache (key, value, expires_at) VALUES (?, '1', NULL) "
+            'ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1 '
+            'RETURNING value',
+            (key,)
+        ).fetchone()
+        return int(row[0])
+    
+    def get_counter(self, key):
+        """
+        Obtiene el valor actual de un contador.
+        
+        Args:
+            key (str): Clave del contador
+            
+        Returns:
+            int: Valor del contador
+        """
+        return int(self.get(key) or 0)
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend compartido sobre Redis.
+    """
+    
+    name = 'redis'
+    
+    def __init__(self, url):
+        """
+        Constructor del backend.
+        
+        Args:
+            url (str): URL de conexión a Redis
+        """
+        if redis is None:
+            raise RuntimeError('CACHE_BACKEND=redis requiere instalar el paquete redis')
+        self._client = redis.Redis.from_url(url)
+    
+    def get(self, key):
+        try:
+            value = self._client.get(key)
+        except redis.RedisError as e:
+            logger.warning(f'Error leyendo la caché compartida: {e}')
+            return None
+        return json.loads(value) if value is not None else None
+    
+    def set(self, key, value, ttl=None):
+        try:
+            self._client.set(key, json.dumps(value, separators=(',', ':')), ex=int(ttl) if ttl else None)
+        except redis.RedisError as e:
+            logger.warning(f'Error escribiendo en la caché compartida: {e}')
+    
+    def delete(self, key):
+        try:
+            self._client.delete(key)
+        except redis.RedisError as e:
+            logger.warning(f'Error eliminando de la caché compartida: {e}')
+    
+    def incr(self, key):
+        return int(self._client.incr(key))
+    
+    def get_counter(self, key):
+        """
+        Obtiene el valor actual de un contador.
+        
+        Args:
+            key (str): Clave del contador
+            
+        Returns:
+            int: Valor del contador
+        """
+        return int(self.get(key) or 0)
+
+def create_cache_backend():
+    """
+    Crea el backend de caché compartida según las variables de entorno.
+    
+    Returns:
+        CacheBackend: Backend configurado
+    """
+    backend = os.getenv('CACHE_BACKEND', 'sqlite').strip().lower()
+    
+    if backend == 'redis':
+        return RedisCacheBackend(os.getenv('CACHE_URL', 'redis://localhost:6379/0'))
+    
+    if backend != 'memory':
+        path = os.getenv('CACHE_URL') or os.path.join(tempfile.gettempdir(), 'videojuegos_cache.sqlite3')
+        try:
+            return SQLiteCacheBackend(path)
+        except sqlite3.Error as e:
+            logger.warning(f'No se pudo abrir la caché compartida {path}, se usa memoria del proceso: {e}')
+    
+    return MemoryCacheBackend(max_entries=int(os.getenv('CACHE_SHARED_MAX_ENTRIES', 4096)))
+
+class VersionedCache:
+    """
+    Caché de respuestas con claves versionadas sobre un backend compartido.
+    
+    Cada escritura en el catálogo incrementa la versión, lo que invalida
+    a la vez todas las claves anteriores en todos los workers. Las claves
+    llevan además un espacio de nombres por base de datos, para que dos
+    aplicaciones con bases de datos distintas no compartan entradas.
+    """
+    
+    def __init__(self, backend, ttl=300):
+        """
+        Constructor de la caché versionada.
+        
+        Args:
+            backend (CacheBackend): Backend de almacenamiento
+            ttl (float): Segundos de vida de cada entrada
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = 'videojuegos'
+        self.hits = 0
+        self.misses = 0
+        self._last_version = None
+        self.version_changed_at = 0.0
+    
+    @property
+    def version_key(self):
+        """
+        Clave del contador de versión del espacio de nombres actual.
+        
+        Returns:
+            str: Clave del contador
+        """
+        return f'{self.namespace}:version'
+    
+    def set_database(self, database_url):
+        """
+        Asocia la caché a una base de datos (espacio de nombres de las claves).
+        
+        Args:
+            database_url (str): URL de la base de datos de la aplicación
+        """
+        digest = hashlib.sha1(database_url.encode('utf-8')).hexdigest()[:12]
+        self.namespace = f'videojuegos:{digest}'
+        self._last_version = None
+    
+    def _observe_version(self, version):
+        """
+        Registra el momento en que el proceso ve una versión nueva del catálogo.
+        
+        Args:
+            version (int): Versión leída o escrita
+            
+        Returns:
+            int: La misma versión
+        """
+        if self._last_version is not None and version != self._last_version:
+            self.version_changed_at = time.monotonic()
+        self._last_version = version
+        return version
+    
+    def get_version(self):
+        """
+        Obtiene la versión actual del catálogo.
+        
+        Returns:
+            int: Versión del catálogo
+        """
+        try:
+            return self._observe_version(self.backend.get_counter(self.version_key))
+        except Exception as e:
+            logger.warning(f'Error leyendo la versión del catálogo: {e}')
+            return 0
+    
+    async def get_version_async(self):
+        """
+        Versión de get_version para el modo asíncrono.
+        
+        Returns:
+            int: Versión del catálogo
+        """
+        return await self.run_async(self.get_version)
+    
+    async def run_async(self, func, *args):
+        """
+        Ejecuta una función que usa el backend sin bloquear el bucle de eventos.
+        
+        Si el backend hace E/S, la función se ejecuta en el pool de hilos
+        del bucle; el backend en memoria se llama directamente.
+        
+        Args:
+            func (callable): Función síncrona
+            *args: Argumentos posicionales de la función
+        
+        Returns:
+            Resultado de la función
+        """
+        if not self.backend.blocking:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    def bump_version(self):
+        """
+        Incrementa la versión del catálogo tras una escritura.
+        
+        Returns:
+            int: Nueva versión del catálogo
+        """
+        try:
+            return self._observe_version(self.backend.incr(self.version_key))
+        except Exception as e:
+            logger.warning(f'Error incrementando la versión del catálogo: {e}')
+            return 0
+    
+    def make_key(self, name, params=None, version=None):
+        """
+        Construye la clave versionada de una entrada.
+        
+        Args:
+            name (str): Nombre lógico de la consulta
+            params (dict): Parámetros de la consulta
+            version (int): Versión a usar (por defecto la actual)
+            
+        Returns:
+            str: Clave de caché
+        """
+        version = self.get_version() if version is None else version
+        key = f'{self.namespace}:v{version}:{name}'
+        if params:
+            digest = hashlib.sha1(
+                json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+            ).hexdigest()
+            key += f':{digest}'
+        return key
+    
+    def get_or_set(self, name, loader, params=None, version=None):
+        """
+        Obtiene una entrada o la calcula con loader si no existe.
+        
+        Args:
+            name (str): Nombre lógico de la consulta
+            loader (callable): Función que calcula el valor
+            params (dict): Parámetros de la consulta
+            version (int): Versión a usar (por defecto la actual)
+            
+        Returns:
+            Valor almacenado o recién calculado
+        """
+        key = self.make_key(name, params, version)
+        value = self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        
+        self.misses += 1
+        value = loader()
+        self.backend.set(key, value, ttl=self.ttl)
+        return value
+    
+    async def get_or_set_async(self, name, loader, params=None, version=None):
+        """
+        Versión de get_or_set para el modo asíncrono.
+        
+        Las operaciones del backend se ejecutan con run_async, de modo que
+        el fichero SQLite o la red de Redis no bloquean el bucle de eventos.
+        
+        Args:
+            name (str): Nombre lógico de la consulta
+            loader (callable): Función asíncrona que calcula el valor
+            params (dict): Parámetros de la consulta
+            version (int): Versión a usar (por defecto la actual)
+        
+        Returns:
+            Valor almacenado o recién calculado
+        """
+        if version is None:
+            version = await self.get_version_async()
+        key = self.make_key(name, params, version)
+        value = await self.run_async(self.backend.get, key)
+        if value is not None:
+            self.hits += 1
+            return value
+        
+        self.misses += 1
+        value = await loader()
+        await self.run_async(self.backend.set, key, value, self.ttl)
+        return value
+    
+    def stats(self):
+        """
+        Obtiene los contadores de uso del proceso actual.
+        
+        Returns:
+            dict: Estadísticas de la caché
+        """
+        lookups = self.hits + self.misses
+        return {
+            'backend': self.backend.name,
+            'version': self.get_version(),
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0
+        }
+
+# Caché de videojuegos serializados por ID (por proceso)
+videojuego_cache = LRUCache(
+    max_entries=int(os.getenv('CACHE_MAX_ENTRIES', 1024)),
+    ttl=float(os.getenv('CACHE_TTL', 60))
+)
+
+# Caché compartida para listados, categorías y estadísticas
+response_cache = VersionedCache(
+    create_cache_backend(),
+    ttl=float(os.getenv('CACHE_SHARED_TTL', 300))
+)
+
+def get_cache_stats():
+    """
+    Obtiene las estadísticas de todas las cachés del proceso.
+    
+    Returns:
+        dict: Estadísticas por caché
+    """
+    return {
+        'videojuegos': videojuego_cache.stats(),
+        'respuestas': response_cache.stats()
+    }
@@ -4,48 +4,73 @@ Configuración de la base de datos PostgreSQL.
 import os
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from dotenv import load_dotenv
+from src.Config.Cache import response_cache
+from src.Config.Pool import get_engine_options, setup_pool_events
+from src.Config.Replicas import RoutingSession, replica_router
 
 # Cargar variables de entorno
 load_dotenv()
 
-# Crear instancias de SQLAlchemy y Migrate
-db = SQLAlchemy()
+# Crear instancias de SQLAlchemy y Migrate (la sesión enruta las lecturas a réplicas)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 
-def init_db(app):
+# Constructores de INSERT con soporte de ON CONFLICT por dialecto
+UPSERT_DIALECTS = {
+    'postgresql': postgresql_insert,
+    'sqlite': sqlite_insert,
+}
+
+def get_database_url():
     """
-    Inicializa la configuración de la base de datos con la aplicación Flask.
+    Obtiene la URL de la base de datos a partir de las variables de entorno.
     
-    Args:
-        app: Instancia de la aplicación Flask
+    Returns:
+        str: DATABASE_URL si está definida o la URL de PostgreSQL construida con las variables PG*
     """
     # Verificar si hay una URL de base de datos personalizada
     database_url = os.getenv('DATABASE_URL')
     
     if database_url:
         # Usar URL personalizada (por ejemplo, SQLite para desarrollo)
-        app.config['SQLALCHEMY_DATABASE_URI'] = database_url
-    else:
-        # Configuración de PostgreSQL usando variables de entorno
-        postgres_user = os.getenv('PGUSER', 'postgres')
-        postgres_password = os.getenv('PGPASSWORD', '')
-        postgres_host = os.getenv('PGHOST', 'localhost')
-        postgres_port = os.getenv('PGPORT', '5432')
-        postgres_db = os.getenv('PGDATABASE', 'videojuegos_db')
-        
-        # URI de conexión PostgreSQL
-        app.config['SQLALCHEMY_DATABASE_URI'] = (
-            f'postgresql://{postgres_user}:{postgres_password}@'
-            f'{postgres_host}:{postgres_port}/{postgres_db}'
-        )
+        return database_url
+    
+    # Configuración de PostgreSQL usando variables de entorno
+    postgres_user = os.getenv('PGUSER', 'postgres')
+    postgres_password = os.getenv('PGPASSWORD', '')
+    postgres_host = os.getenv('PGHOST', 'localhost')
+    postgres_port = os.getenv('PGPORT', '5432')
+    postgres_db = os.getenv('PGDATABASE', 'videojuegos_db')
+    
+    # URI de conexión PostgreSQL
+    return (
+        f'postgresql://{postgres_user}:{postgres_password}@'
+        f'{postgres_host}:{postgres_port}/{postgres_db}'
+    )
+
+def init_db(app):
+    """
+    Inicializa la configuración de la base de datos con la aplicación Flask.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    app.config['SQLALCHEMY_DATABASE_URI'] = get_database_url()
     
     # Configuraciones adicionales de SQLAlchemy
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
-        'pool_pre_ping': True,
-        'pool_recycle': 300,
-    }
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = get_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    setup_pool_events()
+    
+    # Claves de la caché compartida propias de esta base de datos
+    response_cache.set_database(app.config['SQLALCHEMY_DATABASE_URI'])
+    
+    # Réplicas de solo lectura opcionales
+    replica_urls = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+    replica_router.configure(replica_urls, get_engine_options)
     
     # Inicializar extensiones
     db.init_app(app)
@@ -56,8 +81,28 @@ def init_db(app):
 def create_tables():
     """
     Crea todas las tablas definidas en los modelos.
+    
+    También crea el índice de búsqueda de texto completo. Si el resumen de
+    estadísticas está vacío pero ya existen videojuegos (por ejemplo, al
+    actualizar una base de datos existente), se reconstruye.
     """
+    from src.Config.Search import setup_search_index
+    from src.Services.EstadisticasService import EstadisticasService
+    
     db.create_all()
+    setup_search_index()
+    
+    if EstadisticasService.needs_rebuild():
+        EstadisticasService.rebuild()
+
+def get_upsert_insert():
+    """
+    Obtiene el constructor de INSERT ... ON CONFLICT del motor actual.
+    
+    Returns:
+        callable or None: Función insert del dialecto o None si no lo soporta
+    """
+    return UPSERT_DIALECTS.get(db.engine.dialect.name)
 
 def get_db():
     """
@@ -67,3 +112,23 @@ def get_db():
         SQLAlchemy: Instancia de la base de datos
     """
     return db
+
+def dispose_engines(app, close=True):
+    """
+    Descarta las conexiones de los pools de la principal y de las réplicas.
+    
+    Con preload_app de Gunicorn, el proceso maestro crea los engines (y
+    puede abrir conexiones al arrancar) antes de hacer fork. Cada worker
+    debe llamar a esta función con close=False nada más nacer: olvida las
+    conexiones heredadas sin cerrarlas, porque el socket es compartido con
+    el maestro y con el resto de workers, y abre las suyas propias.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+        close (bool): Cerrar las conexiones (False en el proceso hijo tras un fork)
+    """
+    with app.app_context():
+        engines = list(db.engines.values())
+    engines.extend(replica_router.engines)
+    for engine in engines:
+        engine.dispose(close=close)
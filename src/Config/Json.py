@@ -0,0 +1,211 @@
+"""
+Serialización JSON de la API.
+
+Usa orjson si está instalado y la librería estándar en caso contrario (o
+si se fuerza con JSON_PROVIDER=stdlib). Además de los proveedores de
+Flask, ofrece una ruta que serializa directamente las filas de un select()
+de Core para los listados grandes.
+"""
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from json.encoder import encode_basestring
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+# orjson se usa si está instalado salvo que se fuerce JSON_PROVIDER=stdlib
+USE_ORJSON = orjson is not None and os.getenv('JSON_PROVIDER', 'auto').lower() != 'stdlib'
+
+class RawJSON(str):
+    """
+    Texto JSON ya serializado que se inserta tal cual en la respuesta.
+    """
+
+def json_default(value):
+    """
+    Convierte los tipos que no son JSON nativos.
+    
+    Args:
+        value: Valor a convertir
+    
+    Returns:
+        Valor serializable (float para Decimal, ISO 8601 para fechas)
+    
+    Raises:
+        TypeError: Si el tipo no está soportado
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Tipo no serializable: {type(value).__name__}')
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """
+    Proveedor JSON de la librería estándar con salida compacta y los
+    mismos formatos que orjson (Decimal como número, fechas ISO 8601).
+    """
+    default = staticmethod(json_default)
+    ensure_ascii = False
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serializa un objeto a texto JSON compacto.
+        
+        Args:
+            obj: Objeto a serializar
+        
+        Returns:
+            str: Texto JSON
+        """
+        kwargs.setdefault('separators', (',', ':'))
+        return super().dumps(obj, **kwargs)
+
+class OrjsonJSONProvider(JSONProvider):
+    """
+    Proveedor JSON basado en orjson.
+    """
+    mimetype = 'application/json'
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serializa un objeto a texto JSON.
+        
+        Args:
+            obj: Objeto a serializar
+        
+        Returns:
+            str: Texto JSON
+        """
+        return orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserializa un texto JSON.
+        
+        Args:
+            s (str or bytes): Texto JSON
+        
+        Returns:
+            Objeto deserializado
+        """
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """
+        Crea una respuesta JSON sin pasar por un str intermedio.
+        
+        Returns:
+            Response: Respuesta de Flask
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+def get_json_provider_class():
+    """
+    Obtiene la clase del proveedor JSON según JSON_PROVIDER y las dependencias.
+    
+    Returns:
+        type: Clase del proveedor JSON
+    """
+    return OrjsonJSONProvider if USE_ORJSON else StdlibJSONProvider
+
+def init_json(app):
+    """
+    Registra el proveedor JSON en la aplicación.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    app.json = get_json_provider_class()(app)
+
+# Conversión a texto JSON de cada tipo de columna para la ruta sin orjson
+_VALUE_ENCODERS = {
+    int: str,
+    float: float.__repr__,
+    str: encode_basestring,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+    Decimal: lambda value: repr(float(value)),
+    datetime: lambda value: f'"{value.isoformat()}"',
+    date: lambda value: f'"{value.isoformat()}"',
+}
+
+def serialize_rows(rows, keys):
+    """
+    Serializa filas de un select() de Core como un array JSON de objetos.
+    
+    Las filas se recorren como tuplas, sin crear objetos ORM. Con orjson
+    se delega todo el array en una sola llamada a su serializador en C;
+    sin orjson cada fila se escribe directamente como texto.
+    
+    Args:
+        rows (iterable): Filas (tuplas) con los valores en el orden de keys
+        keys (tuple): Nombres de los campos
+    
+    Returns:
+        RawJSON: Array JSON serializado
+    """
+    if USE_ORJSON:
+        return RawJSON(orjson.dumps(
+            [dict(zip(keys, row)) for row in rows],
+            default=json_default
+        ).decode('utf-8'))
+    
+    return RawJSON('[' + ','.join(serialize_row_lines(rows, keys)) + ']')
+
+def serialize_row_lines(rows, keys):
+    """
+    Serializa cada fila de un select() de Core como un objeto JSON independiente.
+    
+    Args:
+        rows (iterable): Filas (tuplas) con los valores en el orden de keys
+        keys (tuple): Nombres de los campos
+    
+    Returns:
+        list: Texto JSON de cada fila
+    """
+    if USE_ORJSON:
+        return [orjson.dumps(dict(zip(keys, row)), default=json_default).decode('utf-8') for row in rows]
+    
+    prefixes = [f'{encode_basestring(key)}:' for key in keys]
+    encoders = _VALUE_ENCODERS
+    return [
+        '{' + ','.join([prefix + encoders[type(value)](value) for prefix, value in zip(prefixes, row)]) + '}'
+        for row in rows
+    ]
+
+def json_response(obj, status_code=200):
+    """
+    Crea una respuesta JSON insertando sin reserializar los valores RawJSON.
+    
+    Solo se buscan RawJSON en el primer nivel del diccionario; cada uno se
+    sustituye por un marcador, se serializa el resto y se reemplaza el
+    marcador por el texto ya serializado.
+    
+    Args:
+        obj (dict): Cuerpo de la respuesta
+        status_code (int): Código de estado HTTP
+    
+    Returns:
+        Response: Respuesta de Flask
+    """
+    fragments = {}
+    for key, value in obj.items():
+        if isinstance(value, RawJSON):
+            marker = f'@@raw:{key}@@'
+            fragments[json.dumps(marker)] = value
+            obj[key] = marker
+    
+    body = current_app.json.dumps(obj)
+    for marker, fragment in fragments.items():
+        body = body.replace(marker, fragment, 1)
+    
+    return current_app.response_class(body, status=status_code, mimetype='application/json')
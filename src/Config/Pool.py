@@ -0,0 +1,233 @@
+"""
+Configuración e instrumentación del pool de conexiones de SQLAlchemy.
+
+El tamaño del pool se configura por variables de entorno. Cada worker de
+Gunicorn tiene su propio pool, así que el máximo de conexiones abiertas
+contra PostgreSQL es workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW), que debe
+quedar por debajo de max_connections.
+
+Variables de entorno:
+    - DB_POOL_SIZE: Conexiones que se mantienen abiertas (por defecto 5)
+    - DB_MAX_OVERFLOW: Conexiones extra temporales (por defecto 10)
+    - DB_POOL_TIMEOUT: Segundos de espera por una conexión libre (por defecto 30)
+    - DB_POOL_RECYCLE: Segundos de vida de cada conexión (por defecto 300, -1 desactiva)
+    - DB_POOL_USE_LIFO: Reutilizar primero la última conexión devuelta (por defecto false)
+    - DB_POOL_PRE_PING: Comprobar la conexión en cada checkout (por defecto true)
+"""
+import logging
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+class PoolMetrics:
+    """
+    Contadores de uso de los pools de conexiones del proceso.
+    
+    Se alimentan de los eventos del pool (checkout, checkin, connect,
+    invalidate) y de InstrumentedQueuePool, que mide la espera hasta
+    obtener una conexión.
+    """
+    
+    def __init__(self):
+        """
+        Constructor de los contadores a cero.
+        """
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.disconnects = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+    
+    def increment(self, name):
+        """
+        Incrementa un contador.
+        
+        Args:
+            name (str): Nombre del contador
+        """
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def record_wait(self, seconds):
+        """
+        Registra el tiempo que se esperó para obtener una conexión.
+        
+        Args:
+            seconds (float): Segundos de espera
+        """
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+    
+    def stats(self):
+        """
+        Obtiene los contadores acumulados.
+        
+        Returns:
+            dict: Estadísticas de los pools del proceso
+        """
+        with self._lock:
+            return {
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'disconnects': self.disconnects,
+                'timeouts': self.timeouts,
+                'wait_ms_total': round(self.wait_total * 1000, 3),
+                'wait_ms_avg': round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0,
+                'wait_ms_max': round(self.wait_max * 1000, 3)
+            }
+
+# Contadores de los pools del proceso
+pool_metrics = PoolMetrics()
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que mide la espera hasta obtener una conexión.
+    
+    La espera incluye el tiempo bloqueado con el pool agotado y, si se
+    abre una conexión nueva, el tiempo de conexión.
+    """
+    
+    def _do_get(self):
+        """
+        Obtiene una conexión del pool registrando la espera.
+        
+        Returns:
+            ConnectionPoolEntry: Conexión del pool
+        """
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.increment('timeouts')
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start)
+
+def _env_bool(name, default):
+    """
+    Lee una variable de entorno booleana.
+    
+    Args:
+        name (str): Nombre de la variable
+        default (bool): Valor si no está definida
+    
+    Returns:
+        bool: Valor interpretado
+    """
+    return os.getenv(name, str(default)).strip().lower() in ('1', 'true', 'yes')
+
+def get_engine_options(database_url):
+    """
+    Construye SQLALCHEMY_ENGINE_OPTIONS a partir de las variables de entorno.
+    
+    SQLite no admite las opciones de tamaño del pool con todos sus tipos
+    de pool (por ejemplo, en memoria), así que solo recibe pre-ping y
+    reciclado.
+    
+    Args:
+        database_url (str): URL de la base de datos
+    
+    Returns:
+        dict: Opciones para create_engine
+    """
+    options = {
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', True),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 300)),
+    }
+    
+    if database_url.startswith('sqlite'):
+        return options
+    
+    options.update({
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),
+        'pool_use_lifo': _env_bool('DB_POOL_USE_LIFO', False),
+    })
+    return options
+
+_events_registered = False
+
+def setup_pool_events():
+    """
+    Registra los eventos de instrumentación en todos los pools. Es idempotente.
+    
+    Los eventos solo cuentan y registran en el log: la invalidación del
+    pool al detectar una desconexión la hace SQLAlchemy por su cuenta.
+    """
+    global _events_registered
+    if _events_registered:
+        return
+    _events_registered = True
+    
+    @event.listens_for(Pool, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        """Cuenta las conexiones nuevas a la base de datos."""
+        pool_metrics.increment('connects')
+    
+    @event.listens_for(Pool, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        """Cuenta las conexiones entregadas por el pool."""
+        pool_metrics.increment('checkouts')
+    
+    @event.listens_for(Pool, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        """Cuenta las conexiones devueltas al pool."""
+        pool_metrics.increment('checkins')
+    
+    @event.listens_for(Pool, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        """Cuenta las conexiones invalidadas."""
+        pool_metrics.increment('invalidations')
+    
+    @event.listens_for(Engine, 'handle_error')
+    def on_handle_error(context):
+        """Cuenta y registra las desconexiones detectadas al fallar una consulta."""
+        if context.is_disconnect:
+            pool_metrics.increment('disconnects')
+            logger.warning(f'Conexión a la base de datos perdida: {context.original_exception}')
+
+def get_pool_stats(engines):
+    """
+    Obtiene el estado de los pools y los contadores del proceso.
+    
+    Las opciones (pre-ping, max_overflow) se informan tal como se
+    configuraron en get_engine_options.
+    
+    Args:
+        engines (dict): Engines por nombre
+    
+    Returns:
+        dict: Estado de cada pool y contadores acumulados
+    """
+    pools = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        options = get_engine_options(engine.url.drivername)
+        status = {'clase': type(pool).__name__, 'pre_ping': options['pool_pre_ping']}
+        if isinstance(pool, QueuePool):
+            status.update({
+                'size': pool.size(),
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'max_overflow': options.get('max_overflow'),
+                'timeout': pool.timeout()
+            })
+        pools[name or 'default'] = status
+    
+    return {'pools': pools, **pool_metrics.stats()}
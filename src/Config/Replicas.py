@@ -0,0 +1,261 @@
+"""
+Enrutado de lecturas a réplicas de la base de datos.
+
+Si DATABASE_REPLICA_URLS contiene una o más URLs (separadas por comas),
+los métodos de servicio marcados con @read_only consultan las réplicas
+por turnos (round-robin). El resto de consultas, y todas las escrituras,
+van a la base de datos principal.
+
+- Si una réplica falla, la lectura se repite en la principal y la réplica
+  se descarta durante REPLICA_RETRY_SECONDS.
+- Tras una escritura, el cliente recibe una cookie que lo fija a la
+  principal durante REPLICA_PIN_SECONDS para que lea sus propios cambios.
+- Durante REPLICA_PIN_SECONDS después de que el proceso observe un cambio
+  de versión del catálogo, las lecturas también van a la principal para
+  no guardar en la caché compartida datos de una réplica con retraso.
+"""
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+from flask import g, has_app_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+from src.Config.Cache import response_cache
+
+logger = logging.getLogger(__name__)
+
+# Configuración del enrutado a réplicas
+REPLICA_PIN_SECONDS = float(os.getenv('REPLICA_PIN_SECONDS', 5))
+REPLICA_RETRY_SECONDS = float(os.getenv('REPLICA_RETRY_SECONDS', 30))
+PRIMARY_COOKIE = 'db_primary_until'
+
+# Métodos HTTP que escriben en la base de datos
+WRITE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+
+class ReplicaRouter:
+    """
+    Elige la réplica de cada lectura y lleva el estado de cada una.
+    """
+    
+    def __init__(self):
+        """
+        Constructor del enrutador sin réplicas.
+        """
+        self._lock = threading.Lock()
+        self.engines = []
+        self._cycle = None
+        self._down_until = {}
+        self.reads = {}
+        self.failures = {}
+        self.primary_reads = 0
+    
+    def configure(self, urls, engine_options):
+        """
+        Crea los engines de las réplicas (sin abrir conexiones).
+        
+        Args:
+            urls (list): URLs de las réplicas
+            engine_options (callable): Función que devuelve las opciones de create_engine para una URL
+        """
+        self.engines = [create_engine(url, **engine_options(url)) for url in urls]
+        self._cycle = itertools.cycle(range(len(self.engines)))
+        self._down_until = {}
+        self.reads = {index: 0 for index in range(len(self.engines))}
+        self.failures = {index: 0 for index in range(len(self.engines))}
+    
+    @property
+    def enabled(self):
+        """
+        Indica si hay réplicas configuradas.
+        
+        Returns:
+            bool: True si hay al menos una réplica
+        """
+        return bool(self.engines)
+    
+    def choose(self):
+        """
+        Elige la siguiente réplica disponible por turnos.
+        
+        Returns:
+            int or None: Índice de la réplica o None si no hay ninguna disponible
+        """
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = next(self._cycle)
+                if self._down_until.get(index, 0) <= now:
+                    self.reads[index] += 1
+                    return index
+            self.primary_reads += 1
+            return None
+    
+    def mark_failed(self, index, error):
+        """
+        Descarta temporalmente una réplica que ha fallado.
+        
+        Args:
+            index (int): Índice de la réplica
+            error (Exception): Error producido
+        """
+        with self._lock:
+            self.failures[index] += 1
+            self._down_until[index] = time.monotonic() + REPLICA_RETRY_SECONDS
+        logger.warning(f'Réplica {self.name(index)} no disponible, se usa la principal: {error}')
+    
+    def name(self, index):
+        """
+        Obtiene el nombre legible de una réplica (URL sin contraseña).
+        
+        Args:
+            index (int): Índice de la réplica
+        
+        Returns:
+            str: Nombre de la réplica
+        """
+        return self.engines[index].url.render_as_string(hide_password=True)
+    
+    def engines_by_name(self):
+        """
+        Obtiene los engines de las réplicas por nombre.
+        
+        Returns:
+            dict: Engines por nombre
+        """
+        return {f'replica:{self.name(index)}': engine for index, engine in enumerate(self.engines)}
+    
+    def stats(self):
+        """
+        Obtiene el estado y los contadores de las réplicas.
+        
+        Returns:
+            dict: Estadísticas de las réplicas
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'replicas': [
+                    {
+                        'url': self.name(index),
+                        'disponible': self._down_until.get(index, 0) <= now,
+                        'lecturas': self.reads[index],
+                        'fallos': self.failures[index]
+                    }
+                    for index in range(len(self.engines))
+                ],
+                'lecturas_principal': self.primary_reads,
+                'pin_segundos': REPLICA_PIN_SECONDS
+            }
+
+# Enrutador de réplicas del proceso
+replica_router = ReplicaRouter()
+
+class RoutingSession(Session):
+    """
+    Sesión que envía a la réplica elegida las consultas de los métodos
+    @read_only y el resto a la base de datos principal.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        """
+        Elige el engine de cada consulta.
+        
+        Returns:
+            Engine: Réplica de la lectura en curso o el engine por defecto
+        """
+        if bind is None and not self._flushing and has_app_context():
+            index = g.get('_replica_index')
+            if index is not None:
+                return replica_router.engines[index]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def _must_use_primary():
+    """
+    Indica si la petición actual debe leer de la base de datos principal.
+    
+    Returns:
+        bool: True si el cliente escribió hace poco, la petición escribe o
+            el catálogo acaba de cambiar
+    """
+    if g.get('_pin_primary'):
+        return True
+    
+    # Se lee la versión antes de decidir para detectar escrituras de otros workers
+    response_cache.get_version()
+    return time.monotonic() - response_cache.version_changed_at < REPLICA_PIN_SECONDS
+
+def read_only(func):
+    """
+    Decorador para métodos de servicio que solo leen.
+    
+    Las consultas del método se envían a una réplica. Si la réplica falla,
+    la sesión se revierte y el método se repite en la principal. Las
+    llamadas anidadas usan la réplica ya elegida.
+    
+    Args:
+        func (callable): Método de servicio
+    
+    Returns:
+        callable: Método decorado
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not replica_router.enabled or not has_app_context() or '_replica_index' in g or _must_use_primary():
+            return func(*args, **kwargs)
+        
+        from src.Config.Database import db
+        
+        index = replica_router.choose()
+        g._replica_index = index
+        try:
+            return func(*args, **kwargs)
+        except DBAPIError as e:
+            if index is None:
+                raise
+            db.session.rollback()
+            replica_router.mark_failed(index, e)
+            g._replica_index = None
+            return func(*args, **kwargs)
+        finally:
+            g.pop('_replica_index', None)
+    
+    return wrapper
+
+def setup_replica_routing(app):
+    """
+    Configura la lectura de los propios cambios (read-your-writes).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    if not replica_router.enabled:
+        return
+    
+    @app.before_request
+    def pin_recent_writers():
+        """Fija a la principal las escrituras y los clientes que escribieron hace poco."""
+        if request.method in WRITE_METHODS:
+            g._pin_primary = True
+            return
+        
+        try:
+            g._pin_primary = float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            g._pin_primary = False
+    
+    @app.after_request
+    def set_primary_cookie(response):
+        """Envía la cookie que fija al cliente a la principal tras una escritura."""
+        if request.method in WRITE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_COOKIE,
+                str(round(time.time() + REPLICA_PIN_SECONDS, 3)),
+                max_age=int(REPLICA_PIN_SECONDS) + 1,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
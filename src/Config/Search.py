@@ -0,0 +1,232 @@
+"""
+Configuración del índice de búsqueda de texto completo.
+
+- PostgreSQL: índice GIN sobre to_tsvector('simple', nombre || ' ' || categoria)
+- SQLite: tabla virtual FTS5 de contenido externo sincronizada con triggers
+
+Y del índice del filtro de categoría (subcadena sin distinguir mayúsculas):
+
+- PostgreSQL: índice GIN de trigramas (pg_trgm) sobre categoria, que usa ILIKE
+- SQLite: tabla virtual FTS5 con el tokenizador trigram, que resuelve LIKE
+"""
+import logging
+import re
+from sqlalchemy import text
+from src.Config.Database import db
+
+logger = logging.getLogger(__name__)
+
+# Expresión tsvector de PostgreSQL; debe coincidir con la del índice GIN
+POSTGRES_TSVECTOR = "to_tsvector('simple'::regconfig, videojuegos.nombre || ' ' || videojuegos.categoria)"
+
+POSTGRES_SEARCH_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_videojuegos_busqueda ON videojuegos "
+    "USING GIN (to_tsvector('simple'::regconfig, nombre || ' ' || categoria))",
+]
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS videojuegos_fts USING fts5("
+    "nombre, categoria, content='videojuegos', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_ai AFTER INSERT ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_fts(rowid, nombre, categoria) VALUES (new.id, new.nombre, new.categoria); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_ad AFTER DELETE ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_fts(videojuegos_fts, rowid, nombre, categoria) "
+    "VALUES ('delete', old.id, old.nombre, old.categoria); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_fts_au AFTER UPDATE ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_fts(videojuegos_fts, rowid, nombre, categoria) "
+    "VALUES ('delete', old.id, old.nombre, old.categoria); "
+    "INSERT INTO videojuegos_fts(rowid, nombre, categoria) VALUES (new.id, new.nombre, new.categoria); "
+    "END",
+]
+
+POSTGRES_CATEGORY_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_videojuegos_categoria_trgm ON videojuegos "
+    "USING GIN (categoria gin_trgm_ops)",
+]
+
+# El tokenizador trigram necesita SQLite 3.34 o posterior
+SQLITE_CATEGORY_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS videojuegos_categoria_fts USING fts5("
+    "categoria, content='videojuegos', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_ai AFTER INSERT ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_categoria_fts(rowid, categoria) VALUES (new.id, new.categoria); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_ad AFTER DELETE ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts, rowid, categoria) "
+    "VALUES ('delete', old.id, old.categoria); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS videojuegos_categoria_fts_au AFTER UPDATE OF categoria ON videojuegos BEGIN "
+    "INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts, rowid, categoria) "
+    "VALUES ('delete', old.id, old.categoria); "
+    "INSERT INTO videojuegos_categoria_fts(rowid, categoria) VALUES (new.id, new.categoria); "
+    "END",
+]
+
+# Comprueba en SQLite si existe la tabla FTS5
+SQLITE_SEARCH_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videojuegos_fts'"
+
+# Comprueba en SQLite si existe la tabla de trigramas de la categoría
+SQLITE_CATEGORY_EXISTS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videojuegos_categoria_fts'"
+
+# Tablas FTS5 de SQLite existentes (una consulta para ambos índices)
+SQLITE_INDEXES = (
+    "SELECT name FROM sqlite_master WHERE type = 'table' "
+    "AND name IN ('videojuegos_fts', 'videojuegos_categoria_fts')"
+)
+
+# Disponibilidad de los índices por URL de motor (se calcula una vez por proceso)
+_search_available = {}
+
+def setup_search_index():
+    """
+    Crea el índice de búsqueda si no existe. Es idempotente.
+    
+    En SQLite, si la tabla FTS5 se crea sobre datos existentes, se
+    reconstruye su contenido a partir de la tabla de videojuegos.
+    """
+    dialect = db.engine.dialect.name
+    _search_available.pop(str(db.engine.url), None)
+    
+    if dialect == 'postgresql':
+        with db.engine.begin() as connection:
+            for statement in POSTGRES_SEARCH_DDL:
+                connection.execute(text(statement))
+    
+    elif dialect == 'sqlite':
+        with db.engine.begin() as connection:
+            existed = connection.execute(text(SQLITE_SEARCH_EXISTS)).first() is not None
+            
+            for statement in SQLITE_SEARCH_DDL:
+                connection.execute(text(statement))
+            
+            if not existed:
+                connection.execute(text("INSERT INTO videojuegos_fts(videojuegos_fts) VALUES ('rebuild')"))
+    
+    setup_category_index()
+
+def setup_category_index():
+    """
+    Crea el índice de trigramas del filtro de categoría si no existe.
+    
+    Va en su propia transacción: si el motor no lo admite (SQLite anterior
+    a 3.34 o un usuario de PostgreSQL sin permiso para crear pg_trgm), el
+    filtro sigue funcionando con ILIKE sin índice.
+    """
+    dialect = db.engine.dialect.name
+    
+    try:
+        if dialect == 'postgresql':
+            with db.engine.begin() as connection:
+                for statement in POSTGRES_CATEGORY_DDL:
+                    connection.execute(text(statement))
+        
+        elif dialect == 'sqlite':
+            with db.engine.begin() as connection:
+                existed = connection.execute(text(SQLITE_CATEGORY_EXISTS)).first() is not None
+                
+                for statement in SQLITE_CATEGORY_DDL:
+                    connection.execute(text(statement))
+                
+                if not existed:
+                    connection.execute(text(
+                        "INSERT INTO videojuegos_categoria_fts(videojuegos_categoria_fts) VALUES ('rebuild')"
+                    ))
+    except Exception as e:
+        logger.warning('No se pudo crear el índice de trigramas de la categoría: %s', e)
+
+def _availability(dialect, names=()):
+    """
+    Construye los indicadores de disponibilidad de los índices.
+    
+    Args:
+        dialect (str): Nombre del motor
+        names (iterable): Tablas FTS5 existentes (solo SQLite)
+    
+    Returns:
+        dict: {'busqueda': bool, 'categoria': bool}
+    """
+    if dialect == 'sqlite':
+        names = set(names)
+        return {
+            'busqueda': 'videojuegos_fts' in names,
+            'categoria': 'videojuegos_categoria_fts' in names,
+        }
+    # En PostgreSQL el filtro de categoría usa ILIKE, con o sin índice
+    return {'busqueda': dialect == 'postgresql', 'categoria': False}
+
+def _get_availability():
+    """
+    Obtiene (y guarda para el proceso) la disponibilidad de los índices.
+    
+    Returns:
+        dict: {'busqueda': bool, 'categoria': bool}
+    """
+    key = str(db.engine.url)
+    if key not in _search_available:
+        dialect = db.engine.dialect.name
+        names = db.session.execute(text(SQLITE_INDEXES)).scalars() if dialect == 'sqlite' else ()
+        _search_available[key] = _availability(dialect, names)
+    return _search_available[key]
+
+def is_search_available():
+    """
+    Indica si el motor actual dispone del índice de texto completo.
+    
+    Returns:
+        bool: True si se puede usar la búsqueda por relevancia
+    """
+    return _get_availability()['busqueda']
+
+def is_category_fts_available():
+    """
+    Indica si el filtro de categoría puede usar la tabla de trigramas de SQLite.
+    
+    Returns:
+        bool: True si existe videojuegos_categoria_fts
+    """
+    return _get_availability()['categoria']
+
+async def is_search_available_async(session):
+    """
+    Versión asíncrona de is_search_available (comparte el resultado del proceso).
+    
+    También deja calculada la disponibilidad del índice de la categoría, de
+    modo que is_category_fts_available no consulta la sesión síncrona.
+    
+    Args:
+        session (AsyncSession): Sesión asíncrona de la petición
+    
+    Returns:
+        bool: True si se puede usar la búsqueda por relevancia
+    """
+    key = str(db.engine.url)
+    if key not in _search_available:
+        dialect = db.engine.dialect.name
+        names = (await session.execute(text(SQLITE_INDEXES))).scalars().all() if dialect == 'sqlite' else ()
+        _search_available[key] = _availability(dialect, names)
+    return _search_available[key]['busqueda']
+
+def build_match_expression(buscar):
+    """
+    Convierte el texto buscado en una consulta de prefijos para el motor actual.
+    
+    Cada palabra se busca como prefijo y todas deben aparecer, por lo que
+    "zel bre" encuentra "The Legend of Zelda: Breath of the Wild".
+    
+    Args:
+        buscar (str): Texto introducido por el usuario
+    
+    Returns:
+        str or None: Expresión MATCH (SQLite) o tsquery (PostgreSQL)
+    """
+    tokens = re.findall(r'\w+', buscar.lower())
+    if not tokens:
+        return None
+    
+    if db.engine.dialect.name == 'postgresql':
+        return ' & '.join(f'{token}:*' for token in tokens)
+    return ' '.join(f'"{token}"*' for token in tokens)
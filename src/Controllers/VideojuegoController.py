@@ -2,52 +2,367 @@
 Controlador para la gestión de videojuegos.
 Maneja las peticiones HTTP y coordina con el servicio.
 """
-from flask import request
-from src.Services.VideojuegoService import VideojuegoService
-from src.Utils import create_response, create_error_response, validate_pagination_params
+import os
+from flask import Response, request, stream_with_context
+from src.Config.AsyncDatabase import get_async_session
+from src.Config.Json import RawJSON
+from src.Services.AutocompleteService import AutocompleteService
+from src.Services.VideojuegoService import VideojuegoService, LIST_KEYS
+from src.Utils import (
+    create_response,
+    create_error_response,
+    validate_pagination_params,
+    validate_limit_param,
+    parse_bool_param,
+    parse_fields_param,
+    decode_cursor,
+    build_validator,
+    is_not_modified,
+    create_not_modified_response,
+    set_validator_headers
+)
+
+# Configuración de la exportación en streaming
+EXPORT_FORMATS = ('ndjson', 'json')
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Modos de búsqueda: subcadena (ILIKE) o texto completo por relevancia
+SEARCH_MODES = ('contiene', 'relevancia')
+
+# Agrupaciones admitidas por las estadísticas
+STATISTICS_GROUP_BY = (None, 'categoria')
+
+# Máximo de elementos aceptados por la carga masiva
+BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 10000))
+
+# Máximo de elementos del listado sin paginar; si hay más, la respuesta
+# incluye pagination.next_cursor para seguir con la paginación por cursor
+LIST_MAX_ITEMS = int(os.getenv('LIST_MAX_ITEMS', 1000))
 
 class VideojuegoController:
     """
     Controlador que maneja todas las peticiones HTTP relacionadas con videojuegos.
     """
     
+    @staticmethod
+    def _parse_fields():
+        """
+        Lee el parámetro fields (proyección de columnas) de la petición.
+        
+        Returns:
+            tuple: (campos o None, respuesta de error o None)
+        """
+        try:
+            return parse_fields_param(request.args.get('fields'), LIST_KEYS), None
+        except ValueError as e:
+            return None, create_error_response(
+                message="Parámetro fields inválido",
+                status_code=400,
+                errors=[str(e), f"Valores válidos: {', '.join(LIST_KEYS)}"]
+            )
+    
+    @staticmethod
+    def _parse_list_params():
+        """
+        Lee y valida los parámetros del listado.
+        
+        Returns:
+            tuple: (parámetros o None, respuesta de error o None)
+        """
+        categoria = request.args.get('categoria', '').strip()
+        buscar = request.args.get('buscar', '').strip()
+        limit = request.args.get('limit')
+        cursor = request.args.get('cursor', '').strip()
+        include_total = parse_bool_param(request.args.get('include_total'), default=True)
+        modo = request.args.get('modo', '').strip().lower() or 'contiene'
+        
+        if modo not in SEARCH_MODES:
+            return None, create_error_response(
+                message="Parámetro modo no soportado",
+                status_code=400,
+                errors=[f"Valores válidos: {', '.join(SEARCH_MODES)}"]
+            )
+        
+        try:
+            cursor_position = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return None, create_error_response(
+                message="Parámetro cursor inválido",
+                status_code=400,
+                errors=[str(e)]
+            )
+        
+        fields, error = VideojuegoController._parse_fields()
+        if error:
+            return None, error
+        
+        message = "Videojuegos obtenidos exitosamente"
+        if categoria:
+            message += f" (filtrado por categoría: {categoria})"
+        if buscar:
+            message += f" (búsqueda: {buscar})"
+        
+        return {
+            'categoria': categoria if categoria else None,
+            'buscar': buscar if buscar else None,
+            'limit': validate_limit_param(limit),
+            'cursor': cursor_position,
+            'paginated': limit is not None or bool(cursor),
+            'relevance': bool(buscar) and modo == 'relevancia',
+            'include_total': include_total,
+            'fields': fields,
+            'message': message
+        }, None
+    
+    @staticmethod
+    def _list_response(params, result, validator):
+        """
+        Construye la respuesta del listado a partir del resultado del servicio.
+        
+        El listado sin paginar solo incluye pagination si se alcanzó
+        LIST_MAX_ITEMS, para que el cliente sepa que faltan elementos y
+        pueda pedirlos con next_cursor.
+        
+        Args:
+            params (dict): Parámetros de _parse_list_params
+            result (dict): Resultado de search o get_page
+            validator (dict): Validador del catálogo
+            
+        Returns:
+            tuple: (response, status_code)
+        """
+        message = params['message']
+        pagination = None
+        if params['relevance'] or params['paginated'] or result['has_next']:
+            pagination = {
+                'limit': result['limit'],
+                'has_next': result['has_next'],
+                'next_cursor': result.get('next_cursor')
+            }
+        if not (params['relevance'] or params['paginated']) and result['has_next']:
+            message += f" (se muestran los primeros {result['limit']}; use pagination.next_cursor para obtener el resto)"
+        
+        return create_response(
+            success=True,
+            message=message,
+            data=RawJSON(result['videojuegos']),
+            count=result['total'],
+            pagination=pagination,
+            validator=validator
+        )
+    
     @staticmethod
     def get_all():
         """
         Obtiene todos los videojuegos con filtros opcionales.
         
+        Si se envía `limit` o `cursor` se usa la paginación por cursor;
+        en caso contrario se devuelve el listado completo hasta
+        LIST_MAX_ITEMS elementos (la primera página por cursor de ese
+        tamaño, con next_cursor si hay más). Con
+        `modo=relevancia`, `buscar` usa el índice de texto completo. Si el
+        cliente ya tiene la versión actual del catálogo se responde 304.
+        
+        Returns:
+            tuple: (response, status_code)
+        """
+        try:
+            params, error = VideojuegoController._parse_list_params()
+            if error:
+                return error
+            
+            validator = VideojuegoService.get_catalog_validator()
+            if is_not_modified(validator):
+                return create_not_modified_response(validator)
+            
+            if params['relevance']:
+                # Búsqueda de texto completo ordenada por relevancia
+                result = VideojuegoService.search(
+                    params['buscar'],
+                    categoria=params['categoria'],
+                    limit=params['limit'],
+                    include_total=params['include_total'],
+                    fields=params['fields']
+                )
+            elif params['paginated']:
+                # Paginación por cursor (keyset)
+                result = VideojuegoService.get_page(
+                    categoria=params['categoria'],
+                    buscar=params['buscar'],
+                    limit=params['limit'],
+                    cursor=params['cursor'],
+                    include_total=params['include_total'],
+                    fields=params['fields']
+                )
+            else:
+                # Obtener videojuegos sin paginación (hasta LIST_MAX_ITEMS)
+                result = VideojuegoService.get_page(
+                    categoria=params['categoria'],
+                    buscar=params['buscar'],
+                    limit=LIST_MAX_ITEMS,
+                    include_total=params['include_total'],
+                    fields=params['fields']
+                )
+            
+            return VideojuegoController._list_response(params, result, validator)
+            
+        except Exception as e:
+            return create_error_response(
+                message="Error al obtener los videojuegos",
+                status_code=500,
+                errors=[str(e)]
+            )
+    
+    @staticmethod
+    async def get_all_async():
+        """
+        Versión asíncrona de get_all para el modo ASGI.
+        
+        El listado, la paginación por cursor y la búsqueda por relevancia
+        se consultan con la AsyncSession de la petición.
+        
         Returns:
             tuple: (response, status_code)
         """
         try:
-            # Obtener parámetros de consulta
-            categoria = request.args.get('categoria', '').strip()
-            buscar = request.args.get('buscar', '').strip()
-            
-            # Obtener videojuegos sin paginación
-            result = VideojuegoService.get_all(
-                categoria=categoria if categoria else None,
-                buscar=buscar if buscar else None,
-                page=1,
-                per_page=1000  # Número alto para obtener todos
+            params, error = VideojuegoController._parse_list_params()
+            if error:
+                return error
+            
+            session = get_async_session()
+            validator = await VideojuegoService.get_catalog_validator_async(session)
+            if is_not_modified(validator):
+                return create_not_modified_response(validator)
+            
+            if params['relevance']:
+                result = await VideojuegoService.search_async(
+                    session,
+                    params['buscar'],
+                    categoria=params['categoria'],
+                    limit=params['limit'],
+                    include_total=params['include_total'],
+                    fields=params['fields']
+                )
+            else:
+                result = await VideojuegoService.get_page_async(
+                    session,
+                    categoria=params['categoria'],
+                    buscar=params['buscar'],
+                    limit=params['limit'] if params['paginated'] else LIST_MAX_ITEMS,
+                    cursor=params['cursor'],
+                    include_total=params['include_total'],
+                    fields=params['fields']
+                )
+            
+            return VideojuegoController._list_response(params, result, validator)
+            
+        except Exception as e:
+            return create_error_response(
+                message="Error al obtener los videojuegos",
+                status_code=500,
+                errors=[str(e)]
+            )
+    
+    @staticmethod
+    def export():
+        """
+        Exporta el catálogo completo como una respuesta en streaming.
+        
+        Soporta `format=ndjson` (por defecto, un objeto JSON por línea) y
+        `format=json` (un array JSON enviado por partes).
+        
+        Returns:
+            Response: Respuesta en streaming
+        """
+        categoria = request.args.get('categoria', '').strip()
+        buscar = request.args.get('buscar', '').strip()
+        export_format = request.args.get('format', 'ndjson').strip().lower()
+        
+        if export_format not in EXPORT_FORMATS:
+            return create_error_response(
+                message="Formato de exportación no soportado",
+                status_code=400,
+                errors=[f"Formatos válidos: {', '.join(EXPORT_FORMATS)}"]
             )
+        
+        validator = VideojuegoService.get_catalog_validator()
+        if is_not_modified(validator):
+            return create_not_modified_response(validator)
+        
+        rows = VideojuegoService.iter_export(
+            categoria=categoria if categoria else None,
+            buscar=buscar if buscar else None,
+            batch_size=EXPORT_BATCH_SIZE
+        )
+        
+        def generate():
+            """Agrupa las filas serializadas en bloques para reducir escrituras."""
+            is_json = export_format == 'json'
+            buffer = ['['] if is_json else []
+            buffer_size = 0
+            first = True
+            
+            for chunk in rows:
+                if is_json:
+                    chunk = chunk if first else ',' + chunk
+                else:
+                    chunk += '\n'
+                first = False
+                
+                buffer.append(chunk)
+                buffer_size += len(chunk)
+                if buffer_size >= EXPORT_CHUNK_SIZE:
+                    yield ''.join(buffer)
+                    buffer = []
+                    buffer_size = 0
+            
+            if is_json:
+                buffer.append(']')
+            if buffer:
+                yield ''.join(buffer)
+        
+        mimetype = 'application/json' if export_format == 'json' else 'application/x-ndjson'
+        response = Response(stream_with_context(generate()), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename=videojuegos.{export_format}'
+        response.headers['X-Accel-Buffering'] = 'no'
+        set_validator_headers(response, validator)
+        return response
+    
+    @staticmethod
+    def autocomplete():
+        """
+        Sugiere nombres de videojuegos para el texto escrito por el usuario.
+        
+        Se resuelve con el índice en memoria del proceso, sin consultar la
+        base de datos salvo que el catálogo haya cambiado. El ETag se
+        deriva de la versión del índice (no lleva Last-Modified), así que
+        tampoco la respuesta 304 hace ninguna consulta.
+        
+        Returns:
+            tuple: (response, status_code)
+        """
+        try:
+            prefix = request.args.get('q', '').strip()
+            limit = validate_limit_param(request.args.get('limit'), default=10, max_limit=50)
+            
+            validator = build_validator(None, 'autocompletado', AutocompleteService.get_version())
+            if is_not_modified(validator):
+                return create_not_modified_response(validator)
             
-            message = "Videojuegos obtenidos exitosamente"
-            if categoria:
-                message += f" (filtrado por categoría: {categoria})"
-            if buscar:
-                message += f" (búsqueda: {buscar})"
+            suggestions = AutocompleteService.suggest(prefix, limit) if prefix else []
             
             return create_response(
                 success=True,
-                message=message,
-                data=result['videojuegos'],
-                count=result['total']
+                message="Sugerencias obtenidas exitosamente",
+                data=suggestions,
+                count=len(suggestions),
+                validator=validator
             )
             
         except Exception as e:
             return create_error_response(
-                message="Error al obtener los videojuegos",
+                message="Error al obtener las sugerencias",
                 status_code=500,
                 errors=[str(e)]
             )
@@ -64,19 +379,38 @@ class VideojuegoController:
             tuple: (response, status_code)
         """
         try:
-            videojuego = VideojuegoService.get_by_id(videojuego_id)
+            fields, error = VideojuegoController._parse_fields()
+            if error:
+                return error
             
-            if not videojuego:
-                return create_error_response(
-                    message="Videojuego no encontrado",
-                    status_code=404
-                )
+            videojuego = VideojuegoService.get_dto_by_id(videojuego_id, fields)
+            return VideojuegoController._detail_response(videojuego, fields)
             
-            return create_response(
-                success=True,
-                message="Videojuego obtenido exitosamente",
-                data=videojuego.to_dict()
+        except Exception as e:
+            return create_error_response(
+                message="Error al obtener el videojuego",
+                status_code=500,
+                errors=[str(e)]
             )
+    
+    @staticmethod
+    async def get_by_id_async(videojuego_id):
+        """
+        Versión asíncrona de get_by_id para el modo ASGI.
+        
+        Args:
+            videojuego_id (int): ID del videojuego
+            
+        Returns:
+            tuple: (response, status_code)
+        """
+        try:
+            fields, error = VideojuegoController._parse_fields()
+            if error:
+                return error
+            
+            videojuego = await VideojuegoService.get_dto_by_id_async(get_async_session(), videojuego_id, fields)
+            return VideojuegoController._detail_response(videojuego, fields)
             
         except Exception as e:
             return create_error_response(
@@ -85,6 +419,42 @@ class VideojuegoController:
                 errors=[str(e)]
             )
     
+    @staticmethod
+    def _detail_response(videojuego, fields):
+        """
+        Construye la respuesta del detalle de un videojuego.
+        
+        Args:
+            videojuego (VideojuegoDTO): Videojuego leído o None si no existe
+            fields (tuple): Campos pedidos (None para todos)
+            
+        Returns:
+            tuple: (response, status_code)
+        """
+        if videojuego is None:
+            return create_error_response(
+                message="Videojuego no encontrado",
+                status_code=404
+            )
+        
+        # Validador de la fila: la respuesta 304 evita serializar el videojuego
+        validator = build_validator(
+            videojuego.fecha_actualizacion,
+            'videojuego',
+            videojuego.id,
+            videojuego.fecha_actualizacion,
+            ','.join(fields or ())
+        )
+        if is_not_modified(validator):
+            return create_not_modified_response(validator)
+        
+        return create_response(
+            success=True,
+            message="Videojuego obtenido exitosamente",
+            data=videojuego.to_dict(fields),
+            validator=validator
+        )
+    
     @staticmethod
     def create():
         """
@@ -127,6 +497,69 @@ class VideojuegoController:
                 errors=[str(e)]
             )
     
+    @staticmethod
+    def bulk_upsert():
+        """
+        Crea o actualiza varios videojuegos en una sola petición.
+        
+        Acepta una lista de videojuegos o un objeto {"videojuegos": [...]}.
+        
+        Returns:
+            tuple: (response, status_code)
+        """
+        try:
+            data = request.get_json()
+            items = data.get('videojuegos') if isinstance(data, dict) else data
+            
+            if not isinstance(items, list) or not items:
+                return create_error_response(
+                    message="Se debe proporcionar una lista de videojuegos",
+                    status_code=400
+                )
+            
+            if len(items) > BULK_MAX_ITEMS:
+                return create_error_response(
+                    message="Demasiados elementos en la carga masiva",
+                    status_code=413,
+                    errors=[f"El máximo permitido es {BULK_MAX_ITEMS} videojuegos por petición"]
+                )
+            
+            results, errors = VideojuegoService.bulk_upsert(items)
+            
+            if errors:
+                return create_error_response(
+                    message="Error en la carga masiva de videojuegos",
+                    status_code=500,
+                    errors=errors
+                )
+            
+            summary = {'created': 0, 'updated': 0, 'skipped': 0, 'error': 0}
+            for result in results:
+                summary[result['status']] += 1
+            
+            if summary['created'] + summary['updated'] == 0:
+                return create_response(
+                    success=False,
+                    message="Ningún videojuego superó la validación",
+                    data={'resumen': summary, 'resultados': results},
+                    count=len(results),
+                    status_code=400
+                )
+            
+            return create_response(
+                success=True,
+                message="Carga masiva procesada exitosamente",
+                data={'resumen': summary, 'resultados': results},
+                count=len(results)
+            )
+            
+        except Exception as e:
+            return create_error_response(
+                message="Error en la carga masiva de videojuegos",
+                status_code=500,
+                errors=[str(e)]
+            )
+    
     @staticmethod
     def update(videojuego_id):
         """
@@ -215,13 +648,18 @@ class VideojuegoController:
             tuple: (response, status_code)
         """
         try:
+            validator = VideojuegoService.get_catalog_validator()
+            if is_not_modified(validator):
+                return create_not_modified_response(validator)
+            
             categories = VideojuegoService.get_categories()
             
             return create_response(
                 success=True,
                 message="Categorías obtenidas exitosamente",
                 data=categories,
-                count=len(categories)
+                count=len(categories),
+                validator=validator
             )
             
         except Exception as e:
@@ -236,16 +674,34 @@ class VideojuegoController:
         """
         Obtiene estadísticas de los videojuegos.
         
+        Admite `group_by=categoria` para el desglose por categoría y
+        `percentiles=true` para incluir percentiles del precio.
+        
         Returns:
             tuple: (response, status_code)
         """
         try:
-            stats = VideojuegoService.get_statistics()
+            group_by = request.args.get('group_by', '').strip().lower() or None
+            percentiles = parse_bool_param(request.args.get('percentiles'))
+            
+            if group_by not in STATISTICS_GROUP_BY:
+                return create_error_response(
+                    message="Parámetro group_by no soportado",
+                    status_code=400,
+                    errors=["Valores válidos: categoria"]
+                )
+            
+            validator = VideojuegoService.get_catalog_validator()
+            if is_not_modified(validator):
+                return create_not_modified_response(validator)
+            
+            stats = VideojuegoService.get_statistics(group_by=group_by, percentiles=percentiles)
             
             return create_response(
                 success=True,
                 message="Estadísticas obtenidas exitosamente",
-                data=stats
+                data=stats,
+                validator=validator
             )
             
         except Exception as e:
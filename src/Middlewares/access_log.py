@@ -0,0 +1,201 @@
+"""
+Log de acceso estructurado y escritura de logs en segundo plano.
+
+Los registros de log no se escriben en el hilo de la petición: un
+QueueHandler los deja en una cola y un QueueListener los escribe en
+stdout desde un hilo propio. Si la cola se llena, los registros se
+descartan en lugar de bloquear al worker.
+
+Cada petición genera como mucho un registro de acceso en JSON con método,
+ruta, código de estado, bytes, duración y consultas SQL. Las respuestas
+correctas (códigos < 400) se muestrean con ACCESS_LOG_SAMPLE_RATE; los
+errores y las peticiones lentas (ACCESS_LOG_SLOW_MS) se registran siempre.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from flask import g, request
+from src.Middlewares.profiler import get_request_profile
+
+# Configuración del log de acceso
+ACCESS_LOG_ENABLED = os.getenv('ACCESS_LOG_ENABLED', 'true').lower() == 'true'
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv('ACCESS_LOG_SAMPLE_RATE', 0.1))
+ACCESS_LOG_SLOW_MS = float(os.getenv('ACCESS_LOG_SLOW_MS', 1000))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+# Formato de los registros que no son de acceso
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+
+access_logger = logging.getLogger('videojuegos.access')
+
+class AccessLogFormatter(logging.Formatter):
+    """
+    Formatea en JSON los registros de acceso y en texto el resto.
+    """
+    
+    def format(self, record):
+        """
+        Formatea un registro.
+        
+        Args:
+            record (LogRecord): Registro de log
+        
+        Returns:
+            str: Línea JSON para los registros de acceso o texto con TEXT_FORMAT
+        """
+        access = getattr(record, 'access', None)
+        if access is None:
+            return super().format(record)
+        return json.dumps(
+            {'time': self.formatTime(record), 'level': record.levelname, 'logger': record.name, **access},
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler que descarta los registros si la cola está llena.
+    """
+    
+    def __init__(self, log_queue):
+        """
+        Constructor del handler.
+        
+        Args:
+            log_queue (Queue): Cola compartida con el QueueListener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        """
+        Añade el registro a la cola sin bloquear.
+        
+        Args:
+            record (LogRecord): Registro preparado
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_queue_handler = None
+_listener = None
+
+def _start_listener():
+    """
+    Arranca el hilo que escribe en stdout los registros de la cola.
+    """
+    global _listener
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(AccessLogFormatter(TEXT_FORMAT))
+    _listener = QueueListener(_queue_handler.queue, output, respect_handler_level=True)
+    _listener.start()
+
+def _restart_after_fork():
+    """
+    Crea una cola y un hilo nuevos en el proceso hijo (workers de Gunicorn).
+    
+    Los hilos no sobreviven a fork() y los bloqueos de la cola del padre
+    pueden haber quedado tomados, así que no se reutilizan.
+    """
+    if _queue_handler is None:
+        return
+    _queue_handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+    _queue_handler.dropped = 0
+    _start_listener()
+
+def stop_queue_logging():
+    """
+    Escribe los registros pendientes y detiene el hilo de logging.
+    """
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+def get_queue_handler():
+    """
+    Obtiene el handler de la cola de logging (lo crea y arranca si no existe).
+    
+    Returns:
+        DroppingQueueHandler: Handler compartido por todos los loggers
+    """
+    global _queue_handler
+    if _queue_handler is None:
+        _queue_handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        _start_listener()
+        atexit.register(stop_queue_logging)
+        os.register_at_fork(after_in_child=_restart_after_fork)
+    return _queue_handler
+
+def _sample_rate(status_code, duration_ms):
+    """
+    Obtiene la proporción de peticiones como esta que se registran.
+    
+    Args:
+        status_code (int): Código de estado de la respuesta
+        duration_ms (float): Duración de la petición en milisegundos
+    
+    Returns:
+        float: 1 para errores y peticiones lentas, ACCESS_LOG_SAMPLE_RATE para el resto
+    """
+    if status_code >= 400 or duration_ms >= ACCESS_LOG_SLOW_MS:
+        return 1.0
+    return ACCESS_LOG_SAMPLE_RATE
+
+def setup_access_log(app):
+    """
+    Registra el log de acceso estructurado.
+    
+    Debe llamarse antes que setup_compression para registrar el tamaño de
+    la respuesta comprimida (los after_request se ejecutan en orden inverso).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    if not ACCESS_LOG_ENABLED:
+        return
+    
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+    handler = get_queue_handler()
+    if handler not in access_logger.handlers:
+        access_logger.addHandler(handler)
+    
+    @app.before_request
+    def start_access_log():
+        """Marca el inicio de la petición."""
+        g._access_start = time.perf_counter()
+    
+    @app.after_request
+    def write_access_log(response):
+        """Registra la petición en el log de acceso (según el muestreo)."""
+        start = g.get('_access_start')
+        if start is None:
+            return response
+        
+        duration_ms = (time.perf_counter() - start) * 1000
+        sample_rate = _sample_rate(response.status_code, duration_ms)
+        if sample_rate < 1 and random.random() >= sample_rate:
+            return response
+        
+        profile = get_request_profile()
+        access_logger.info('access', extra={'access': {
+            'method': request.method,
+            'path': request.path,
+            'route': request.url_rule.rule if request.url_rule is not None else None,
+            'status': response.status_code,
+            # En streaming el tamaño no se conoce hasta enviar el cuerpo
+            'bytes': None if response.is_streamed else response.calculate_content_length(),
+            'duration_ms': round(duration_ms, 3),
+            'db_queries': profile.queries,
+            'db_ms': round(profile.seconds * 1000, 3),
+            'ip': request.remote_addr,
+            'sample_rate': sample_rate
+        }})
+        return response
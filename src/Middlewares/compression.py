@@ -0,0 +1,181 @@
+"""
+Middleware de compresión de respuestas (gzip y, si está instalado, brotli).
+
+- Respeta Accept-Encoding y añade Vary: Accept-Encoding
+- No comprime cuerpos por debajo de COMPRESSION_MIN_SIZE
+- Comprime las respuestas en streaming bloque a bloque
+- Guarda los bytes comprimidos de las respuestas con ETag para no
+  recomprimir el mismo contenido en cada petición
+"""
+import os
+import zlib
+from functools import partial
+from flask import request
+from werkzeug.wsgi import ClosingIterator
+from src.Config.Cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+# Configuración de la compresión
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 5))
+COMPRESSION_CACHE_MAX_BYTES = int(os.getenv('COMPRESSION_CACHE_MAX_BYTES', 1024 * 1024))
+
+# Tipos de contenido que merece la pena comprimir
+COMPRESSIBLE_MIMETYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'text/html',
+    'text/css',
+    'text/plain',
+)
+
+# Codificaciones soportadas por orden de preferencia
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Bytes comprimidos por (ruta, ETag, codificación)
+compressed_cache = LRUCache(
+    max_entries=int(os.getenv('COMPRESSION_CACHE_MAX_ENTRIES', 256)),
+    ttl=float(os.getenv('CACHE_SHARED_TTL', 300))
+)
+
+def choose_encoding():
+    """
+    Elige la codificación según el Accept-Encoding de la petición.
+    
+    Returns:
+        str or None: 'br', 'gzip' o None si el cliente no admite ninguna
+    """
+    accepted = request.accept_encodings
+    candidates = [(accepted.quality(encoding), encoding) for encoding in ENCODINGS]
+    quality, encoding = max(candidates, key=lambda candidate: candidate[0])
+    return encoding if quality > 0 else None
+
+def compress(data, encoding):
+    """
+    Comprime un cuerpo completo.
+    
+    Args:
+        data (bytes): Cuerpo sin comprimir
+        encoding (str): 'br' o 'gzip'
+    
+    Returns:
+        bytes: Cuerpo comprimido
+    """
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return zlib.compress(data, GZIP_LEVEL, wbits=31)
+
+def compress_stream(chunks, encoding, charset='utf-8'):
+    """
+    Comprime una respuesta en streaming sin acumularla en memoria.
+    
+    Cada bloque se vacía del compresor al enviarlo para que el cliente
+    reciba los datos a medida que se generan.
+    
+    Args:
+        chunks (iterable): Bloques del cuerpo (str o bytes)
+        encoding (str): 'br' o 'gzip'
+        charset (str): Codificación de los bloques de texto
+    
+    Yields:
+        bytes: Bloques comprimidos
+    """
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        process, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        process = compressor.compress
+        flush = partial(compressor.flush, zlib.Z_SYNC_FLUSH)
+        finish = compressor.flush
+    
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode(charset)
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    
+    yield finish()
+
+def add_vary(response):
+    """
+    Añade Accept-Encoding a la cabecera Vary sin duplicarlo.
+    
+    Args:
+        response: Respuesta de Flask
+    """
+    if 'accept-encoding' not in (value.lower() for value in response.vary):
+        response.vary.add('Accept-Encoding')
+
+def setup_compression(app):
+    """
+    Configura la compresión de respuestas para la aplicación.
+    
+    Se desactiva con COMPRESSION_ENABLED=false (por ejemplo, si un proxy
+    ya comprime las respuestas).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    if os.getenv('COMPRESSION_ENABLED', 'true').lower() != 'true':
+        return
+    
+    @app.after_request
+    def compress_response(response):
+        """Comprime la respuesta si el cliente lo admite y merece la pena."""
+        if response.status_code == 304 and response.get_etag()[0]:
+            add_vary(response)
+            return response
+        
+        if (
+            response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or response.status_code < 200
+            or response.status_code == 204
+            or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+        ):
+            return response
+        
+        add_vary(response)
+        encoding = choose_encoding()
+        if encoding is None:
+            return response
+        
+        etag, weak = response.get_etag()
+        
+        if response.is_streamed:
+            original = response.response
+            response.response = ClosingIterator(
+                compress_stream(original, encoding),
+                getattr(original, 'close', None)
+            )
+            response.headers.pop('Content-Length', None)
+        else:
+            if response.content_length is not None and response.content_length < COMPRESSION_MIN_SIZE:
+                return response
+            
+            # Solo las respuestas con ETag fuerte tienen un cuerpo estable que se pueda reutilizar
+            cache_key = (request.full_path, etag, encoding) if etag and not weak else None
+            data = compressed_cache.get(cache_key) if cache_key else None
+            if data is None:
+                body = response.get_data()
+                if len(body) < COMPRESSION_MIN_SIZE:
+                    return response
+                data = compress(body, encoding)
+                if cache_key and len(data) <= COMPRESSION_CACHE_MAX_BYTES:
+                    compressed_cache.set(cache_key, data)
+            response.set_data(data)
+        
+        response.headers['Content-Encoding'] = encoding
+        if etag:
+            # Cada codificación es una representación distinta con su propio ETag
+            response.set_etag(f'{etag}-{encoding}', weak=weak)
+        
+        return response
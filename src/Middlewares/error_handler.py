@@ -4,6 +4,7 @@ Middleware para el manejo de errores de la aplicación.
 from flask import jsonify, request
 from werkzeug.exceptions import HTTPException
 from src.Utils import create_error_response
+from src.Middlewares.access_log import get_queue_handler
 import logging
 
 def register_error_handlers(app):
@@ -93,40 +94,24 @@ def setup_logging(app):
     """
     Configura el sistema de logging para la aplicación.
     
+    Los registros se escriben en stdout desde un hilo en segundo plano
+    (ver access_log.get_queue_handler) para no bloquear a los workers.
+    
     Args:
         app: Instancia de la aplicación Flask
     """
     if not app.debug:
         # Configurar logging para producción
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s %(levelname)s %(name)s %(message)s'
-        )
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        handler = get_queue_handler()
+        if handler not in root_logger.handlers:
+            root_logger.addHandler(handler)
         
         # Configurar logger de la aplicación
         app.logger.setLevel(logging.INFO)
         app.logger.info('API de Videojuegos iniciada')
 
-# Middleware para logging de requests
-def log_request_info(app):
-    """
-    Configura logging de información de requests.
-    
-    Args:
-        app: Instancia de la aplicación Flask
-    """
-    
-    @app.before_request
-    def log_request():
-        """Log información básica de cada request."""
-        app.logger.info(f'{request.method} {request.path} - IP: {request.remote_addr}')
-    
-    @app.after_request
-    def log_response(response):
-        """Log información básica de cada response."""
-        app.logger.info(f'Response: {response.status_code}')
-        return response
-
 # Middleware para CORS básico
 def setup_cors(app):
     """
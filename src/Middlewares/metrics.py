@@ -0,0 +1,498 @@
+"""
+Métricas HTTP en formato de texto de Prometheus.
+
+Por cada ruta (plantilla de Flask, por ejemplo /api/videojuegos/<int:videojuego_id>)
+se registran:
+
+- Número de peticiones por método, ruta, blueprint y código de estado
+- Histograma de latencia y de tamaño de la respuesta
+- Histograma de consultas SQL y de tiempo en base de datos por petición
+- Peticiones en curso
+
+Con varios workers de Gunicorn, si METRICS_MULTIPROC_DIR apunta a un
+directorio compartido, cada proceso vuelca sus métricas en un fichero
+propio (metrics_<pid>.json) y /metrics suma los de todos los procesos.
+Los contadores e histogramas de los workers terminados se suman a un
+único fichero acumulado (metrics_archivo.json) y su fichero se borra, de
+modo que el directorio no crece al reciclar workers; las peticiones en
+curso solo se suman para los procesos vivos.
+"""
+import atexit
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from flask import g, request
+from werkzeug.wsgi import ClosingIterator
+from src.Middlewares.profiler import get_request_profile, setup_query_events
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows (sin workers de Gunicorn)
+    fcntl = None
+
+# Configuración de las métricas
+METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR') or os.getenv('PROMETHEUS_MULTIPROC_DIR')
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 1))
+METRICS_PREFIX = 'videojuegos'
+
+# Fichero con las métricas acumuladas de los procesos terminados
+ARCHIVE_FILENAME = 'metrics_archivo.json'
+
+# Límites superiores de los buckets de cada histograma
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1000, 10000, 100000, 1000000, 10000000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Descripción y tipo de cada métrica
+METRICS = {
+    'http_requests_total': ('counter', 'Peticiones HTTP atendidas'),
+    'http_request_duration_seconds': ('histogram', 'Latencia de las peticiones HTTP'),
+    'http_response_size_bytes': ('histogram', 'Tamaño del cuerpo de las respuestas HTTP'),
+    'http_request_db_queries': ('histogram', 'Consultas SQL ejecutadas por petición'),
+    'http_request_db_seconds': ('histogram', 'Tiempo en base de datos por petición'),
+    'http_requests_in_flight': ('gauge', 'Peticiones HTTP en curso'),
+}
+
+BUCKETS = {
+    'http_request_duration_seconds': LATENCY_BUCKETS,
+    'http_response_size_bytes': SIZE_BUCKETS,
+    'http_request_db_queries': QUERY_BUCKETS,
+    'http_request_db_seconds': LATENCY_BUCKETS,
+}
+
+class MetricsRegistry:
+    """
+    Almacén de las métricas del proceso.
+    
+    Los valores se guardan por (nombre, etiquetas). Cada histograma es una
+    lista con los contadores de cada bucket (no acumulados), la suma y el
+    número de observaciones.
+    """
+    
+    def __init__(self):
+        """
+        Constructor del almacén vacío.
+        """
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self._last_flush = 0.0
+    
+    def inc(self, name, labels, value=1):
+        """
+        Incrementa un contador.
+        
+        Args:
+            name (str): Nombre de la métrica
+            labels (tuple): Pares (etiqueta, valor)
+            value (float): Incremento
+        """
+        with self._lock:
+            key = (name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def add_gauge(self, name, labels, value):
+        """
+        Suma un valor (positivo o negativo) a un gauge.
+        
+        Args:
+            name (str): Nombre de la métrica
+            labels (tuple): Pares (etiqueta, valor)
+            value (float): Valor a sumar
+        """
+        with self._lock:
+            key = (name, labels)
+            self.gauges[key] = self.gauges.get(key, 0) + value
+    
+    def observe(self, name, labels, value):
+        """
+        Registra una observación en un histograma.
+        
+        Args:
+            name (str): Nombre de la métrica
+            labels (tuple): Pares (etiqueta, valor)
+            value (float): Valor observado
+        """
+        buckets = BUCKETS[name]
+        with self._lock:
+            key = (name, labels)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(buckets) + 3)
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[index] += 1
+                    break
+            else:
+                histogram[len(buckets)] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+    
+    def snapshot(self):
+        """
+        Obtiene una copia serializable de las métricas.
+        
+        Returns:
+            dict: Contadores, gauges e histogramas como listas de [nombre, etiquetas, valor]
+        """
+        with self._lock:
+            return {
+                'counters': [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                'gauges': [[name, list(labels), value] for (name, labels), value in self.gauges.items()],
+                'histograms': [[name, list(labels), list(value)] for (name, labels), value in self.histograms.items()],
+            }
+    
+    def flush(self, force=False):
+        """
+        Vuelca las métricas del proceso a su fichero del directorio compartido.
+        
+        Se escribe como mucho una vez cada METRICS_FLUSH_SECONDS salvo que
+        se fuerce. La escritura es atómica (fichero temporal y rename).
+        
+        Args:
+            force (bool): Escribir aunque no haya pasado el intervalo
+        """
+        if not METRICS_MULTIPROC_DIR:
+            return
+        
+        now = time.monotonic()
+        if not force and now - self._last_flush < METRICS_FLUSH_SECONDS:
+            return
+        self._last_flush = now
+        
+        data = self.snapshot()
+        path = os.path.join(METRICS_MULTIPROC_DIR, f'metrics_{os.getpid()}.json')
+        fd, temp_path = tempfile.mkstemp(dir=METRICS_MULTIPROC_DIR, prefix='.metrics_')
+        with os.fdopen(fd, 'w') as temp_file:
+            json.dump(data, temp_file)
+        os.replace(temp_path, path)
+
+# Métricas del proceso
+metrics_registry = MetricsRegistry()
+
+def _is_alive(pid):
+    """
+    Comprueba si un proceso sigue vivo.
+    
+    Args:
+        pid (int): ID del proceso
+    
+    Returns:
+        bool: True si el proceso existe
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _pid_from_filename(filename):
+    """
+    Obtiene el PID de un fichero de métricas de proceso.
+    
+    Args:
+        filename (str): Nombre del fichero
+    
+    Returns:
+        int or None: PID o None si no es un fichero metrics_<pid>.json
+    """
+    if not (filename.startswith('metrics_') and filename.endswith('.json')):
+        return None
+    try:
+        return int(filename[len('metrics_'):-len('.json')])
+    except ValueError:
+        return None
+
+def _read_snapshot(path):
+    """
+    Lee un fichero de métricas.
+    
+    Args:
+        path (str): Ruta del fichero
+    
+    Returns:
+        dict or None: Snapshot o None si no existe o no se puede leer
+    """
+    try:
+        with open(path) as metrics_file:
+            return json.load(metrics_file)
+    except (OSError, ValueError):
+        return None
+
+@contextlib.contextmanager
+def _directory_lock():
+    """
+    Bloqueo exclusivo del directorio de métricas entre procesos.
+    
+    Evita que dos procesos archiven a la vez el mismo fichero o que una
+    lectura vea unas métricas a medio mover al fichero acumulado.
+    """
+    if fcntl is None:
+        yield
+        return
+    
+    with open(os.path.join(METRICS_MULTIPROC_DIR, '.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def _archive_locked(pids=None):
+    """
+    Suma al fichero acumulado las métricas de procesos terminados (con el bloqueo tomado).
+    
+    Args:
+        pids (set): PIDs terminados (None para todos los que ya no existen)
+    
+    Returns:
+        int: Ficheros archivados
+    """
+    dead = []
+    for filename in os.listdir(METRICS_MULTIPROC_DIR):
+        pid = _pid_from_filename(filename)
+        if pid is None or pid == os.getpid():
+            continue
+        if (pid in pids) if pids is not None else not _is_alive(pid):
+            dead.append(os.path.join(METRICS_MULTIPROC_DIR, filename))
+    if not dead:
+        return 0
+    
+    archive_path = os.path.join(METRICS_MULTIPROC_DIR, ARCHIVE_FILENAME)
+    snapshots = [_read_snapshot(path) for path in [archive_path] + dead]
+    counters, _, histograms = _merge_snapshots((snapshot, False) for snapshot in snapshots if snapshot)
+    
+    data = {
+        'counters': [[name, list(labels), value] for (name, labels), value in counters.items()],
+        'gauges': [],
+        'histograms': [[name, list(labels), value] for (name, labels), value in histograms.items()],
+    }
+    fd, temp_path = tempfile.mkstemp(dir=METRICS_MULTIPROC_DIR, prefix='.metrics_')
+    with os.fdopen(fd, 'w') as temp_file:
+        json.dump(data, temp_file)
+    os.replace(temp_path, archive_path)
+    
+    for path in dead:
+        os.remove(path)
+    return len(dead)
+
+def archive_process_metrics(pids=None):
+    """
+    Archiva las métricas de procesos terminados y borra sus ficheros.
+    
+    Lo llama el maestro de Gunicorn al terminar cada worker (child_exit) y
+    /metrics antes de leer el directorio, para los que terminaron sin aviso.
+    
+    Args:
+        pids (iterable): PIDs terminados (por defecto, todos los que ya no existen)
+    
+    Returns:
+        int: Ficheros archivados
+    """
+    if not METRICS_MULTIPROC_DIR:
+        return 0
+    with _directory_lock():
+        return _archive_locked(set(pids) if pids is not None else None)
+
+def _collect_snapshots():
+    """
+    Obtiene las métricas de todos los procesos.
+    
+    Returns:
+        list: Pares (snapshot, proceso vivo)
+    """
+    if not METRICS_MULTIPROC_DIR:
+        return [(metrics_registry.snapshot(), True)]
+    
+    metrics_registry.flush(force=True)
+    snapshots = []
+    with _directory_lock():
+        _archive_locked()
+        for filename in os.listdir(METRICS_MULTIPROC_DIR):
+            pid = _pid_from_filename(filename)
+            if pid is None and filename != ARCHIVE_FILENAME:
+                continue
+            snapshot = _read_snapshot(os.path.join(METRICS_MULTIPROC_DIR, filename))
+            if snapshot is not None:
+                snapshots.append((snapshot, pid is not None and _is_alive(pid)))
+    return snapshots
+
+def _merge_snapshots(snapshots):
+    """
+    Suma las métricas de varios procesos.
+    
+    Args:
+        snapshots (iterable): Pares (snapshot, proceso vivo); los gauges
+            solo se suman para los procesos vivos
+    
+    Returns:
+        tuple: (contadores, gauges, histogramas) por (nombre, etiquetas)
+    """
+    counters, gauges, histograms = {}, {}, {}
+    for snapshot, alive in snapshots:
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        if alive:
+            for name, labels, value in snapshot['gauges']:
+                key = (name, tuple(map(tuple, labels)))
+                gauges[key] = gauges.get(key, 0) + value
+        for name, labels, value in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            current = histograms.get(key)
+            histograms[key] = value if current is None else [a + b for a, b in zip(current, value)]
+    return counters, gauges, histograms
+
+def _escape(value):
+    """
+    Escapa el valor de una etiqueta (barra invertida, comillas y saltos de línea).
+    
+    Args:
+        value: Valor de la etiqueta
+    
+    Returns:
+        str: Valor escapado
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels, extra=()):
+    """
+    Formatea las etiquetas de una muestra.
+    
+    Args:
+        labels (iterable): Pares (etiqueta, valor)
+        extra (tuple): Pares adicionales (por ejemplo le del bucket)
+    
+    Returns:
+        str: Etiquetas entre llaves o cadena vacía
+    """
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+def _format_value(value):
+    """
+    Formatea un valor numérico para el formato de texto.
+    
+    Args:
+        value (float): Valor
+    
+    Returns:
+        str: Valor formateado
+    """
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def render_metrics():
+    """
+    Genera el texto de /metrics sumando las métricas de todos los procesos.
+    
+    Returns:
+        str: Métricas en formato de texto de Prometheus 0.0.4
+    """
+    counters, gauges, histograms = _merge_snapshots(_collect_snapshots())
+    
+    lines = []
+    for name, (metric_type, description) in METRICS.items():
+        full_name = f'{METRICS_PREFIX}_{name}'
+        lines.append(f'# HELP {full_name} {description}')
+        lines.append(f'# TYPE {full_name} {metric_type}')
+        
+        if metric_type == 'histogram':
+            buckets = BUCKETS[name]
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + (float('inf'),), values):
+                    cumulative += count
+                    lines.append(f'{full_name}_bucket{_format_labels(labels, [("le", _format_value(bound))])} {cumulative}')
+                lines.append(f'{full_name}_sum{_format_labels(labels)} {_format_value(values[-2])}')
+                lines.append(f'{full_name}_count{_format_labels(labels)} {values[-1]}')
+        else:
+            samples = counters if metric_type == 'counter' else gauges
+            for (metric, labels), value in sorted(samples.items()):
+                if metric == name:
+                    lines.append(f'{full_name}{_format_labels(labels)} {_format_value(value)}')
+    
+    return '\n'.join(lines) + '\n'
+
+def setup_metrics(app):
+    """
+    Registra la instrumentación de las peticiones.
+    
+    Debe llamarse antes que setup_compression para medir el tamaño de la
+    respuesta comprimida (los after_request se ejecutan en orden inverso).
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    setup_query_events()
+    
+    # Al salir el worker se vuelcan las métricas pendientes del último intervalo
+    if METRICS_MULTIPROC_DIR:
+        atexit.register(metrics_registry.flush, True)
+    
+    @app.before_request
+    def start_request_metrics():
+        """Marca el inicio de la petición y la cuenta como en curso."""
+        g._metrics_start = time.perf_counter()
+        g._metrics_in_flight = True
+        metrics_registry.add_gauge('http_requests_in_flight', (), 1)
+    
+    @app.after_request
+    def record_request_metrics(response):
+        """Registra la petición (las respuestas en streaming, al terminar de enviarse)."""
+        start = g.get('_metrics_start')
+        if start is None:
+            return response
+        
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        labels = (('method', request.method), ('route', route))
+        counter_labels = labels + (('blueprint', request.blueprint or ''), ('status', str(response.status_code)))
+        # El perfil sigue acumulando las consultas de la exportación en streaming
+        profile = get_request_profile()
+        
+        def record(size):
+            """Registra las métricas de la petición."""
+            metrics_registry.inc('http_requests_total', counter_labels)
+            metrics_registry.observe('http_request_duration_seconds', labels, time.perf_counter() - start)
+            metrics_registry.observe('http_response_size_bytes', labels, size)
+            metrics_registry.observe('http_request_db_queries', labels, profile.queries)
+            metrics_registry.observe('http_request_db_seconds', labels, profile.seconds)
+            metrics_registry.flush()
+        
+        if not response.is_streamed:
+            record(response.calculate_content_length() or 0)
+            return response
+        
+        body = response.response
+        
+        def count_bytes():
+            """Cuenta los bytes enviados y registra la petición al terminar el cuerpo."""
+            sent = 0
+            try:
+                for chunk in body:
+                    sent += len(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+                    yield chunk
+            finally:
+                record(sent)
+        
+        response.response = ClosingIterator(count_bytes(), getattr(body, 'close', None))
+        return response
+    
+    @app.teardown_request
+    def finish_request_metrics(exception):
+        """Descuenta la petición de las que están en curso."""
+        if g.pop('_metrics_in_flight', False):
+            metrics_registry.add_gauge('http_requests_in_flight', (), -1)
@@ -0,0 +1,224 @@
+"""
+Perfilado de las consultas SQL de cada petición.
+
+Con los eventos before/after_cursor_execute de SQLAlchemy se registra,
+por petición, el número de consultas, el tiempo total en base de datos y
+las sentencias más lentas. Con esa información:
+
+- Se añade la cabecera Server-Timing (db y total) a cada respuesta
+- En modo debug (o con SQL_PROFILER_HEADERS=true) se añade X-Query-Count,
+  las SQL_PROFILER_TOP sentencias más lentas se añaden a Server-Timing
+  (q1, q2...) y se registran en el log de la aplicación
+- Las consultas que superan SLOW_QUERY_MS se registran en el log
+- Si una misma sentencia se repite N_PLUS_ONE_THRESHOLD veces o más en
+  una petición, se registra un aviso de posible N+1
+"""
+import logging
+import os
+import re
+import time
+from collections import Counter
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Configuración del perfilado
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', 200))
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', 5))
+SQL_PROFILER_TOP = int(os.getenv('SQL_PROFILER_TOP', 3))
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'true').lower() == 'true'
+
+# Caracteres de cada sentencia en Server-Timing y en el log
+SERVER_TIMING_STATEMENT_CHARS = 120
+LOG_STATEMENT_CHARS = 300
+
+# Listas de parámetros de IN (...) expandidas: la misma consulta con
+# distinto número de valores cuenta como la misma sentencia
+_PARAMETER_LIST = re.compile(r'\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*\)')
+
+def normalize_statement(statement):
+    """
+    Normaliza una sentencia SQL para agrupar las repeticiones.
+    
+    Args:
+        statement (str): Sentencia con parámetros enlazados
+    
+    Returns:
+        str: Sentencia con espacios compactados y listas de parámetros colapsadas
+    """
+    return _PARAMETER_LIST.sub('(?)', ' '.join(statement.split()))
+
+class RequestProfile:
+    """
+    Consultas SQL ejecutadas durante una petición.
+    """
+    __slots__ = ('queries', 'seconds', 'slowest', 'statements')
+    
+    def __init__(self):
+        """
+        Constructor del perfil vacío.
+        """
+        self.queries = 0
+        self.seconds = 0.0
+        self.slowest = []
+        self.statements = Counter()
+    
+    def record(self, statement, seconds):
+        """
+        Registra una consulta.
+        
+        Args:
+            statement (str): Sentencia ejecutada
+            seconds (float): Duración de la consulta
+        """
+        self.queries += 1
+        self.seconds += seconds
+        self.statements[normalize_statement(statement)] += 1
+        
+        if len(self.slowest) < SQL_PROFILER_TOP or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda entry: entry[0], reverse=True)
+            del self.slowest[SQL_PROFILER_TOP:]
+    
+    def repeated(self, threshold=N_PLUS_ONE_THRESHOLD):
+        """
+        Obtiene las sentencias que se repiten al menos threshold veces.
+        
+        Args:
+            threshold (int): Número mínimo de repeticiones
+        
+        Returns:
+            list: Pares (sentencia normalizada, repeticiones) de más a menos
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+def server_timing_description(statement):
+    """
+    Convierte una sentencia en el desc de una entrada de Server-Timing.
+    
+    Se compactan los espacios, se recorta a SERVER_TIMING_STATEMENT_CHARS,
+    se sustituyen los caracteres no ASCII (las cabeceras HTTP son latin-1)
+    y se escapan las comillas y barras del quoted-string.
+    
+    Args:
+        statement (str): Sentencia SQL
+    
+    Returns:
+        str: Descripción entre comillas
+    """
+    text = ' '.join(statement.split())
+    if len(text) > SERVER_TIMING_STATEMENT_CHARS:
+        text = text[:SERVER_TIMING_STATEMENT_CHARS - 3] + '...'
+    text = text.encode('ascii', 'replace').decode('ascii')
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def get_request_profile():
+    """
+    Obtiene el perfil SQL de la petición actual (lo crea si no existe).
+    
+    Returns:
+        RequestProfile or None: Perfil de la petición o None fuera de una petición
+    """
+    if not has_request_context():
+        return None
+    profile = g.get('_sql_profile')
+    if profile is None:
+        profile = g._sql_profile = RequestProfile()
+    return profile
+
+def _describe_request():
+    """
+    Describe la petición actual para los mensajes de log.
+    
+    Returns:
+        str: Método y ruta, o 'fuera de petición'
+    """
+    if not has_request_context():
+        return 'fuera de petición'
+    return f'{request.method} {request.path}'
+
+_events_registered = False
+
+def setup_query_events():
+    """
+    Registra los eventos que miden cada consulta SQL. Es idempotente.
+    """
+    global _events_registered
+    if _events_registered:
+        return
+    _events_registered = True
+    
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        """Guarda el inicio de la consulta."""
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+    
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        """Acumula la consulta en el perfil de la petición y registra las lentas."""
+        elapsed = time.perf_counter() - conn.info['query_start'].pop()
+        
+        profile = get_request_profile()
+        if profile is not None:
+            profile.record(statement, elapsed)
+        
+        if elapsed * 1000 >= SLOW_QUERY_MS:
+            logger.warning(
+                f'Consulta lenta ({elapsed * 1000:.1f} ms) en {_describe_request()}: '
+                f'{" ".join(statement.split())[:500]}'
+            )
+
+def setup_sql_profiler(app):
+    """
+    Configura el perfilado SQL por petición y sus cabeceras.
+    
+    Args:
+        app: Instancia de la aplicación Flask
+    """
+    setup_query_events()
+    debug_headers = app.debug or os.getenv('SQL_PROFILER_HEADERS', 'false').lower() == 'true'
+    
+    @app.before_request
+    def start_sql_profile():
+        """Crea el perfil SQL de la petición y marca su inicio."""
+        g._sql_profile = RequestProfile()
+        g._sql_profile_start = time.perf_counter()
+    
+    @app.after_request
+    def add_sql_profile_headers(response):
+        """Añade Server-Timing y X-Query-Count, registra las consultas más lentas y avisa de posibles N+1."""
+        profile = g.get('_sql_profile')
+        if profile is None:
+            return response
+        
+        if SERVER_TIMING_ENABLED:
+            total = time.perf_counter() - g._sql_profile_start
+            entries = [
+                f'db;dur={profile.seconds * 1000:.2f};desc="{profile.queries} consultas"',
+                f'total;dur={total * 1000:.2f}'
+            ]
+            if debug_headers:
+                entries.extend(
+                    f'q{position};dur={seconds * 1000:.2f};desc={server_timing_description(statement)}'
+                    for position, (seconds, statement) in enumerate(profile.slowest, start=1)
+                )
+            response.headers.add('Server-Timing', ', '.join(entries))
+        
+        if debug_headers:
+            response.headers['X-Query-Count'] = str(profile.queries)
+            if profile.slowest:
+                response.headers['X-Query-Slowest-Ms'] = f'{profile.slowest[0][0] * 1000:.2f}'
+                app.logger.info(
+                    f'Consultas más lentas de {_describe_request()} ({profile.queries} en total): ' +
+                    ' | '.join(
+                        f'{seconds * 1000:.2f} ms {" ".join(statement.split())[:LOG_STATEMENT_CHARS]}'
+                        for seconds, statement in profile.slowest
+                    )
+                )
+        
+        for statement, count in profile.repeated():
+            logger.warning(f'Posible N+1 en {_describe_request()}: {count} ejecuciones de {statement[:300]}')
+        
+        return response
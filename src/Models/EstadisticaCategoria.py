@@ -0,0 +1,28 @@
+"""
+Modelo de datos para el resumen de estadísticas por categoría.
+"""
+from src.Config.Database import db
+
+class EstadisticaCategoria(db.Model):
+    """
+    Resumen materializado de los videojuegos de cada categoría.
+    
+    Se mantiene de forma incremental en la misma transacción que las
+    escrituras de VideojuegoService, de modo que las estadísticas globales
+    y el listado de categorías se leen sin recorrer la tabla de videojuegos.
+    """
+    __tablename__ = 'videojuegos_estadisticas'
+    
+    categoria = db.Column(db.String(50), primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    suma_precio = db.Column(db.Numeric(14, 2), nullable=False, default=0)
+    suma_valoracion = db.Column(db.Numeric(12, 1), nullable=False, default=0)
+    
+    def __repr__(self):
+        """
+        Representación string del objeto.
+        
+        Returns:
+            str: Representación del resumen
+        """
+        return f'<EstadisticaCategoria {self.categoria}: {self.total}>'
@@ -10,6 +10,13 @@ class Videojuego(db.Model):
     Modelo de Videojuego con todas las propiedades necesarias.
     """
     __tablename__ = 'videojuegos'
+    __table_args__ = (
+        # Índice compuesto para el orden de los listados y la paginación por
+        # cursor (keyset); se recorre hacia atrás para fecha_creacion DESC, id DESC
+        db.Index('ix_videojuegos_fecha_creacion_id', 'fecha_creacion', 'id'),
+        # Índice para max(fecha_actualizacion), que forma parte del ETag del catálogo
+        db.Index('ix_videojuegos_fecha_actualizacion', 'fecha_actualizacion'),
+    )
     
     # Campos principales
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
@@ -0,0 +1,109 @@
+"""
+Objeto de transferencia (DTO) de solo lectura para Videojuego.
+"""
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+
+# Campos del DTO en el mismo orden que Videojuego.to_dict y los listados
+VIDEOJUEGO_FIELDS = (
+    'id',
+    'nombre',
+    'categoria',
+    'precio',
+    'valoracion',
+    'fecha_creacion',
+    'fecha_actualizacion',
+)
+
+def _to_float(value):
+    """
+    Convierte un valor numérico a float conservando None.
+    
+    Args:
+        value: Valor leído (Decimal, float o None)
+    
+    Returns:
+        float or None: Valor convertido
+    """
+    return float(value) if isinstance(value, Decimal) else value
+
+def _to_iso(value):
+    """
+    Convierte una fecha a texto ISO 8601 conservando None y los textos.
+    
+    Args:
+        value: Valor leído (datetime, str o None)
+    
+    Returns:
+        str or None: Fecha en ISO 8601
+    """
+    return value.isoformat() if isinstance(value, datetime) else value
+
+class VideojuegoDTO(namedtuple('VideojuegoDTO', VIDEOJUEGO_FIELDS)):
+    """
+    Videojuego inmutable y compacto para las cachés y la serialización.
+    
+    Es una tupla con nombre (sin __dict__ ni estado de SQLAlchemy) cuyos
+    valores ya están en su formato de salida: precio y valoración como
+    float y fechas como texto ISO 8601. Al ser una tupla en el orden de
+    los listados, serialize_rows la acepta igual que una fila de Core.
+    Los campos que no se leyeron (proyecciones con fields) valen None.
+    """
+    __slots__ = ()
+    
+    @classmethod
+    def from_row(cls, row):
+        """
+        Crea un DTO a partir de una fila de Core.
+        
+        Args:
+            row (RowMapping or dict): Fila con algunos o todos los campos
+        
+        Returns:
+            VideojuegoDTO: DTO con los valores convertidos
+        """
+        return cls(
+            row.get('id'),
+            row.get('nombre'),
+            row.get('categoria'),
+            _to_float(row.get('precio')),
+            _to_float(row.get('valoracion')),
+            _to_iso(row.get('fecha_creacion')),
+            _to_iso(row.get('fecha_actualizacion')),
+        )
+    
+    @classmethod
+    def from_model(cls, videojuego):
+        """
+        Crea un DTO a partir de una instancia del modelo.
+        
+        Args:
+            videojuego (Videojuego): Instancia del modelo
+        
+        Returns:
+            VideojuegoDTO: DTO con los valores convertidos
+        """
+        return cls(
+            videojuego.id,
+            videojuego.nombre,
+            videojuego.categoria,
+            _to_float(videojuego.precio),
+            _to_float(videojuego.valoracion),
+            _to_iso(videojuego.fecha_creacion),
+            _to_iso(videojuego.fecha_actualizacion),
+        )
+    
+    def to_dict(self, fields=None):
+        """
+        Convierte el DTO a diccionario para serialización JSON.
+        
+        Args:
+            fields (tuple): Campos a incluir (None para todos)
+        
+        Returns:
+            dict: Diccionario con el mismo formato que Videojuego.to_dict
+        """
+        if fields:
+            return {field: getattr(self, field) for field in fields}
+        return dict(zip(self._fields, self))
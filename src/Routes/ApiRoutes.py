@@ -1,10 +1,17 @@
 """
 Rutas generales del sistema (health check, info, etc.).
 """
-from flask import Blueprint
+from flask import Blueprint, Response
 from flasgger import swag_from
 from src.Utils import get_api_info, create_response
-from src.Schemas.ApiSchema import health_schema, api_info_schema
+from src.Config.Cache import get_cache_stats
+from src.Config.Database import db
+from src.Config.Pool import get_pool_stats
+from src.Config.Replicas import replica_router
+from src.Middlewares.compression import compressed_cache
+from src.Middlewares.metrics import render_metrics
+from src.Services.AutocompleteService import autocomplete_index
+from src.Schemas.ApiSchema import health_schema, api_info_schema, metrics_schema, prometheus_metrics_schema
 import os
 
 # Crear blueprint para rutas generales
@@ -32,3 +39,26 @@ def get_api_info_route():
         message="Información de la API obtenida exitosamente",
         data=get_api_info()
     )
+
+@api_bp.route('/api/metrics', methods=['GET'])
+@swag_from(metrics_schema)
+def get_metrics():
+    """Endpoint para obtener métricas internas del proceso (cachés y pool de conexiones)."""
+    return create_response(
+        success=True,
+        message="Métricas obtenidas exitosamente",
+        data={
+            'pid': os.getpid(),
+            'cache': get_cache_stats(),
+            'autocomplete': autocomplete_index.stats(),
+            'compresion': compressed_cache.stats(),
+            'pool': get_pool_stats({**db.engines, **replica_router.engines_by_name()}),
+            'replicas': replica_router.stats()
+        }
+    )
+
+@api_bp.route('/metrics', methods=['GET'])
+@swag_from(prometheus_metrics_schema)
+def get_prometheus_metrics():
+    """Endpoint de métricas HTTP en formato de texto de Prometheus."""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
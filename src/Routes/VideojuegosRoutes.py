@@ -6,8 +6,11 @@ from flasgger import swag_from
 from src.Controllers.VideojuegoController import VideojuegoController
 from src.Schemas.VideojuegosSchema import (
     get_videojuegos_schema,
+    export_videojuegos_schema,
+    autocomplete_videojuegos_schema,
     get_videojuego_schema,
     create_videojuego_schema,
+    bulk_videojuegos_schema,
     update_videojuego_schema,
     delete_videojuego_schema,
     get_categorias_schema,
@@ -23,6 +26,18 @@ def get_videojuegos():
     """Endpoint para obtener todos los videojuegos con filtros opcionales."""
     return VideojuegoController.get_all()
 
+@videojuegos_bp.route('/export', methods=['GET'])
+@swag_from(export_videojuegos_schema)
+def export_videojuegos():
+    """Endpoint para exportar el catálogo completo en streaming."""
+    return VideojuegoController.export()
+
+@videojuegos_bp.route('/autocomplete', methods=['GET'])
+@swag_from(autocomplete_videojuegos_schema)
+def autocomplete_videojuegos():
+    """Endpoint para sugerir nombres de videojuegos mientras se escribe."""
+    return VideojuegoController.autocomplete()
+
 @videojuegos_bp.route('/<int:videojuego_id>', methods=['GET'])
 @swag_from(get_videojuego_schema)
 def get_videojuego(videojuego_id):
@@ -35,6 +50,12 @@ def create_videojuego():
     """Endpoint para crear un nuevo videojuego."""
     return VideojuegoController.create()
 
+@videojuegos_bp.route('/bulk', methods=['POST'])
+@swag_from(bulk_videojuegos_schema)
+def bulk_videojuegos():
+    """Endpoint para crear o actualizar videojuegos de forma masiva."""
+    return VideojuegoController.bulk_upsert()
+
 @videojuegos_bp.route('/<int:videojuego_id>', methods=['PUT'])
 @swag_from(update_videojuego_schema)
 def update_videojuego(videojuego_id):
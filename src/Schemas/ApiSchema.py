@@ -55,3 +55,56 @@ api_info_schema = {
         }
     }
 }
+
+metrics_schema = {
+    'tags': ['Sistema'],
+    'summary': 'Métricas internas',
+    'description': 'Obtiene las métricas del proceso que atiende la petición (aciertos, fallos y desalojos de caché, tamaño del índice de autocompletado, caché de respuestas comprimidas y uso del pool de conexiones)',
+    'responses': {
+        200: {
+            'description': 'Métricas obtenidas exitosamente',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'success': {'type': 'boolean', 'example': True},
+                    'message': {'type': 'string', 'example': 'Métricas obtenidas exitosamente'},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'pid': {'type': 'integer', 'example': 12345},
+                            'cache': {'type': 'object'},
+                            'autocomplete': {'type': 'object'},
+                            'compresion': {'type': 'object'},
+                            'pool': {
+                                'type': 'object',
+                                'description': 'Estado de cada pool (tamaño, conexiones en uso, overflow) y contadores de checkouts, esperas e invalidaciones'
+                            },
+                            'replicas': {
+                                'type': 'object',
+                                'description': 'Estado de las réplicas de lectura (disponibilidad, lecturas y fallos)'
+                            }
+                        }
+                    },
+                    'timestamp': {'type': 'string', 'format': 'date-time'}
+                }
+            }
+        }
+    }
+}
+
+prometheus_metrics_schema = {
+    'tags': ['Sistema'],
+    'summary': 'Métricas de Prometheus',
+    'description': (
+        'Métricas HTTP en formato de texto de Prometheus: peticiones por ruta y código de estado, '
+        'histogramas de latencia, tamaño de respuesta, consultas SQL y tiempo en base de datos por '
+        'petición, y peticiones en curso. Con METRICS_MULTIPROC_DIR suma todos los workers'
+    ),
+    'produces': ['text/plain'],
+    'responses': {
+        200: {
+            'description': 'Métricas en formato de texto de Prometheus',
+            'schema': {'type': 'string'}
+        }
+    }
+}
@@ -104,6 +104,15 @@ def get_swagger_definitions():
                 },
                 'timestamp': {'type': 'string', 'format': 'date-time'}
             }
+        },
+        'PercentilesPrecio': {
+            'type': 'object',
+            'properties': {
+                'p25': {'type': 'number', 'example': 39.99},
+                'p50': {'type': 'number', 'example': 59.99},
+                'p75': {'type': 'number', 'example': 59.99},
+                'p90': {'type': 'number', 'example': 69.99}
+            }
         }
     }
 
@@ -131,6 +140,12 @@ def get_swagger_responses():
                 }
             }
         },
+        'NotModified': {
+            'description': (
+                'No modificado - el ETag de If-None-Match (o la fecha de If-Modified-Since) '
+                'coincide con la versión actual; la respuesta no tiene cuerpo'
+            )
+        },
         'NotFound': {
             'description': 'Recurso no encontrado',
             'schema': {
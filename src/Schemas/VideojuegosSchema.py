@@ -11,7 +11,7 @@ get_videojuegos_schema = {
             'name': 'categoria',
             'in': 'query',
             'type': 'string',
-            'description': 'Filtrar por categoría',
+            'description': 'Filtrar por categoría (contiene el texto, sin distinguir mayúsculas)',
             'example': 'RPG'
         },
         {
@@ -20,6 +20,51 @@ get_videojuegos_schema = {
             'type': 'string',
             'description': 'Buscar en nombre y categoría',
             'example': 'zelda'
+        },
+        {
+            'name': 'modo',
+            'in': 'query',
+            'type': 'string',
+            'enum': ['contiene', 'relevancia'],
+            'default': 'contiene',
+            'description': (
+                'Modo de búsqueda: contiene (subcadena en nombre y categoría) o relevancia '
+                '(índice de texto completo, cada palabra como prefijo, resultados ordenados por relevancia)'
+            )
+        },
+        {
+            'name': 'limit',
+            'in': 'query',
+            'type': 'integer',
+            'description': (
+                'Activa la paginación por cursor con este número de elementos por página (máximo 500). '
+                'Sin limit ni cursor se devuelven hasta 1000 elementos (LIST_MAX_ITEMS) y, si hay más, '
+                'pagination.next_cursor para continuar'
+            ),
+            'example': 50
+        },
+        {
+            'name': 'cursor',
+            'in': 'query',
+            'type': 'string',
+            'description': 'Cursor opaco devuelto en pagination.next_cursor para obtener la página siguiente'
+        },
+        {
+            'name': 'include_total',
+            'in': 'query',
+            'type': 'boolean',
+            'description': 'Incluir el total de elementos (ejecuta un COUNT adicional)',
+            'default': True
+        },
+        {
+            'name': 'fields',
+            'in': 'query',
+            'type': 'string',
+            'description': (
+                'Campos a devolver separados por comas (id, nombre, categoria, precio, valoracion, '
+                'fecha_creacion, fecha_actualizacion); solo se leen esas columnas'
+            ),
+            'example': 'id,nombre,precio'
         }
     ],
     'responses': {
@@ -35,10 +80,114 @@ get_videojuegos_schema = {
                         'items': {'$ref': '#/definitions/Videojuego'}
                     },
                     'count': {'type': 'integer', 'example': 5},
+                    'pagination': {
+                        'type': 'object',
+                        'properties': {
+                            'limit': {'type': 'integer', 'example': 50},
+                            'has_next': {'type': 'boolean', 'example': True},
+                            'next_cursor': {'type': 'string', 'example': 'WyIyMDI1LTAxLTAxVDAwOjAwOjAwIiw0Ml0'}
+                        }
+                    },
                     'timestamp': {'type': 'string', 'format': 'date-time'}
                 }
             }
         },
+        304: {'$ref': '#/responses/NotModified'},
+        400: {'$ref': '#/responses/BadRequest'},
+        500: {'$ref': '#/responses/InternalServerError'}
+    }
+}
+
+export_videojuegos_schema = {
+    'tags': ['Videojuegos'],
+    'summary': 'Exportar el catálogo completo',
+    'description': 'Exporta todos los videojuegos en streaming como NDJSON o como un array JSON enviado por partes',
+    'produces': ['application/x-ndjson', 'application/json'],
+    'parameters': [
+        {
+            'name': 'format',
+            'in': 'query',
+            'type': 'string',
+            'enum': ['ndjson', 'json'],
+            'default': 'ndjson',
+            'description': 'Formato de salida'
+        },
+        {
+            'name': 'categoria',
+            'in': 'query',
+            'type': 'string',
+            'description': 'Filtrar por categoría (contiene el texto, sin distinguir mayúsculas)',
+            'example': 'RPG'
+        },
+        {
+            'name': 'buscar',
+            'in': 'query',
+            'type': 'string',
+            'description': 'Buscar en nombre y categoría',
+            'example': 'zelda'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Catálogo exportado en streaming (un videojuego por línea en NDJSON)',
+            'schema': {
+                'type': 'array',
+                'items': {'$ref': '#/definitions/Videojuego'}
+            }
+        },
+        304: {'$ref': '#/responses/NotModified'},
+        400: {'$ref': '#/responses/BadRequest'}
+    }
+}
+
+autocomplete_videojuegos_schema = {
+    'tags': ['Videojuegos'],
+    'summary': 'Autocompletar nombres de videojuegos',
+    'description': (
+        'Sugiere videojuegos cuyo nombre, o alguna de sus palabras, empieza por el texto indicado. '
+        'Se resuelve con un índice en memoria, sin consultar la base de datos.'
+    ),
+    'parameters': [
+        {
+            'name': 'q',
+            'in': 'query',
+            'type': 'string',
+            'required': True,
+            'description': 'Texto escrito por el usuario',
+            'example': 'zel'
+        },
+        {
+            'name': 'limit',
+            'in': 'query',
+            'type': 'integer',
+            'default': 10,
+            'description': 'Número máximo de sugerencias (máximo 50)'
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Sugerencias obtenidas exitosamente',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'success': {'type': 'boolean', 'example': True},
+                    'message': {'type': 'string', 'example': 'Sugerencias obtenidas exitosamente'},
+                    'data': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'id': {'type': 'integer', 'example': 1},
+                                'nombre': {'type': 'string', 'example': 'The Legend of Zelda: Breath of the Wild'}
+                            }
+                        }
+                    },
+                    'count': {'type': 'integer', 'example': 1},
+                    'timestamp': {'type': 'string', 'format': 'date-time'}
+                }
+            }
+        },
+        304: {'$ref': '#/responses/NotModified'},
         500: {'$ref': '#/responses/InternalServerError'}
     }
 }
@@ -55,6 +204,16 @@ get_videojuego_schema = {
             'required': True,
             'description': 'ID del videojuego',
             'example': 1
+        },
+        {
+            'name': 'fields',
+            'in': 'query',
+            'type': 'string',
+            'description': (
+                'Campos a devolver separados por comas (id, nombre, categoria, precio, valoracion, '
+                'fecha_creacion, fecha_actualizacion); solo se leen esas columnas'
+            ),
+            'example': 'id,nombre,precio'
         }
     ],
     'responses': {
@@ -70,6 +229,7 @@ get_videojuego_schema = {
                 }
             }
         },
+        304: {'$ref': '#/responses/NotModified'},
         404: {'$ref': '#/responses/NotFound'},
         500: {'$ref': '#/responses/InternalServerError'}
     }
@@ -106,6 +266,71 @@ create_videojuego_schema = {
     }
 }
 
+bulk_videojuegos_schema = {
+    'tags': ['Videojuegos'],
+    'summary': 'Crear o actualizar videojuegos de forma masiva',
+    'description': (
+        'Valida todos los elementos en una pasada y los escribe con INSERT ... ON CONFLICT (nombre) DO UPDATE. '
+        'Los videojuegos existentes (mismo nombre) se actualizan. Devuelve el resultado de cada elemento.'
+    ),
+    'parameters': [
+        {
+            'name': 'body',
+            'in': 'body',
+            'required': True,
+            'description': 'Lista de videojuegos (o un objeto {"videojuegos": [...]})',
+            'schema': {
+                'type': 'array',
+                'items': {'$ref': '#/definitions/VideojuegoInput'}
+            }
+        }
+    ],
+    'responses': {
+        200: {
+            'description': 'Carga masiva procesada',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'success': {'type': 'boolean', 'example': True},
+                    'message': {'type': 'string', 'example': 'Carga masiva procesada exitosamente'},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'resumen': {
+                                'type': 'object',
+                                'properties': {
+                                    'created': {'type': 'integer', 'example': 2},
+                                    'updated': {'type': 'integer', 'example': 1},
+                                    'skipped': {'type': 'integer', 'example': 0},
+                                    'error': {'type': 'integer', 'example': 1}
+                                }
+                            },
+                            'resultados': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'index': {'type': 'integer', 'example': 0},
+                                        'id': {'type': 'integer', 'example': 12},
+                                        'nombre': {'type': 'string', 'example': 'Elden Ring'},
+                                        'status': {'type': 'string', 'enum': ['created', 'updated', 'skipped', 'error']},
+                                        'errors': {'type': 'array', 'items': {'type': 'string'}}
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    'count': {'type': 'integer', 'example': 4},
+                    'timestamp': {'type': 'string', 'format': 'date-time'}
+                }
+            }
+        },
+        400: {'$ref': '#/responses/BadRequest'},
+        413: {'description': 'Demasiados elementos en la petición'},
+        500: {'$ref': '#/responses/InternalServerError'}
+    }
+}
+
 update_videojuego_schema = {
     'tags': ['Videojuegos'],
     'summary': 'Actualizar un videojuego',
@@ -199,6 +424,7 @@ get_categorias_schema = {
                 }
             }
         },
+        304: {'$ref': '#/responses/NotModified'},
         500: {'$ref': '#/responses/InternalServerError'}
     }
 }
@@ -206,7 +432,23 @@ get_categorias_schema = {
 get_estadisticas_schema = {
     'tags': ['Videojuegos'],
     'summary': 'Obtener estadísticas',
-    'description': 'Obtiene estadísticas básicas de los videojuegos',
+    'description': 'Obtiene estadísticas básicas de los videojuegos, con desglose opcional por categoría y percentiles del precio',
+    'parameters': [
+        {
+            'name': 'group_by',
+            'in': 'query',
+            'type': 'string',
+            'enum': ['categoria'],
+            'description': 'Incluir el desglose de estadísticas por categoría'
+        },
+        {
+            'name': 'percentiles',
+            'in': 'query',
+            'type': 'boolean',
+            'default': False,
+            'description': 'Incluir los percentiles p25, p50, p75 y p90 del precio'
+        }
+    ],
     'responses': {
         200: {
             'description': 'Estadísticas obtenidas exitosamente',
@@ -221,13 +463,31 @@ get_estadisticas_schema = {
                             'total_videojuegos': {'type': 'integer', 'example': 15},
                             'categorias_unicas': {'type': 'integer', 'example': 5},
                             'precio_promedio': {'type': 'number', 'example': 45.99},
-                            'valoracion_promedio': {'type': 'number', 'example': 8.2}
+                            'valoracion_promedio': {'type': 'number', 'example': 8.2},
+                            'percentiles_precio': {'$ref': '#/definitions/PercentilesPrecio'},
+                            'por_categoria': {
+                                'type': 'array',
+                                'items': {
+                                    'type': 'object',
+                                    'properties': {
+                                        'categoria': {'type': 'string', 'example': 'RPG'},
+                                        'total_videojuegos': {'type': 'integer', 'example': 3},
+                                        'precio_promedio': {'type': 'number', 'example': 53.32},
+                                        'precio_min': {'type': 'number', 'example': 39.99},
+                                        'precio_max': {'type': 'number', 'example': 59.99},
+                                        'valoracion_promedio': {'type': 'number', 'example': 8.9},
+                                        'percentiles_precio': {'$ref': '#/definitions/PercentilesPrecio'}
+                                    }
+                                }
+                            }
                         }
                     },
                     'timestamp': {'type': 'string', 'format': 'date-time'}
                 }
             }
         },
+        304: {'$ref': '#/responses/NotModified'},
+        400: {'$ref': '#/responses/BadRequest'},
         500: {'$ref': '#/responses/InternalServerError'}
     }
 }
@@ -79,11 +79,14 @@ def get_swagger_template():
 
 # Importaciones desde otros módulos para exportación
 from src.Schemas.SwaggerSchema import get_swagger_definitions, get_swagger_responses
-from src.Schemas.ApiSchema import health_schema, api_info_schema
+from src.Schemas.ApiSchema import health_schema, api_info_schema, metrics_schema
 from src.Schemas.VideojuegosSchema import (
     get_videojuegos_schema,
+    export_videojuegos_schema,
+    autocomplete_videojuegos_schema,
     get_videojuego_schema,
     create_videojuego_schema,
+    bulk_videojuegos_schema,
     update_videojuego_schema,
     delete_videojuego_schema,
     get_categorias_schema,
@@ -97,9 +100,13 @@ __all__ = [
     'get_swagger_responses',
     'health_schema',
     'api_info_schema',
+    'metrics_schema',
     'get_videojuegos_schema',
+    'export_videojuegos_schema',
+    'autocomplete_videojuegos_schema',
     'get_videojuego_schema',
     'create_videojuego_schema',
+    'bulk_videojuegos_schema',
     'update_videojuego_schema',
     'delete_videojuego_schema',
     'get_categorias_schema',
@@ -0,0 +1,256 @@
+"""
+Servicio de autocompletado de nombres de videojuegos.
+Mantiene en memoria un índice ordenado de prefijos para no consultar la base de datos.
+"""
+import bisect
+import logging
+import re
+import threading
+import unicodedata
+from sqlalchemy import select
+from src.Config.Cache import response_cache
+from src.Config.Database import db
+from src.Models.Videojuego import Videojuego
+
+logger = logging.getLogger(__name__)
+
+def normalize_text(value):
+    """
+    Normaliza un texto para comparar prefijos (minúsculas y sin tildes).
+    
+    Args:
+        value (str): Texto a normalizar
+    
+    Returns:
+        str: Texto normalizado
+    """
+    decomposed = unicodedata.normalize('NFKD', value.lower())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).strip()
+
+class AutocompleteIndex:
+    """
+    Índice de prefijos sobre los nombres de videojuegos.
+    
+    Guarda dos arrays ordenados de (clave, id): uno con el nombre completo
+    normalizado y otro con los sufijos del nombre que empiezan en cada
+    palabra, de modo que "zel" encuentra "The Legend of Zelda". Las
+    búsquedas son una bisección más el recorrido de los N resultados.
+    """
+    
+    def __init__(self):
+        """
+        Constructor del índice vacío.
+        """
+        self._lock = threading.Lock()
+        self._names = {}
+        self._full = []
+        self._words = []
+        self.version = None
+    
+    @staticmethod
+    def _keys(nombre):
+        """
+        Calcula las claves de un nombre.
+        
+        Args:
+            nombre (str): Nombre del videojuego
+        
+        Returns:
+            tuple: (clave del nombre completo, lista de claves por palabra)
+        """
+        normalized = normalize_text(nombre)
+        word_keys = [normalized[match.start():] for match in re.finditer(r'\w+', normalized) if match.start() > 0]
+        return normalized, word_keys
+    
+    def build(self, rows, version):
+        """
+        Reconstruye el índice completo.
+        
+        Args:
+            rows (iterable): Pares (id, nombre)
+            version (int): Versión del catálogo con la que se leyeron las filas
+        """
+        names = {}
+        full = []
+        words = []
+        for videojuego_id, nombre in rows:
+            names[videojuego_id] = nombre
+            full_key, word_keys = self._keys(nombre)
+            full.append((full_key, videojuego_id))
+            words.extend((key, videojuego_id) for key in word_keys)
+        
+        full.sort()
+        words.sort()
+        with self._lock:
+            self._names, self._full, self._words = names, full, words
+            self.version = version
+    
+    def _remove_locked(self, videojuego_id):
+        """
+        Elimina un videojuego del índice (requiere tener el lock).
+        
+        Args:
+            videojuego_id (int): ID del videojuego
+        """
+        nombre = self._names.pop(videojuego_id, None)
+        if nombre is None:
+            return
+        
+        full_key, word_keys = self._keys(nombre)
+        for array, key in [(self._full, full_key)] + [(self._words, key) for key in word_keys]:
+            position = bisect.bisect_left(array, (key, videojuego_id))
+            if position < len(array) and array[position] == (key, videojuego_id):
+                del array[position]
+    
+    def apply(self, changes, version):
+        """
+        Aplica cambios incrementales tras una escritura local.
+        
+        Si la versión anterior del índice no es la inmediatamente previa,
+        otro worker escribió entre medias y el índice se marca como obsoleto
+        para reconstruirlo en la siguiente consulta.
+        
+        Args:
+            changes (list): Pares (id, nombre); nombre None indica borrado
+            version (int): Versión del catálogo tras la escritura
+        """
+        with self._lock:
+            if self.version is None or self.version != version - 1:
+                self.version = None
+                return
+            
+            for videojuego_id, nombre in changes:
+                self._remove_locked(videojuego_id)
+                if nombre is None:
+                    continue
+                
+                self._names[videojuego_id] = nombre
+                full_key, word_keys = self._keys(nombre)
+                bisect.insort(self._full, (full_key, videojuego_id))
+                for key in word_keys:
+                    bisect.insort(self._words, (key, videojuego_id))
+            
+            self.version = version
+    
+    def search(self, prefix, limit=10):
+        """
+        Busca nombres que empiecen por el prefijo o tengan una palabra que empiece por él.
+        
+        Primero devuelve las coincidencias del nombre completo y después
+        las de palabras intermedias, ambas en orden alfabético.
+        
+        Args:
+            prefix (str): Texto escrito por el usuario
+            limit (int): Número máximo de resultados
+        
+        Returns:
+            list: Diccionarios con id y nombre
+        """
+        key = normalize_text(prefix)
+        if not key:
+            return []
+        
+        with self._lock:
+            names = self._names
+            results = []
+            seen = set()
+            for array in (self._full, self._words):
+                position = bisect.bisect_left(array, (key,))
+                while position < len(array) and len(results) < limit:
+                    entry_key, videojuego_id = array[position]
+                    if not entry_key.startswith(key):
+                        break
+                    if videojuego_id not in seen:
+                        seen.add(videojuego_id)
+                        results.append({'id': videojuego_id, 'nombre': names[videojuego_id]})
+                    position += 1
+        
+        return results
+    
+    def stats(self):
+        """
+        Obtiene el tamaño y la versión del índice.
+        
+        Returns:
+            dict: Estadísticas del índice
+        """
+        with self._lock:
+            return {
+                'nombres': len(self._names),
+                'claves': len(self._full) + len(self._words),
+                'version': self.version
+            }
+
+# Índice de autocompletado del proceso
+autocomplete_index = AutocompleteIndex()
+
+class AutocompleteService:
+    """
+    Servicio que mantiene sincronizado el índice de autocompletado.
+    """
+    
+    @staticmethod
+    def rebuild():
+        """
+        Reconstruye el índice leyendo solo los IDs y nombres de la base de datos.
+        """
+        version = response_cache.get_version()
+        rows = db.session.execute(select(Videojuego.id, Videojuego.nombre))
+        autocomplete_index.build(rows, version)
+    
+    @staticmethod
+    def warm_up():
+        """
+        Construye el índice al arrancar la aplicación.
+        
+        Los errores (por ejemplo, si las tablas aún no existen) se registran
+        y el índice se construirá en la primera consulta.
+        """
+        try:
+            AutocompleteService.rebuild()
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f'No se pudo construir el índice de autocompletado: {e}')
+    
+    @staticmethod
+    def get_version():
+        """
+        Obtiene la versión del catálogo del índice, reconstruyéndolo si está obsoleto.
+        
+        Solo consulta la base de datos si el catálogo cambió desde la
+        última construcción del índice (por ejemplo, por escrituras en
+        otro worker); en otro caso basta con leer la versión de la caché
+        compartida.
+        
+        Returns:
+            int: Versión del catálogo con la que está construido el índice
+        """
+        if autocomplete_index.version != response_cache.get_version():
+            AutocompleteService.rebuild()
+        return autocomplete_index.version
+    
+    @staticmethod
+    def suggest(prefix, limit=10):
+        """
+        Obtiene sugerencias de nombres para un prefijo.
+        
+        Args:
+            prefix (str): Texto escrito por el usuario
+            limit (int): Número máximo de resultados
+        
+        Returns:
+            list: Diccionarios con id y nombre
+        """
+        AutocompleteService.get_version()
+        return autocomplete_index.search(prefix, limit)
+    
+    @staticmethod
+    def apply(changes, version):
+        """
+        Refleja en el índice los cambios de una escritura confirmada.
+        
+        Args:
+            changes (list): Pares (id, nombre); nombre None indica borrado
+            version (int): Versión del catálogo tras la escritura
+        """
+        autocomplete_index.apply(changes, version)
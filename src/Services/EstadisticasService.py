@@ -0,0 +1,213 @@
+"""
+Servicio para el resumen materializado de estadísticas por categoría.
+Mantiene la tabla videojuegos_estadisticas de forma incremental.
+"""
+from decimal import Decimal
+from sqlalchemy import delete, insert, select, update
+from src.Config.Database import db, get_upsert_insert
+from src.Models.EstadisticaCategoria import EstadisticaCategoria
+from src.Models.Videojuego import Videojuego
+
+class EstadisticasService:
+    """
+    Servicio que mantiene y consulta el resumen de estadísticas por categoría.
+    
+    Los métodos de escritura no hacen commit: se ejecutan dentro de la
+    transacción del llamador para que el resumen y los videojuegos se
+    confirmen o se descarten juntos.
+    """
+    
+    @staticmethod
+    def new_delta():
+        """
+        Crea un acumulador vacío de cambios por categoría.
+        
+        Returns:
+            dict: Mapa categoria -> [total, suma_precio, suma_valoracion]
+        """
+        return {}
+    
+    @staticmethod
+    def add_to_delta(delta, categoria, precio, valoracion, sign=1):
+        """
+        Acumula el alta (sign=1) o la baja (sign=-1) de un videojuego.
+        
+        Los importes se redondean a la escala de las columnas del modelo
+        para que las sumas coincidan con los valores almacenados.
+        
+        Args:
+            delta (dict): Acumulador creado con new_delta
+            categoria (str): Categoría del videojuego
+            precio: Precio del videojuego
+            valoracion: Valoración del videojuego
+            sign (int): 1 para sumar, -1 para restar
+        """
+        entry = delta.setdefault(categoria, [0, Decimal('0'), Decimal('0')])
+        entry[0] += sign
+        entry[1] += sign * Decimal(str(precio)).quantize(Decimal('0.01'))
+        entry[2] += sign * Decimal(str(valoracion)).quantize(Decimal('0.1'))
+    
+    @staticmethod
+    def apply_delta(delta):
+        """
+        Aplica los cambios acumulados al resumen en la transacción actual.
+        
+        Args:
+            delta (dict): Acumulador creado con new_delta
+        """
+        table = EstadisticaCategoria.__table__
+        upsert = get_upsert_insert()
+        
+        for categoria, (total, suma_precio, suma_valoracion) in delta.items():
+            if total == 0 and suma_precio == 0 and suma_valoracion == 0:
+                continue
+            
+            values = {
+                'total': table.c.total + total,
+                'suma_precio': table.c.suma_precio + suma_precio,
+                'suma_valoracion': table.c.suma_valoracion + suma_valoracion
+            }
+            
+            if upsert is not None:
+                stmt = upsert(table).values(
+                    categoria=categoria,
+                    total=total,
+                    suma_precio=suma_precio,
+                    suma_valoracion=suma_valoracion
+                ).on_conflict_do_update(index_elements=[table.c.categoria], set_=values)
+                db.session.execute(stmt)
+            else:
+                result = db.session.execute(
+                    update(table).where(table.c.categoria == categoria).values(**values)
+                )
+                if result.rowcount == 0:
+                    db.session.execute(insert(table).values(
+                        categoria=categoria,
+                        total=total,
+                        suma_precio=suma_precio,
+                        suma_valoracion=suma_valoracion
+                    ))
+            
+            if total < 0:
+                db.session.execute(
+                    delete(table).where(table.c.categoria == categoria, table.c.total <= 0)
+                )
+    
+    @staticmethod
+    def rebuild():
+        """
+        Reconstruye el resumen completo a partir de la tabla de videojuegos.
+        
+        Se usa para reparar el resumen o inicializarlo sobre datos
+        existentes. Hace commit de la transacción.
+        
+        Returns:
+            int: Número de categorías en el resumen
+        """
+        table = EstadisticaCategoria.__table__
+        try:
+            db.session.execute(delete(table))
+            db.session.execute(
+                insert(table).from_select(
+                    ['categoria', 'total', 'suma_precio', 'suma_valoracion'],
+                    select(
+                        Videojuego.categoria,
+                        db.func.count(Videojuego.id),
+                        db.func.sum(Videojuego.precio),
+                        db.func.sum(Videojuego.valoracion)
+                    ).group_by(Videojuego.categoria)
+                )
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return db.session.execute(select(db.func.count()).select_from(table)).scalar()
+    
+    @staticmethod
+    def needs_rebuild():
+        """
+        Indica si el resumen está vacío mientras existen videojuegos.
+        
+        Returns:
+            bool: True si hay que reconstruir el resumen
+        """
+        has_summary = db.session.execute(select(EstadisticaCategoria.categoria).limit(1)).first()
+        if has_summary:
+            return False
+        return db.session.execute(select(Videojuego.id).limit(1)).first() is not None
+    
+    @staticmethod
+    def get_categories():
+        """
+        Obtiene las categorías con al menos un videojuego.
+        
+        Returns:
+            list: Lista de categorías
+        """
+        stmt = select(EstadisticaCategoria.categoria).where(
+            EstadisticaCategoria.total > 0
+        ).order_by(EstadisticaCategoria.categoria)
+        return list(db.session.execute(stmt).scalars())
+    
+    @staticmethod
+    def get_summary():
+        """
+        Obtiene las estadísticas globales sumando el resumen por categoría.
+        
+        Returns:
+            dict: Estadísticas con el mismo formato que get_statistics
+        """
+        return EstadisticasService._summary_from_row(
+            db.session.execute(EstadisticasService._summary_statement()).one()
+        )
+    
+    @staticmethod
+    async def get_summary_async(session):
+        """
+        Versión asíncrona de get_summary.
+        
+        Args:
+            session (AsyncSession): Sesión asíncrona de la petición
+        
+        Returns:
+            dict: Estadísticas con el mismo formato que get_statistics
+        """
+        result = await session.execute(EstadisticasService._summary_statement())
+        return EstadisticasService._summary_from_row(result.one())
+    
+    @staticmethod
+    def _summary_statement():
+        """
+        Construye la consulta que suma el resumen de las categorías con videojuegos.
+        
+        Returns:
+            Select: Consulta de total, categorías y sumas de precio y valoración
+        """
+        table = EstadisticaCategoria.__table__
+        return select(
+            db.func.coalesce(db.func.sum(table.c.total), 0),
+            db.func.count(table.c.categoria),
+            db.func.sum(table.c.suma_precio),
+            db.func.sum(table.c.suma_valoracion)
+        ).where(table.c.total > 0)
+    
+    @staticmethod
+    def _summary_from_row(row):
+        """
+        Convierte la fila de _summary_statement en las estadísticas globales.
+        
+        Args:
+            row (Row): Fila con total, categorías y sumas
+        
+        Returns:
+            dict: Estadísticas con el mismo formato que get_statistics
+        """
+        total, categorias_unicas, suma_precio, suma_valoracion = row
+        return {
+            'total_videojuegos': int(total),
+            'categorias_unicas': categorias_unicas,
+            'precio_promedio': float(suma_precio) / total if total else 0,
+            'valoracion_promedio': float(suma_valoracion) / total if total else 0
+        }
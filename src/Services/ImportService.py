@@ -0,0 +1,411 @@
+"""
+Servicio para la importación masiva de videojuegos desde ficheros CSV o NDJSON.
+
+Los ficheros se leen en streaming y se escriben por lotes, cada uno en su
+propia transacción, sin crear objetos ORM:
+
+- PostgreSQL: COPY FROM STDIN a una tabla temporal y un INSERT ... SELECT
+  con ON CONFLICT (nombre) por lote.
+- SQLite: executemany de INSERT ... ON CONFLICT (nombre).
+- Otros motores: se descartan los nombres existentes con un SELECT por lote.
+
+Los nombres repetidos (en el fichero o ya existentes) se omiten o, con
+update=True, actualizan el videojuego existente.
+"""
+import csv
+import io
+import json
+import os
+import time
+from datetime import datetime
+from sqlalchemy import text
+from src.Config.Cache import response_cache, videojuego_cache
+from src.Config.Database import db, get_upsert_insert
+from src.Models.Videojuego import Videojuego
+from src.Services.AutocompleteService import AutocompleteService
+from src.Services.EstadisticasService import EstadisticasService
+from src.Services.VideojuegoService import VideojuegoService
+
+# Filas por lote de importación
+IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 10000))
+
+# Columnas que se leen de cada registro
+IMPORT_COLUMNS = ('nombre', 'categoria', 'precio', 'valoracion')
+
+# Formatos admitidos por extensión del fichero
+IMPORT_FORMATS = {
+    '.csv': 'csv',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+# Errores de validación que se conservan para el informe
+MAX_REPORTED_ERRORS = 20
+
+# Tabla temporal de PostgreSQL para COPY (se vacía en cada commit)
+STAGING_TABLE = 'videojuegos_import'
+
+class ImportService:
+    """
+    Servicio que importa catálogos grandes por lotes.
+    """
+    
+    @staticmethod
+    def detect_format(path):
+        """
+        Obtiene el formato de un fichero a partir de su extensión.
+        
+        Args:
+            path (str): Ruta del fichero
+        
+        Returns:
+            str or None: 'csv', 'ndjson' o None si la extensión no se reconoce
+        """
+        return IMPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    
+    @staticmethod
+    def iter_records(stream, file_format):
+        """
+        Recorre los registros de un fichero sin cargarlo entero en memoria.
+        
+        Args:
+            stream (file): Fichero de texto abierto
+            file_format (str): 'csv' (con cabecera) o 'ndjson'
+        
+        Yields:
+            tuple: (número de línea, registro o None si la línea no es JSON válido)
+        """
+        if file_format == 'csv':
+            reader = csv.DictReader(stream)
+            for record in reader:
+                yield reader.line_num, record
+            return
+        
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_number, record
+    
+    @staticmethod
+    def import_file(path, file_format=None, batch_size=IMPORT_BATCH_SIZE, update=False, truncate=False, progress=None):
+        """
+        Importa un fichero CSV o NDJSON de videojuegos.
+        
+        Cada lote se confirma por separado. Si la importación se interrumpe
+        (fichero mal codificado, error de la base de datos...), los lotes ya
+        confirmados se conservan y el error se devuelve en 'interrumpida'.
+        En cualquier caso, si se confirmó algún cambio se reconstruye el
+        resumen de estadísticas y se invalida la caché de todos los workers.
+        
+        Args:
+            path (str): Ruta del fichero
+            file_format (str): 'csv' o 'ndjson' (por defecto según la extensión)
+            batch_size (int): Filas por lote
+            update (bool): Actualizar los videojuegos con nombre repetido en lugar de omitirlos
+            truncate (bool): Vaciar el catálogo antes de importar
+            progress (callable): Función que recibe el resumen parcial tras cada lote
+        
+        Returns:
+            dict: Resumen con filas leídas, escritas, omitidas, inválidas, errores
+                  por línea e 'interrumpida' (mensaje del error o None)
+        
+        Raises:
+            ValueError: Si el formato no se reconoce (antes de escribir nada)
+        """
+        file_format = file_format or ImportService.detect_format(path)
+        if file_format not in ('csv', 'ndjson'):
+            raise ValueError(f"Formato no reconocido para '{path}' (use .csv, .ndjson o .jsonl)")
+        
+        write_batch = ImportService._get_batch_writer()
+        summary = {
+            'leidas': 0, 'escritas': 0, 'omitidas': 0, 'invalidas': 0, 'lotes': 0,
+            'errores': [], 'interrumpida': None, 'version': None, 'segundos': 0.0
+        }
+        start = time.perf_counter()
+        
+        try:
+            if truncate:
+                db.session.execute(Videojuego.__table__.delete())
+                db.session.commit()
+                summary['lotes'] += 1
+            
+            with open(path, newline='', encoding='utf-8') as stream:
+                batch = []
+                for line_number, record in ImportService.iter_records(stream, file_format):
+                    summary['leidas'] += 1
+                    row = ImportService._to_row(line_number, record, summary)
+                    if row is not None:
+                        batch.append(row)
+                    
+                    if len(batch) >= batch_size:
+                        ImportService._flush(write_batch, batch, update, summary, start, progress)
+                        batch = []
+                
+                if batch:
+                    ImportService._flush(write_batch, batch, update, summary, start, progress)
+        
+        except Exception as e:
+            db.session.rollback()
+            summary['interrumpida'] = f'{type(e).__name__}: {e}'
+        
+        finally:
+            # También tras un error o una interrupción: los lotes confirmados
+            # ya están en la tabla
+            if summary['lotes']:
+                EstadisticasService.rebuild()
+                summary['version'] = response_cache.bump_version()
+                videojuego_cache.clear()
+                AutocompleteService.rebuild()
+        
+        summary['segundos'] = round(time.perf_counter() - start, 3)
+        return summary
+    
+    @staticmethod
+    def _to_row(line_number, record, summary):
+        """
+        Valida un registro y lo convierte en una fila de la tabla.
+        
+        Args:
+            line_number (int): Línea del registro en el fichero
+            record (dict): Registro leído
+            summary (dict): Resumen donde se anotan los errores
+        
+        Returns:
+            tuple or None: (nombre, categoria, precio, valoracion) o None si no es válido
+        """
+        if not isinstance(record, dict):
+            errors = ['El registro debe ser un objeto JSON']
+        else:
+            try:
+                is_valid, errors = Videojuego.validate_data(record)
+            except (AttributeError, TypeError):
+                is_valid, errors = False, ['El nombre y la categoría deben ser texto']
+            
+            if is_valid:
+                return (
+                    record['nombre'].strip(),
+                    record['categoria'].strip(),
+                    round(float(record['precio']), 2),
+                    round(float(record['valoracion']), 1)
+                )
+        
+        summary['invalidas'] += 1
+        if len(summary['errores']) < MAX_REPORTED_ERRORS:
+            summary['errores'].append({'linea': line_number, 'errores': errors})
+        return None
+    
+    @staticmethod
+    def _flush(write_batch, batch, update, summary, start, progress):
+        """
+        Escribe y confirma un lote y notifica el progreso.
+        
+        Args:
+            write_batch (callable): Función de escritura del motor actual
+            batch (list): Filas validadas
+            update (bool): Actualizar los nombres existentes
+            summary (dict): Resumen acumulado
+            start (float): Inicio de la importación (perf_counter)
+            progress (callable): Función de progreso o None
+        """
+        try:
+            written = write_batch(batch, update, datetime.utcnow())
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        summary['lotes'] += 1
+        summary['escritas'] += written
+        summary['omitidas'] += len(batch) - written
+        summary['segundos'] = round(time.perf_counter() - start, 3)
+        if progress is not None:
+            progress(summary)
+    
+    @staticmethod
+    def _get_batch_writer():
+        """
+        Elige la estrategia de escritura del motor actual.
+        
+        Returns:
+            callable: Función (filas, update, fecha) -> filas escritas
+        """
+        dialect = db.engine.dialect
+        if dialect.name == 'postgresql' and dialect.driver == 'psycopg2':
+            return ImportService._write_batch_copy
+        if get_upsert_insert() is not None:
+            return ImportService._write_batch_upsert
+        return ImportService._write_batch_plain
+    
+    @staticmethod
+    def _create_staging_table():
+        """
+        Crea la tabla temporal de PostgreSQL que recibe cada lote con COPY.
+        
+        Las tablas temporales son de cada conexión y el pool puede entregar
+        otra conexión en cada lote, así que se crea (si no existe) en cada uno.
+        """
+        db.session.execute(text(
+            f'CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ('
+            'seq bigserial, nombre varchar(100), categoria varchar(50), '
+            'precio numeric(10, 2), valoracion numeric(3, 1)'
+            ') ON COMMIT DELETE ROWS'
+        ))
+    
+    @staticmethod
+    def _write_batch_copy(batch, update, now):
+        """
+        Escribe un lote en PostgreSQL con COPY FROM STDIN.
+        
+        El lote se copia a la tabla temporal y se inserta con un único
+        INSERT ... SELECT DISTINCT ON (nombre): con update se aplica la
+        última aparición de cada nombre y sin update la primera.
+        
+        Args:
+            batch (list): Filas validadas
+            update (bool): Actualizar los nombres existentes
+            now (datetime): Fecha de creación/actualización
+        
+        Returns:
+            int: Filas insertadas o actualizadas
+        """
+        ImportService._create_staging_table()
+        
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+        
+        # La conexión de la sesión, para que COPY y el INSERT compartan la transacción
+        cursor = db.session.connection().connection.dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} ({', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
+        
+        if update:
+            conflict = (
+                'DO UPDATE SET categoria = EXCLUDED.categoria, precio = EXCLUDED.precio, '
+                'valoracion = EXCLUDED.valoracion, fecha_actualizacion = EXCLUDED.fecha_actualizacion'
+            )
+        else:
+            conflict = 'DO NOTHING'
+        
+        table = Videojuego.__table__.name
+        result = db.session.execute(text(
+            f'INSERT INTO {table} (nombre, categoria, precio, valoracion, fecha_creacion, fecha_actualizacion) '
+            f'SELECT DISTINCT ON (nombre) nombre, categoria, precio, valoracion, :now, :now '
+            f"FROM {STAGING_TABLE} ORDER BY nombre, seq {'DESC' if update else 'ASC'} "
+            f'ON CONFLICT (nombre) {conflict}'
+        ), {'now': now})
+        return result.rowcount
+    
+    @staticmethod
+    def _write_batch_upsert(batch, update, now):
+        """
+        Escribe un lote con executemany de INSERT ... ON CONFLICT (nombre).
+        
+        Los nombres repetidos dentro del lote se descartan antes (como hace
+        DISTINCT ON en PostgreSQL): rowcount cuenta cada sentencia, así que
+        con update un nombre repetido se contaría dos veces.
+        
+        Args:
+            batch (list): Filas validadas
+            update (bool): Actualizar los nombres existentes
+            now (datetime): Fecha de creación/actualización
+        
+        Returns:
+            int: Filas insertadas o actualizadas
+        """
+        table = Videojuego.__table__
+        stmt = get_upsert_insert()(table)
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.nombre],
+                set_={
+                    'categoria': stmt.excluded.categoria,
+                    'precio': stmt.excluded.precio,
+                    'valoracion': stmt.excluded.valoracion,
+                    'fecha_actualizacion': stmt.excluded.fecha_actualizacion
+                }
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.nombre])
+        
+        result = db.session.execute(stmt, ImportService._unique_by_nombre(batch, update, now))
+        return result.rowcount
+    
+    @staticmethod
+    def _write_batch_plain(batch, update, now):
+        """
+        Escribe un lote en motores sin INSERT ... ON CONFLICT.
+        
+        Args:
+            batch (list): Filas validadas
+            update (bool): Actualizar los nombres existentes
+            now (datetime): Fecha de creación/actualización
+        
+        Returns:
+            int: Filas insertadas o actualizadas
+        """
+        rows = ImportService._unique_by_nombre(batch, update, now)
+        existing = VideojuegoService._get_existing_by_nombre([row['nombre'] for row in rows])
+        if update:
+            VideojuegoService._bulk_upsert_fallback(rows, existing)
+            return len(rows)
+        
+        new_rows = [row for row in rows if row['nombre'] not in existing]
+        if new_rows:
+            db.session.execute(Videojuego.__table__.insert(), new_rows)
+        return len(new_rows)
+    
+    @staticmethod
+    def _unique_by_nombre(batch, update, now):
+        """
+        Convierte un lote en parámetros de INSERT con un solo registro por nombre.
+        
+        Sin update gana la primera aparición de cada nombre y con update la
+        última, igual que DISTINCT ON en la escritura con COPY.
+        
+        Args:
+            batch (list): Filas validadas
+            update (bool): Actualizar los nombres existentes
+            now (datetime): Fecha de creación/actualización
+        
+        Returns:
+            list: Diccionarios con todas las columnas
+        """
+        rows_by_nombre = {}
+        for row in ImportService._as_dicts(batch, now):
+            if update or row['nombre'] not in rows_by_nombre:
+                rows_by_nombre[row['nombre']] = row
+        return list(rows_by_nombre.values())
+    
+    @staticmethod
+    def _as_dicts(batch, now):
+        """
+        Convierte las filas de un lote en parámetros de INSERT.
+        
+        Args:
+            batch (list): Filas validadas
+            now (datetime): Fecha de creación/actualización
+        
+        Returns:
+            list: Diccionarios con todas las columnas
+        """
+        return [
+            {
+                'nombre': nombre,
+                'categoria': categoria,
+                'precio': precio,
+                'valoracion': valoracion,
+                'fecha_creacion': now,
+                'fecha_actualizacion': now
+            }
+            for nombre, categoria, precio, valoracion in batch
+        ]
@@ -0,0 +1,138 @@
+"""
+Servicio para comprobar con EXPLAIN que las consultas del servicio usan índices.
+Soporta PostgreSQL (EXPLAIN FORMAT JSON) y SQLite (EXPLAIN QUERY PLAN).
+"""
+import re
+from datetime import datetime
+from sqlalchemy import text
+from src.Config.Database import db
+from src.Models.Videojuego import Videojuego
+from src.Services.EstadisticasService import EstadisticasService
+from src.Services.VideojuegoService import VideojuegoService
+
+# Nodos de PostgreSQL que indican que la consulta usa un índice
+POSTGRES_INDEX_NODES = ('Index Scan', 'Index Only Scan', 'Bitmap Index Scan')
+
+class QueryPlanService:
+    """
+    Servicio que obtiene y evalúa los planes de ejecución de las consultas
+    de VideojuegoService.
+    """
+    
+    @staticmethod
+    def get_service_queries():
+        """
+        Obtiene las consultas que ejecutan los servicios, con valores de ejemplo.
+        
+        Las sentencias salen de los mismos métodos _*_statement que usan
+        VideojuegoService y EstadisticasService, así que cualquier cambio en
+        las consultas reales (proyección, paginación, filtros) se comprueba
+        aquí. La exportación no se incluye porque recorre la tabla completa
+        por diseño, ni el filtro buscar (ILIKE), que no puede usar índices.
+        El filtro de categoría usa el índice de trigramas, pero una subcadena
+        no aporta el orden del listado, así que se admite ordenar en memoria.
+        
+        Returns:
+            list: Tuplas (nombre, sentencia, requiere orden por índice)
+        """
+        cursor = (datetime.utcnow(), 1)
+        
+        return [
+            ('detalle', VideojuegoService._dto_statement(1), False),
+            ('detalle_campos', VideojuegoService._dto_statement(1, ('nombre', 'precio')), False),
+            ('listado', VideojuegoService._page_statement()[0], True),
+            ('listado_cursor', VideojuegoService._page_statement(cursor=cursor)[0], True),
+            ('listado_pagina', VideojuegoService._all_statement(page=3, per_page=50)[0], True),
+            ('categoria', VideojuegoService._page_statement(categoria='RPG')[0], False),
+            ('categoria_cursor', VideojuegoService._page_statement(categoria='RPG', cursor=cursor)[0], False),
+            ('categoria_pagina', VideojuegoService._all_statement(categoria='RPG', page=3, per_page=50)[0], False),
+            ('categoria_total', VideojuegoService._count_statement(categoria='RPG'), False),
+            ('busqueda', VideojuegoService._search_statement('zelda')[0], False),
+            ('busqueda_total', VideojuegoService._search_count_statement('zelda'), False),
+            ('ultima_actualizacion', VideojuegoService._last_modified_statement(), False),
+            ('nombres_existentes', VideojuegoService._existing_by_nombre_statement(['a', 'b'], lock=True), False),
+            ('resumen', EstadisticasService._summary_statement(), False),
+        ]
+    
+    @staticmethod
+    def explain(statement):
+        """
+        Obtiene el plan de ejecución de una sentencia en el motor actual.
+        
+        Args:
+            statement: Sentencia SELECT de SQLAlchemy
+        
+        Returns:
+            list: Líneas del plan (SQLite) o nodos del plan (PostgreSQL)
+        """
+        sql = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+        dialect = db.engine.dialect.name
+        
+        if dialect == 'sqlite':
+            rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}'))
+            return [row[-1] for row in rows]
+        
+        if dialect == 'postgresql':
+            # Se desactiva el recorrido secuencial para comprobar que existe un
+            # índice utilizable aunque la tabla sea pequeña
+            db.session.execute(text('SET LOCAL enable_seqscan = off'))
+            plan = db.session.execute(text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar()
+            nodes = []
+            pending = [plan[0]['Plan']]
+            while pending:
+                node = pending.pop()
+                nodes.append(node)
+                pending.extend(node.get('Plans', []))
+            return nodes
+        
+        raise ValueError(f'Motor no soportado: {dialect}')
+    
+    @staticmethod
+    def evaluate(plan, ordered):
+        """
+        Decide si un plan usa índices.
+        
+        Un plan falla si recorre entera la tabla de videojuegos o, cuando la
+        consulta necesita un orden, si lo resuelve ordenando en memoria.
+        
+        Args:
+            plan (list): Resultado de explain
+            ordered (bool): La consulta debe obtener el orden del índice
+        
+        Returns:
+            tuple: (usa índices, líneas legibles del plan)
+        """
+        if db.engine.dialect.name == 'sqlite':
+            full_scan = any(re.fullmatch(r'SCAN videojuegos', line) for line in plan)
+            sorted_in_memory = any('USE TEMP B-TREE FOR ORDER BY' in line for line in plan)
+            return not full_scan and not (ordered and sorted_in_memory), list(plan)
+        
+        lines = [
+            ' '.join(filter(None, [node['Node Type'], node.get('Relation Name'), node.get('Index Name')]))
+            for node in plan
+        ]
+        full_scan = any(
+            node['Node Type'] == 'Seq Scan' and node.get('Relation Name') == Videojuego.__tablename__
+            for node in plan
+        )
+        sorted_in_memory = any(node['Node Type'] in ('Sort', 'Incremental Sort') for node in plan)
+        uses_index = any(node['Node Type'] in POSTGRES_INDEX_NODES for node in plan)
+        return uses_index and not full_scan and not (ordered and sorted_in_memory), lines
+    
+    @staticmethod
+    def check():
+        """
+        Ejecuta EXPLAIN sobre todas las consultas del servicio.
+        
+        Returns:
+            list: Diccionarios con nombre, uso de índices y plan de cada consulta
+        """
+        results = []
+        try:
+            for name, statement, ordered in QueryPlanService.get_service_queries():
+                uses_index, lines = QueryPlanService.evaluate(QueryPlanService.explain(statement), ordered)
+                results.append({'consulta': name, 'usa_indice': uses_index, 'plan': lines})
+        finally:
+            db.session.rollback()
+        
+        return results
@@ -2,9 +2,87 @@
 Servicio para la gestión de videojuegos.
 Contiene toda la lógica de negocio.
 """
-from sqlalchemy import or_
-from src.Config.Database import db
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import Float, cast, or_, false, tuple_, select, update, delete, bindparam, column, literal_column, table
+from sqlalchemy.orm.exc import StaleDataError
+from src.Config.Cache import videojuego_cache, response_cache
+from src.Config.Database import db, get_upsert_insert
+from src.Config.Json import serialize_rows, serialize_row_lines
+from src.Config.Replicas import read_only
+from src.Config.Search import (
+    POSTGRES_TSVECTOR, build_match_expression, is_category_fts_available,
+    is_search_available, is_search_available_async
+)
 from src.Models.Videojuego import Videojuego
+from src.Models.VideojuegoDTO import VideojuegoDTO
+from src.Services.AutocompleteService import AutocompleteService
+from src.Services.EstadisticasService import EstadisticasService
+from src.Utils import build_validator, chunked, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Filas por sentencia INSERT en la carga masiva
+BULK_BATCH_SIZE = int(os.getenv('BULK_BATCH_SIZE', 500))
+
+# Percentiles del precio disponibles en las estadísticas
+PRICE_PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+# Segundos entre comprobaciones (por proceso) de escrituras hechas fuera de la API
+CATALOG_CHECK_SECONDS = float(os.getenv('CATALOG_CHECK_SECONDS', 5))
+
+# Columnas de los listados (mismo formato que Videojuego.to_dict). Los
+# Numeric se convierten a float en SQL para no crear un Decimal por valor
+LIST_COLUMNS = (
+    Videojuego.id,
+    Videojuego.nombre,
+    Videojuego.categoria,
+    cast(Videojuego.precio, Float).label('precio'),
+    cast(Videojuego.valoracion, Float).label('valoracion'),
+    Videojuego.fecha_creacion,
+    Videojuego.fecha_actualizacion,
+)
+LIST_KEYS = tuple(column.key for column in LIST_COLUMNS)
+LIST_COLUMNS_BY_KEY = {column.key: column for column in LIST_COLUMNS}
+
+class PeriodicCheck:
+    """
+    Limita una comprobación a una vez por intervalo en el proceso.
+    
+    Es segura entre hilos: si varias peticiones llegan a la vez cuando
+    toca comprobar, solo una de ellas la hace.
+    """
+    
+    def __init__(self, interval):
+        """
+        Constructor de la comprobación.
+        
+        Args:
+            interval (float): Segundos mínimos entre comprobaciones (0 comprueba siempre)
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+    
+    def due(self):
+        """
+        Indica si toca comprobar y, en ese caso, reserva la comprobación.
+        
+        Returns:
+            bool: True si la petición actual debe hacer la comprobación
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_at:
+                return False
+            self._next_at = now + self.interval
+            return True
+
+# Comprobación de escrituras hechas fuera de la API (por proceso)
+catalog_check = PeriodicCheck(CATALOG_CHECK_SECONDS)
 
 class VideojuegoService:
     """
@@ -12,24 +90,41 @@ class VideojuegoService:
     """
     
     @staticmethod
-    def get_all(categoria=None, buscar=None, page=1, per_page=10):
+    def _categoria_filter(categoria):
+        """
+        Construye la condición del filtro de categoría (subcadena sin
+        distinguir mayúsculas).
+        
+        En SQLite, si existe, se resuelve con la tabla FTS5 de trigramas; en
+        PostgreSQL, ILIKE usa el índice GIN de trigramas ix_videojuegos_categoria_trgm.
+        
+        Args:
+            categoria (str): Texto de la categoría
+            
+        Returns:
+            Condición de SQLAlchemy
+        """
+        pattern = f'%{categoria}%'
+        if is_category_fts_available():
+            fts = table('videojuegos_categoria_fts', column('rowid'), column('categoria'))
+            return Videojuego.id.in_(select(fts.c.rowid).where(fts.c.categoria.like(pattern)))
+        return Videojuego.categoria.ilike(pattern)
+    
+    @staticmethod
+    def _apply_filters(query, categoria=None, buscar=None):
         """
-        Obtiene todos los videojuegos con filtros opcionales.
+        Aplica los filtros de categoría y búsqueda a una consulta.
         
         Args:
+            query: Consulta de SQLAlchemy (Query o select())
             categoria (str): Filtro por categoría
             buscar (str): Búsqueda en nombre y categoría
-            page (int): Número de página para paginación
-            per_page (int): Elementos por página
             
         Returns:
-            dict: Resultados paginados
+            Consulta filtrada del mismo tipo
         """
-        query = Videojuego.query
-        
-        # Aplicar filtros
         if categoria:
-            query = query.filter(Videojuego.categoria.ilike(f'%{categoria}%'))
+            query = query.filter(VideojuegoService._categoria_filter(categoria))
             
         if buscar:
             search_term = f'%{buscar}%'
@@ -40,38 +135,612 @@ class VideojuegoService:
                 )
             )
         
-        # Ordenar por fecha de creación (más recientes primero)
-        query = query.order_by(Videojuego.fecha_creacion.desc())
+        return query
+    
+    @staticmethod
+    def _apply_cursor(query, cursor=None):
+        """
+        Aplica la condición de la paginación por cursor (keyset).
+        
+        Se expresa como comparación de filas para que el motor la resuelva
+        como un rango sobre el índice (fecha_creacion, id).
+        
+        Args:
+            query: Consulta de SQLAlchemy (Query o select())
+            cursor (tuple): (fecha_creacion, id) del último elemento devuelto
+            
+        Returns:
+            Consulta con la condición del cursor
+        """
+        if cursor:
+            fecha_creacion, videojuego_id = cursor
+            query = query.filter(
+                tuple_(Videojuego.fecha_creacion, Videojuego.id) < tuple_(fecha_creacion, videojuego_id)
+            )
+        
+        return query
+    
+    @staticmethod
+    @read_only
+    def get_all(categoria=None, buscar=None, page=1, per_page=10, include_total=True, fields=None):
+        """
+        Obtiene todos los videojuegos con filtros opcionales usando la caché compartida.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            page (int): Número de página para paginación
+            per_page (int): Elementos por página
+            include_total (bool): Ejecutar el COUNT para obtener el total
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados paginados
+        """
+        return response_cache.get_or_set(
+            'listado',
+            lambda: VideojuegoService._load_all(categoria, buscar, page, per_page, include_total, fields),
+            params={
+                'categoria': categoria,
+                'buscar': buscar,
+                'page': page,
+                'per_page': per_page,
+                'include_total': include_total,
+                'fields': ','.join(fields) if fields else None
+            }
+        )
+    
+    @staticmethod
+    def _load_all(categoria=None, buscar=None, page=1, per_page=10, include_total=True, fields=None):
+        """
+        Consulta todos los videojuegos con filtros opcionales.
+        
+        Las filas se leen con un select() de Core y se serializan
+        directamente a JSON, sin crear objetos ORM.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            page (int): Número de página para paginación
+            per_page (int): Elementos por página
+            include_total (bool): Ejecutar el COUNT para obtener el total
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados paginados (videojuegos como texto JSON)
+        """
+        stmt, keys = VideojuegoService._all_statement(categoria, buscar, page, per_page, fields)
+        rows = db.session.execute(stmt).all()
+        total = VideojuegoService._count(categoria, buscar) if include_total else None
+        return VideojuegoService._all_result(rows, keys, total, page, per_page)
+    
+    @staticmethod
+    def _all_statement(categoria=None, buscar=None, page=1, per_page=10, fields=None):
+        """
+        Construye la consulta del listado paginado por desplazamiento.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            page (int): Número de página para paginación
+            per_page (int): Elementos por página
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            tuple: (select(), claves a serializar)
+        """
+        columns, keys = VideojuegoService._list_columns(fields)
+        stmt = VideojuegoService._apply_filters(select(*columns), categoria, buscar)
+        
+        # Ordenar por fecha de creación (más recientes primero); se pide un
+        # elemento extra para saber si existe una página siguiente
+        stmt = stmt.order_by(
+            Videojuego.fecha_creacion.desc(),
+            Videojuego.id.desc()
+        ).offset((page - 1) * per_page).limit(per_page + 1)
+        return stmt, keys
+    
+    @staticmethod
+    def _all_result(rows, keys, total, page, per_page):
+        """
+        Construye el resultado del listado a partir de las filas leídas.
+        
+        Args:
+            rows (list): Filas de _all_statement (hasta per_page + 1)
+            keys (tuple): Claves a serializar
+            total (int): Total de videojuegos o None
+            page (int): Número de página
+            per_page (int): Elementos por página
+            
+        Returns:
+            dict: Resultados paginados (videojuegos como texto JSON)
+        """
+        return {
+            'videojuegos': serialize_rows(rows[:per_page], keys),
+            'total': total,
+            'pages': -(-total // per_page) if total is not None else None,
+            'current_page': page,
+            'per_page': per_page,
+            'has_next': len(rows) > per_page,
+            'has_prev': page > 1
+        }
+    
+    @staticmethod
+    def _list_columns(fields=None, extra=()):
+        """
+        Obtiene las columnas del SELECT para una proyección de campos.
+        
+        Las columnas extra (necesarias internamente) se añaden al final para
+        que la serialización, que recorre solo las claves pedidas, las ignore.
+        
+        Args:
+            fields (tuple): Campos pedidos (None para todos)
+            extra (tuple): Campos que se deben leer aunque no se devuelvan
+        
+        Returns:
+            tuple: (lista de columnas, claves a serializar)
+        """
+        keys = tuple(fields) if fields else LIST_KEYS
+        extra_keys = tuple(key for key in extra if key not in keys)
+        return [LIST_COLUMNS_BY_KEY[key] for key in keys + extra_keys], keys
+    
+    @staticmethod
+    def _count(categoria=None, buscar=None):
+        """
+        Cuenta los videojuegos que cumplen los filtros.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            
+        Returns:
+            int: Número de videojuegos
+        """
+        return db.session.execute(VideojuegoService._count_statement(categoria, buscar)).scalar()
+    
+    @staticmethod
+    def _count_statement(categoria=None, buscar=None):
+        """
+        Construye el COUNT de los videojuegos que cumplen los filtros.
         
-        # Paginación
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            
+        Returns:
+            Select: Consulta del número de videojuegos
+        """
+        return VideojuegoService._apply_filters(select(db.func.count(Videojuego.id)), categoria, buscar)
+    
+    @staticmethod
+    @read_only
+    def get_page(categoria=None, buscar=None, limit=50, cursor=None, include_total=True, fields=None):
+        """
+        Obtiene una página por cursor (keyset) usando la caché compartida.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            limit (int): Elementos por página
+            cursor (tuple): Posición (fecha_creacion, id) del último elemento visto
+            include_total (bool): Ejecutar el COUNT para obtener el total
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados de la página y cursor siguiente codificado
+        """
+        return response_cache.get_or_set(
+            'pagina',
+            lambda: VideojuegoService._load_page(categoria, buscar, limit, cursor, include_total, fields),
+            params={
+                'categoria': categoria,
+                'buscar': buscar,
+                'limit': limit,
+                'cursor': encode_cursor(*cursor) if cursor else None,
+                'include_total': include_total,
+                'fields': ','.join(fields) if fields else None
+            }
         )
+    
+    @staticmethod
+    def _load_page(categoria=None, buscar=None, limit=50, cursor=None, include_total=True, fields=None):
+        """
+        Consulta una página de videojuegos usando paginación por cursor (keyset).
+        
+        El orden es (fecha_creacion DESC, id DESC) y cada página continúa
+        a partir de la posición del cursor, por lo que el coste de una
+        página profunda es el mismo que el de la primera.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            limit (int): Elementos por página
+            cursor (tuple): Posición (fecha_creacion, id) del último elemento visto
+            include_total (bool): Ejecutar el COUNT para obtener el total
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados de la página (videojuegos como texto JSON) y cursor siguiente codificado
+        """
+        total = VideojuegoService._count(categoria, buscar) if include_total else None
+        stmt, keys = VideojuegoService._page_statement(categoria, buscar, limit, cursor, fields)
+        rows = db.session.execute(stmt).all()
+        return VideojuegoService._page_result(rows, keys, total, limit)
+    
+    @staticmethod
+    def _page_statement(categoria=None, buscar=None, limit=50, cursor=None, fields=None):
+        """
+        Construye la consulta de una página por cursor (keyset).
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            limit (int): Elementos por página
+            cursor (tuple): Posición (fecha_creacion, id) del último elemento visto
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            tuple: (select(), claves a serializar)
+        """
+        # La posición del último elemento se necesita para el cursor siguiente
+        columns, keys = VideojuegoService._list_columns(fields, extra=('fecha_creacion', 'id'))
+        stmt = VideojuegoService._apply_filters(select(*columns), categoria, buscar)
+        stmt = VideojuegoService._apply_cursor(stmt, cursor)
+        
+        # Se pide un elemento extra para saber si existe una página siguiente
+        stmt = stmt.order_by(
+            Videojuego.fecha_creacion.desc(),
+            Videojuego.id.desc()
+        ).limit(limit + 1)
+        return stmt, keys
+    
+    @staticmethod
+    def _page_result(rows, keys, total, limit):
+        """
+        Construye el resultado de una página por cursor a partir de las filas leídas.
+        
+        Args:
+            rows (list): Filas de _page_statement (hasta limit + 1)
+            keys (tuple): Claves a serializar
+            total (int): Total de videojuegos o None
+            limit (int): Elementos por página
+            
+        Returns:
+            dict: Resultados de la página (videojuegos como texto JSON) y cursor siguiente codificado
+        """
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        
+        next_cursor = None
+        if has_next:
+            last = rows[-1]
+            next_cursor = encode_cursor(last.fecha_creacion, last.id)
+        
+        return {
+            'videojuegos': serialize_rows(rows, keys),
+            'total': total,
+            'limit': limit,
+            'has_next': has_next,
+            'next_cursor': next_cursor
+        }
+    
+    @staticmethod
+    @read_only
+    def search(buscar, categoria=None, limit=50, include_total=True, fields=None):
+        """
+        Busca videojuegos por relevancia usando el índice de texto completo.
+        
+        Args:
+            buscar (str): Texto a buscar (cada palabra se trata como prefijo)
+            categoria (str): Filtro por categoría
+            limit (int): Número máximo de resultados
+            include_total (bool): Contar el total de coincidencias
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados ordenados por relevancia
+        """
+        return response_cache.get_or_set(
+            'busqueda',
+            lambda: VideojuegoService._load_search(buscar, categoria, limit, include_total, fields),
+            params={
+                'buscar': buscar,
+                'categoria': categoria,
+                'limit': limit,
+                'include_total': include_total,
+                'fields': ','.join(fields) if fields else None
+            }
+        )
+    
+    @staticmethod
+    def _load_search(buscar, categoria=None, limit=50, include_total=True, fields=None):
+        """
+        Ejecuta la búsqueda por relevancia.
+        
+        Args:
+            buscar (str): Texto a buscar
+            categoria (str): Filtro por categoría
+            limit (int): Número máximo de resultados
+            include_total (bool): Contar el total de coincidencias
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados ordenados por relevancia (videojuegos como texto JSON)
+        """
+        total = None
+        if include_total:
+            total = db.session.execute(VideojuegoService._search_count_statement(buscar, categoria)).scalar()
+        
+        stmt, keys = VideojuegoService._search_statement(buscar, categoria, limit, fields)
+        rows = db.session.execute(stmt).all()
+        return VideojuegoService._search_result(rows, keys, total, limit)
+    
+    @staticmethod
+    def _search_result(rows, keys, total, limit):
+        """
+        Construye el resultado de la búsqueda por relevancia a partir de las filas leídas.
+        
+        Args:
+            rows (list): Filas de _search_statement (hasta limit + 1)
+            keys (tuple): Claves a serializar
+            total (int): Total de coincidencias o None
+            limit (int): Número máximo de resultados
+            
+        Returns:
+            dict: Resultados ordenados por relevancia (videojuegos como texto JSON)
+        """
+        return {
+            'videojuegos': serialize_rows(rows[:limit], keys),
+            'total': total,
+            'limit': limit,
+            'has_next': len(rows) > limit
+        }
+    
+    @staticmethod
+    def _search_statement(buscar, categoria=None, limit=50, fields=None, available=None):
+        """
+        Construye la consulta de la búsqueda por relevancia.
+        
+        Args:
+            buscar (str): Texto a buscar
+            categoria (str): Filtro por categoría
+            limit (int): Número máximo de resultados
+            fields (tuple): Campos a devolver (None para todos)
+            available (bool): Disponibilidad del índice de texto completo
+                (None para comprobarla con is_search_available)
+            
+        Returns:
+            tuple: (select(), claves a serializar)
+        """
+        columns, keys = VideojuegoService._list_columns(fields)
+        stmt, order = VideojuegoService._build_search_query(buscar, categoria, select(*columns), available)
+        
+        # Se pide un elemento extra para saber si hay más resultados
+        return stmt.order_by(*order).limit(limit + 1), keys
+    
+    @staticmethod
+    def _search_count_statement(buscar, categoria=None, available=None):
+        """
+        Construye el COUNT de las coincidencias de la búsqueda por relevancia.
+        
+        Args:
+            buscar (str): Texto a buscar
+            categoria (str): Filtro por categoría
+            available (bool): Disponibilidad del índice de texto completo
+                (None para comprobarla con is_search_available)
+            
+        Returns:
+            Select: Consulta del número de coincidencias
+        """
+        base = select(db.func.count(Videojuego.id))
+        return VideojuegoService._build_search_query(buscar, categoria, base, available)[0]
+    
+    @staticmethod
+    def _build_search_query(buscar, categoria=None, base=None, available=None):
+        """
+        Construye la consulta de búsqueda por relevancia y su orden.
+        
+        En PostgreSQL usa tsvector/tsquery con ts_rank y en SQLite la tabla
+        FTS5 con bm25 (el nombre pesa más que la categoría). Si el motor no
+        tiene índice de texto completo se recurre a ILIKE ordenado por nombre.
+        
+        Args:
+            buscar (str): Texto a buscar
+            categoria (str): Filtro por categoría
+            base: Sentencia select() sobre la que aplicar la búsqueda
+                (por defecto, select(Videojuego))
+            available (bool): Disponibilidad del índice de texto completo
+                (None para comprobarla con is_search_available)
+            
+        Returns:
+            tuple: (sentencia filtrada, lista de expresiones de orden)
+        """
+        if available is None:
+            available = is_search_available()
+        
+        base = base if base is not None else select(Videojuego)
+        query = VideojuegoService._apply_filters(base, categoria)
+        match = build_match_expression(buscar)
+        dialect = db.engine.dialect.name
+        
+        if match is None:
+            query = query.filter(false())
+            order = [Videojuego.id]
+        elif not available:
+            query = VideojuegoService._apply_filters(query, buscar=buscar)
+            order = [Videojuego.nombre, Videojuego.id]
+        elif dialect == 'postgresql':
+            vector = literal_column(POSTGRES_TSVECTOR)
+            tsquery = db.func.to_tsquery(literal_column("'simple'::regconfig"), match)
+            query = query.filter(vector.op('@@')(tsquery))
+            order = [db.func.ts_rank(vector, tsquery).desc(), Videojuego.id]
+        else:
+            fts = table('videojuegos_fts', column('rowid'))
+            fts_table = literal_column('videojuegos_fts')
+            query = query.join(fts, fts.c.rowid == Videojuego.id).filter(fts_table.op('MATCH')(match))
+            order = [db.func.bm25(fts_table, 10.0, 1.0), Videojuego.id]
+        
+        return query, order
+    
+    @staticmethod
+    def iter_export(categoria=None, buscar=None, batch_size=1000):
+        """
+        Recorre el catálogo completo en lotes sin cargarlo entero en memoria.
+        
+        Usa yield_per, que en PostgreSQL activa un cursor del lado del
+        servidor, de modo que solo se mantiene un lote de filas a la vez.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            batch_size (int): Filas obtenidas por cada viaje a la base de datos
+            
+        Yields:
+            str: Objeto JSON de cada videojuego
+        """
+        stmt = VideojuegoService._apply_filters(select(*LIST_COLUMNS), categoria, buscar)
+        stmt = stmt.order_by(Videojuego.id).execution_options(yield_per=batch_size)
+        
+        for rows in db.session.execute(stmt).partitions():
+            yield from serialize_row_lines(rows, LIST_KEYS)
+    
+    @staticmethod
+    @read_only
+    def get_dto_by_id(videojuego_id, fields=None):
+        """
+        Obtiene un videojuego por su ID usando la caché del proceso.
+        
+        Las entradas guardan la versión del catálogo con la que se leyeron,
+        así que una escritura en cualquier worker las invalida. La fila se
+        lee con Core, sin crear un objeto ORM, y se guarda como VideojuegoDTO.
+        Con fields solo se leen esas columnas (más id y fecha_actualizacion,
+        que se necesitan para el validador HTTP), salvo que el videojuego
+        completo ya esté en caché.
+        
+        Args:
+            videojuego_id (int): ID del videojuego
+            fields (tuple): Campos a leer (None para todos)
+            
+        Returns:
+            VideojuegoDTO or None: Videojuego o None si no existe
+        """
+        version, cache_key, videojuego = VideojuegoService._get_cached_dto(videojuego_id, fields)
+        if videojuego is not None:
+            return videojuego
+        
+        row = db.session.execute(VideojuegoService._dto_statement(videojuego_id, fields)).mappings().first()
+        return VideojuegoService._cache_dto(version, cache_key, row)
+    
+    @staticmethod
+    def _get_cached_dto(videojuego_id, fields=None, version=None):
+        """
+        Busca un videojuego en la caché del proceso.
+        
+        Args:
+            videojuego_id (int): ID del videojuego
+            fields (tuple): Campos pedidos (None para todos)
+            version (int): Versión del catálogo ya leída (por defecto se lee)
+            
+        Returns:
+            tuple: (versión del catálogo, clave de caché, VideojuegoDTO o None)
+        """
+        # La versión se lee antes de consultar para no guardar datos obsoletos
+        # con una versión nueva si otro worker escribe entre medias
+        if version is None:
+            version = response_cache.get_version()
+        entry = videojuego_cache.get(videojuego_id)
+        if entry is not None and entry[0] == version:
+            return version, videojuego_id, entry[1]
+        
+        cache_key = (videojuego_id, fields) if fields else videojuego_id
+        if fields:
+            entry = videojuego_cache.get(cache_key)
+            if entry is not None and entry[0] == version:
+                return version, cache_key, entry[1]
+        
+        return version, cache_key, None
+    
+    @staticmethod
+    def _dto_statement(videojuego_id, fields=None):
+        """
+        Construye la consulta de un videojuego por ID.
+        
+        Args:
+            videojuego_id (int): ID del videojuego
+            fields (tuple): Campos a leer (None para todos)
+            
+        Returns:
+            Select: Consulta de las columnas pedidas más id y fecha_actualizacion
+        """
+        columns = VideojuegoService._list_columns(fields, extra=('id', 'fecha_actualizacion'))[0]
+        return select(*columns).where(Videojuego.id == videojuego_id)
+    
+    @staticmethod
+    def _cache_dto(version, cache_key, row):
+        """
+        Convierte la fila leída en VideojuegoDTO y la guarda en la caché del proceso.
+        
+        Args:
+            version (int): Versión del catálogo leída antes de la consulta
+            cache_key: Clave de caché de _get_cached_dto
+            row (RowMapping): Fila leída o None
+            
+        Returns:
+            VideojuegoDTO or None: Videojuego o None si no existe
+        """
+        if row is None:
+            return None
+        
+        videojuego = VideojuegoDTO.from_row(row)
+        videojuego_cache.set(cache_key, (version, videojuego))
+        return videojuego
+    
+    @staticmethod
+    @read_only
+    def read_rows(categoria=None, buscar=None, fields=None, limit=None, offset=0):
+        """
+        Lee videojuegos como filas ligeras de solo lectura.
+        
+        Usa un select() de Core sobre las columnas de los listados, por lo
+        que no se crean objetos ORM ni se registran en el identity map de
+        la sesión. Cada fila es un RowMapping (acceso por clave como un
+        diccionario) con el mismo orden que los listados.
+        
+        Args:
+            categoria (str): Filtro por categoría
+            buscar (str): Término de búsqueda
+            fields (tuple): Campos a leer (None para todos)
+            limit (int): Número máximo de filas (None para todas)
+            offset (int): Filas a saltar
+            
+        Returns:
+            list: Filas (RowMapping) con los campos pedidos
+        """
+        columns = VideojuegoService._list_columns(fields)[0]
+        stmt = VideojuegoService._apply_filters(select(*columns), categoria, buscar)
+        stmt = stmt.order_by(Videojuego.fecha_creacion.desc(), Videojuego.id.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
         
-        return {
-            'videojuegos': [videojuego.to_dict() for videojuego in pagination.items],
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'current_page': page,
-            'per_page': per_page,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        return db.session.execute(stmt).mappings().all()
     
     @staticmethod
-    def get_by_id(videojuego_id):
+    def row_to_dict(row):
         """
-        Obtiene un videojuego por su ID.
+        Convierte una fila de read_rows al formato de Videojuego.to_dict.
         
         Args:
-            videojuego_id (int): ID del videojuego
+            row (RowMapping): Fila leída con Core
             
         Returns:
-            Videojuego or None: El videojuego encontrado o None
+            dict: Datos del videojuego (fechas en ISO 8601)
         """
-        return Videojuego.query.get(videojuego_id)
+        return {
+            key: value.isoformat() if isinstance(value, datetime) else value
+            for key, value in row.items()
+        }
     
     @staticmethod
     def create(data):
@@ -82,7 +751,7 @@ class VideojuegoService:
             data (dict): Datos del videojuego
             
         Returns:
-            tuple: (videojuego, errors)
+            tuple: (VideojuegoDTO, errors)
         """
         # Validar datos
         is_valid, errors = Videojuego.validate_data(data)
@@ -98,13 +767,252 @@ class VideojuegoService:
             # Crear nuevo videojuego
             videojuego = Videojuego.from_dict(data)
             db.session.add(videojuego)
+            
+            delta = EstadisticasService.new_delta()
+            EstadisticasService.add_to_delta(delta, videojuego.categoria, videojuego.precio, videojuego.valoracion)
+            EstadisticasService.apply_delta(delta)
+            
             db.session.commit()
-            return videojuego, None
+            VideojuegoService._invalidate([videojuego.id], [(videojuego.id, videojuego.nombre)])
+            return VideojuegoDTO.from_model(videojuego), None
             
         except Exception as e:
             db.session.rollback()
             return None, [f'Error al crear el videojuego: {str(e)}']
     
+    @staticmethod
+    def bulk_upsert(items, batch_size=BULK_BATCH_SIZE):
+        """
+        Crea o actualiza muchos videojuegos en una sola transacción.
+        
+        Todos los elementos se validan en una pasada; los válidos se
+        insertan con INSERT ... ON CONFLICT (nombre) DO NOTHING de varias
+        filas por sentencia y los que ya existían se bloquean (SELECT ...
+        FOR UPDATE) y se actualizan. Así los valores anteriores que se
+        restan del resumen de estadísticas son los que se sobrescriben,
+        aunque otra petición escriba los mismos nombres a la vez. Si hay
+        nombres repetidos en el lote se aplica el último.
+        
+        Args:
+            items (list): Lista de diccionarios con datos de videojuegos
+            batch_size (int): Filas por sentencia INSERT
+            
+        Returns:
+            tuple: (results, errors)
+        """
+        results = [None] * len(items)
+        rows_by_nombre = {}
+        now = datetime.utcnow()
+        
+        # Validar todos los elementos en una sola pasada
+        for index, data in enumerate(items):
+            if not isinstance(data, dict):
+                results[index] = {'index': index, 'status': 'error', 'errors': ['El elemento debe ser un objeto']}
+                continue
+            
+            try:
+                is_valid, errors = Videojuego.validate_data(data)
+            except (AttributeError, TypeError):
+                is_valid, errors = False, ['El nombre y la categoría deben ser texto']
+            
+            if not is_valid:
+                results[index] = {'index': index, 'status': 'error', 'errors': errors}
+                continue
+            
+            nombre = data['nombre'].strip()
+            if nombre in rows_by_nombre:
+                previous_index = rows_by_nombre[nombre][0]
+                results[previous_index] = {
+                    'index': previous_index,
+                    'nombre': nombre,
+                    'status': 'skipped',
+                    'errors': ['Nombre repetido en el lote; se aplicó el último']
+                }
+            
+            rows_by_nombre[nombre] = (index, {
+                'nombre': nombre,
+                'categoria': data['categoria'].strip(),
+                'precio': data['precio'],
+                'valoracion': data['valoracion'],
+                'fecha_creacion': now,
+                'fecha_actualizacion': now
+            })
+        
+        if not rows_by_nombre:
+            return results, None
+        
+        try:
+            # Orden fijo de nombres para que dos cargas simultáneas tomen
+            # los bloqueos en el mismo orden
+            rows = sorted((row for _, row in rows_by_nombre.values()), key=lambda row: row['nombre'])
+            insert = get_upsert_insert()
+            
+            if insert is not None and db.engine.dialect.insert_returning:
+                # Lo que no se inserta es porque ya existía (aunque lo haya
+                # creado otra petición después de validar el lote)
+                table = Videojuego.__table__
+                ids = {}
+                for chunk in chunked(rows, batch_size):
+                    stmt = insert(table).values(chunk).on_conflict_do_nothing(
+                        index_elements=[table.c.nombre]
+                    ).returning(table.c.id, table.c.nombre)
+                    ids.update({nombre: videojuego_id for videojuego_id, nombre in db.session.execute(stmt)})
+                
+                existing = VideojuegoService._get_existing_by_nombre(
+                    [row['nombre'] for row in rows if row['nombre'] not in ids], batch_size, lock=True
+                )
+                VideojuegoService._update_existing(rows, existing, batch_size)
+                ids.update((nombre, previous[0]) for nombre, previous in existing.items())
+            else:
+                existing = VideojuegoService._get_existing_by_nombre(list(rows_by_nombre), batch_size, lock=True)
+                ids = VideojuegoService._bulk_upsert_fallback(rows, existing, batch_size)
+            
+            # Actualizar el resumen de estadísticas en la misma transacción
+            delta = EstadisticasService.new_delta()
+            for row in rows:
+                if row['nombre'] not in ids:
+                    continue
+                previous = existing.get(row['nombre'])
+                if previous:
+                    EstadisticasService.add_to_delta(delta, *previous[1:], sign=-1)
+                EstadisticasService.add_to_delta(delta, row['categoria'], row['precio'], row['valoracion'])
+            EstadisticasService.apply_delta(delta)
+            
+            db.session.commit()
+            
+        except Exception as e:
+            db.session.rollback()
+            return None, [f'Error en la carga masiva: {str(e)}']
+        
+        VideojuegoService._invalidate(
+            [previous[0] for previous in existing.values()],
+            [(ids[nombre], nombre) for nombre in rows_by_nombre if nombre not in existing and nombre in ids]
+        )
+        
+        for nombre, (index, _) in rows_by_nombre.items():
+            if nombre not in ids:
+                # Existía al insertar pero otra petición lo eliminó antes de bloquearlo
+                results[index] = {
+                    'index': index,
+                    'nombre': nombre,
+                    'status': 'error',
+                    'errors': ['El videojuego se eliminó durante la carga; vuelva a enviarlo']
+                }
+                continue
+            results[index] = {
+                'index': index,
+                'id': ids.get(nombre),
+                'nombre': nombre,
+                'status': 'updated' if nombre in existing else 'created'
+            }
+        
+        return results, None
+    
+    @staticmethod
+    def _get_existing_by_nombre(nombres, batch_size=BULK_BATCH_SIZE, lock=False):
+        """
+        Obtiene los videojuegos existentes con los nombres dados.
+        
+        Args:
+            nombres (list): Nombres a buscar
+            batch_size (int): Nombres por cláusula IN
+            lock (bool): Bloquear las filas hasta el final de la transacción (FOR UPDATE)
+            
+        Returns:
+            dict: Mapa nombre -> (id, categoria, precio, valoracion)
+        """
+        existing = {}
+        for chunk in chunked(nombres, batch_size):
+            stmt = VideojuegoService._existing_by_nombre_statement(chunk, lock)
+            existing.update((row[0], tuple(row[1:])) for row in db.session.execute(stmt))
+        return existing
+    
+    @staticmethod
+    def _existing_by_nombre_statement(nombres, lock=False):
+        """
+        Construye la consulta de los videojuegos existentes con los nombres dados.
+        
+        Args:
+            nombres (list): Nombres a buscar
+            lock (bool): Bloquear las filas (FOR UPDATE)
+            
+        Returns:
+            Select: Consulta de nombre, id, categoria, precio y valoracion
+        """
+        stmt = select(
+            Videojuego.nombre,
+            Videojuego.id,
+            Videojuego.categoria,
+            Videojuego.precio,
+            Videojuego.valoracion
+        ).where(Videojuego.nombre.in_(nombres))
+        return stmt.with_for_update() if lock else stmt
+    
+    @staticmethod
+    def _get_ids_by_nombre(nombres, batch_size=BULK_BATCH_SIZE):
+        """
+        Obtiene los IDs de los videojuegos existentes con los nombres dados.
+        
+        Args:
+            nombres (list): Nombres a buscar
+            batch_size (int): Nombres por cláusula IN
+            
+        Returns:
+            dict: Mapa nombre -> id
+        """
+        ids = {}
+        for chunk in chunked(nombres, batch_size):
+            stmt = select(Videojuego.nombre, Videojuego.id).where(Videojuego.nombre.in_(chunk))
+            ids.update((nombre, videojuego_id) for nombre, videojuego_id in db.session.execute(stmt))
+        return ids
+    
+    @staticmethod
+    def _bulk_upsert_fallback(rows, existing, batch_size=BULK_BATCH_SIZE):
+        """
+        Carga masiva para motores sin INSERT ... ON CONFLICT ... RETURNING.
+        
+        Args:
+            rows (list): Filas validadas
+            existing (dict): Videojuegos existentes indexados por nombre
+            batch_size (int): Filas por sentencia
+            
+        Returns:
+            dict: Mapa nombre -> id de todas las filas escritas
+        """
+        new_rows = [row for row in rows if row['nombre'] not in existing]
+        for chunk in chunked(new_rows, batch_size):
+            db.session.execute(Videojuego.__table__.insert(), chunk)
+        
+        VideojuegoService._update_existing(rows, existing, batch_size)
+        return VideojuegoService._get_ids_by_nombre([row['nombre'] for row in rows], batch_size)
+    
+    @staticmethod
+    def _update_existing(rows, existing, batch_size=BULK_BATCH_SIZE):
+        """
+        Actualiza por nombre las filas del lote que ya existían.
+        
+        Args:
+            rows (list): Filas validadas
+            existing (dict): Videojuegos existentes indexados por nombre
+            batch_size (int): Filas por sentencia
+        """
+        table = Videojuego.__table__
+        updated_rows = [
+            {
+                'b_nombre': row['nombre'],
+                'categoria': row['categoria'],
+                'precio': row['precio'],
+                'valoracion': row['valoracion'],
+                'fecha_actualizacion': row['fecha_actualizacion']
+            }
+            for row in rows if row['nombre'] in existing
+        ]
+        
+        # Las claves de cada fila definen las columnas del SET (executemany)
+        stmt = update(table).where(table.c.nombre == bindparam('b_nombre'))
+        for chunk in chunked(updated_rows, batch_size):
+            db.session.execute(stmt, chunk)
+    
     @staticmethod
     def update(videojuego_id, data):
         """
@@ -115,9 +1023,11 @@ class VideojuegoService:
             data (dict): Datos a actualizar
             
         Returns:
-            tuple: (videojuego, errors)
+            tuple: (VideojuegoDTO, errors)
         """
-        videojuego = Videojuego.query.get(videojuego_id)
+        # La fila queda bloqueada hasta el commit: los valores que se restan
+        # del resumen de estadísticas son los que se van a sobrescribir
+        videojuego = db.session.get(Videojuego, videojuego_id, with_for_update=True, populate_existing=True)
         if not videojuego:
             return None, ['Videojuego no encontrado']
         
@@ -158,10 +1068,20 @@ class VideojuegoService:
         
         try:
             # Actualizar videojuego
+            delta = EstadisticasService.new_delta()
+            EstadisticasService.add_to_delta(delta, videojuego.categoria, videojuego.precio, videojuego.valoracion, sign=-1)
             videojuego.update_from_dict(data)
+            EstadisticasService.add_to_delta(delta, videojuego.categoria, videojuego.precio, videojuego.valoracion)
+            EstadisticasService.apply_delta(delta)
+            
             db.session.commit()
-            return videojuego, None
+            VideojuegoService._invalidate([videojuego_id], [(videojuego_id, videojuego.nombre)])
+            return VideojuegoDTO.from_model(videojuego), None
             
+        except StaleDataError:
+            # Otra petición lo eliminó (motores sin FOR UPDATE, como SQLite)
+            db.session.rollback()
+            return None, ['Videojuego no encontrado']
         except Exception as e:
             db.session.rollback()
             return None, [f'Error al actualizar el videojuego: {str(e)}']
@@ -177,13 +1097,26 @@ class VideojuegoService:
         Returns:
             tuple: (success, errors)
         """
-        videojuego = Videojuego.query.get(videojuego_id)
+        videojuego = db.session.get(Videojuego, videojuego_id, with_for_update=True, populate_existing=True)
         if not videojuego:
             return False, ['Videojuego no encontrado']
         
         try:
-            db.session.delete(videojuego)
+            # Solo se resta del resumen si este DELETE eliminó la fila (dos
+            # DELETE simultáneos en motores sin FOR UPDATE la leen ambos)
+            table = Videojuego.__table__
+            result = db.session.execute(delete(table).where(table.c.id == videojuego_id))
+            if result.rowcount == 0:
+                db.session.rollback()
+                return False, ['Videojuego no encontrado']
+            db.session.expunge(videojuego)
+            
+            delta = EstadisticasService.new_delta()
+            EstadisticasService.add_to_delta(delta, videojuego.categoria, videojuego.precio, videojuego.valoracion, sign=-1)
+            EstadisticasService.apply_delta(delta)
+            
             db.session.commit()
+            VideojuegoService._invalidate([videojuego_id], [(videojuego_id, None)])
             return True, None
             
         except Exception as e:
@@ -191,41 +1124,455 @@ class VideojuegoService:
             return False, [f'Error al eliminar el videojuego: {str(e)}']
     
     @staticmethod
+    def _invalidate(videojuego_ids, name_changes=None):
+        """
+        Invalida las cachés tras una escritura confirmada.
+        
+        Elimina las entradas locales de los IDs afectados, incrementa la
+        versión del catálogo para que todos los workers descarten sus
+        listados, categorías y estadísticas, y actualiza el índice de
+        autocompletado del proceso.
+        
+        Args:
+            videojuego_ids (iterable): IDs de los videojuegos modificados
+            name_changes (list): Pares (id, nombre) para el autocompletado;
+                nombre None indica borrado
+        """
+        for videojuego_id in videojuego_ids:
+            videojuego_cache.delete(videojuego_id)
+        version = response_cache.bump_version()
+        AutocompleteService.apply(name_changes or [], version)
+    
+    @staticmethod
+    def get_catalog_validator():
+        """
+        Obtiene el validador HTTP (ETag y Last-Modified) del catálogo.
+        
+        Se deriva de la versión de la caché compartida, que incrementa
+        cualquier escritura de la API en cualquier worker, y del estado del
+        catálogo (total y última fecha de actualización) guardado para esa
+        versión. El estado se lee de la base de datos principal una sola
+        vez por versión; el resto de peticiones no hacen ninguna consulta.
+        
+        Las escrituras hechas fuera de la API no incrementan la versión:
+        cada proceso las busca como mucho una vez cada CATALOG_CHECK_SECONDS
+        (ver _check_catalog_state).
+        
+        Returns:
+            dict: Validador creado con build_validator
+        """
+        version = response_cache.get_version()
+        if catalog_check.due():
+            version = VideojuegoService._check_catalog_state(version, VideojuegoService._load_catalog_state())
+        
+        state = response_cache.get_or_set('validador', VideojuegoService._load_catalog_state, version=version)
+        return VideojuegoService._catalog_validator(version, state)
+    
+    @staticmethod
+    def _check_catalog_state(version, state):
+        """
+        Compara el estado actual del catálogo con el guardado para su versión.
+        
+        Si no coincide, el catálogo cambió sin pasar por la API y se
+        incrementa la versión para que ningún worker siga sirviendo las
+        respuestas en caché. El estado debe leerse de la base de datos
+        principal: el de una réplica con retraso no coincidiría e
+        invalidaría la caché en cada comprobación.
+        
+        Args:
+            version (int): Versión actual del catálogo
+            state (dict): Estado de _catalog_state leído de la principal
+            
+        Returns:
+            int: Versión del catálogo tras la comprobación
+        """
+        known = response_cache.backend.get(response_cache.make_key('validador', version=version))
+        if known is not None and known != state:
+            logger.info('El catálogo cambió fuera de la API; se invalida la caché compartida')
+            version = response_cache.bump_version()
+            known = None
+        if known is None:
+            response_cache.backend.set(response_cache.make_key('validador', version=version), state, ttl=response_cache.ttl)
+        return version
+    
+    @staticmethod
+    def _catalog_validator(version, state):
+        """
+        Construye el validador del catálogo para una versión y su estado.
+        
+        Args:
+            version (int): Versión del catálogo
+            state (dict): Estado de _catalog_state
+            
+        Returns:
+            dict: Validador creado con build_validator
+        """
+        return build_validator(state['last_modified'], 'catalogo', version, state['total'], state['last_modified'])
+    
+    @staticmethod
+    def _load_catalog_state():
+        """
+        Lee el estado del catálogo usando el índice de fecha_actualizacion y el resumen.
+        
+        No se marca con @read_only: el estado se lee siempre de la principal.
+        
+        Returns:
+            dict: Total de videojuegos y última fecha de actualización (ISO)
+        """
+        last_modified = db.session.execute(VideojuegoService._last_modified_statement()).scalar()
+        return VideojuegoService._catalog_state(EstadisticasService.get_summary(), last_modified)
+    
+    @staticmethod
+    def _last_modified_statement():
+        """
+        Construye la consulta de la última fecha de actualización del catálogo.
+        
+        Returns:
+            Select: MAX(fecha_actualizacion), resuelto con su índice
+        """
+        return select(db.func.max(Videojuego.fecha_actualizacion))
+    
+    @staticmethod
+    def _catalog_state(summary, last_modified):
+        """
+        Construye el estado del catálogo del que se deriva su validador HTTP.
+        
+        Args:
+            summary (dict): Resumen de EstadisticasService.get_summary
+            last_modified (datetime): Última fecha de actualización o None
+            
+        Returns:
+            dict: Total de videojuegos y última fecha de actualización (ISO)
+        """
+        return {
+            'total': summary['total_videojuegos'],
+            'last_modified': last_modified.isoformat() if last_modified else None
+        }
+    
+    @staticmethod
+    @read_only
     def get_categories():
         """
-        Obtiene todas las categorías únicas de videojuegos.
+        Obtiene todas las categorías únicas de videojuegos usando la caché compartida.
         
         Returns:
             list: Lista de categorías
         """
-        categories = db.session.query(Videojuego.categoria).distinct().all()
-        return [cat[0] for cat in categories if cat[0]]
+        return response_cache.get_or_set('categorias', EstadisticasService.get_categories)
+    
+    @staticmethod
+    @read_only
+    def get_statistics(group_by=None, percentiles=False):
+        """
+        Obtiene estadísticas de los videojuegos usando la caché compartida.
+        
+        Args:
+            group_by (str): Agrupación adicional ('categoria' o None)
+            percentiles (bool): Incluir percentiles del precio
+            
+        Returns:
+            dict: Estadísticas
+        """
+        return response_cache.get_or_set(
+            'estadisticas',
+            lambda: VideojuegoService._load_statistics(group_by, percentiles),
+            params={'group_by': group_by, 'percentiles': percentiles}
+        )
     
     @staticmethod
-    def get_statistics():
+    def _load_statistics(group_by=None, percentiles=False):
         """
-        Obtiene estadísticas básicas de los videojuegos.
+        Calcula las estadísticas de los videojuegos.
+        
+        Las estadísticas globales se leen del resumen materializado. El
+        desglose por categoría (con mínimos y máximos) y los percentiles
+        requieren recorrer la tabla: los totales se obtienen entonces con
+        una única consulta agregada y el desglose con un único GROUP BY.
         
+        Args:
+            group_by (str): Agrupación adicional ('categoria' o None)
+            percentiles (bool): Incluir percentiles del precio
+            
         Returns:
             dict: Estadísticas
         """
-        total = Videojuego.query.count()
-        if total == 0:
-            return {
-                'total_videojuegos': 0,
-                'categorias_unicas': 0,
-                'precio_promedio': 0,
-                'valoracion_promedio': 0
-            }
+        # Sin desglose ni percentiles basta con el resumen materializado
+        if not group_by and not percentiles:
+            return EstadisticasService.get_summary()
         
-        # Estadísticas básicas
-        precio_promedio = db.session.query(db.func.avg(Videojuego.precio)).scalar()
-        valoracion_promedio = db.session.query(db.func.avg(Videojuego.valoracion)).scalar()
-        categorias_unicas = db.session.query(Videojuego.categoria).distinct().count()
+        use_sql_percentiles = percentiles and db.engine.dialect.name == 'postgresql'
         
-        return {
+        columns = [
+            db.func.count(Videojuego.id),
+            db.func.count(db.distinct(Videojuego.categoria)),
+            db.func.avg(Videojuego.precio),
+            db.func.avg(Videojuego.valoracion)
+        ]
+        if use_sql_percentiles:
+            columns += VideojuegoService._percentile_columns()
+        
+        row = db.session.execute(select(*columns)).one()
+        total, categorias_unicas, precio_promedio, valoracion_promedio = row[:4]
+        
+        stats = {
             'total_videojuegos': total,
             'categorias_unicas': categorias_unicas,
             'precio_promedio': float(precio_promedio) if precio_promedio else 0,
             'valoracion_promedio': float(valoracion_promedio) if valoracion_promedio else 0
         }
+        
+        breakdown = None
+        if group_by == 'categoria':
+            breakdown = VideojuegoService._load_category_breakdown(use_sql_percentiles)
+            stats['por_categoria'] = breakdown
+        
+        if percentiles:
+            if use_sql_percentiles:
+                stats['percentiles_precio'] = VideojuegoService._percentiles_from_row(row[4:])
+            else:
+                VideojuegoService._compute_percentiles(stats, breakdown)
+        
+        return stats
+    
+    @staticmethod
+    def _load_category_breakdown(use_sql_percentiles=False):
+        """
+        Calcula las estadísticas por categoría con una consulta GROUP BY.
+        
+        Args:
+            use_sql_percentiles (bool): Calcular los percentiles en la base de datos
+            
+        Returns:
+            list: Estadísticas de cada categoría
+        """
+        columns = [
+            Videojuego.categoria,
+            db.func.count(Videojuego.id),
+            db.func.avg(Videojuego.precio),
+            db.func.min(Videojuego.precio),
+            db.func.max(Videojuego.precio),
+            db.func.avg(Videojuego.valoracion)
+        ]
+        if use_sql_percentiles:
+            columns += VideojuegoService._percentile_columns()
+        
+        stmt = select(*columns).group_by(Videojuego.categoria).order_by(Videojuego.categoria)
+        
+        breakdown = []
+        for row in db.session.execute(stmt):
+            categoria, total, precio_promedio, precio_min, precio_max, valoracion_promedio = row[:6]
+            item = {
+                'categoria': categoria,
+                'total_videojuegos': total,
+                'precio_promedio': float(precio_promedio),
+                'precio_min': float(precio_min),
+                'precio_max': float(precio_max),
+                'valoracion_promedio': float(valoracion_promedio)
+            }
+            if use_sql_percentiles:
+                item['percentiles_precio'] = VideojuegoService._percentiles_from_row(row[6:])
+            breakdown.append(item)
+        
+        return breakdown
+    
+    @staticmethod
+    def _percentile_columns():
+        """
+        Construye las columnas percentile_cont de PostgreSQL para el precio.
+        
+        Returns:
+            list: Expresiones de percentiles
+        """
+        return [
+            db.func.percentile_cont(fraction).within_group(Videojuego.precio.asc())
+            for fraction in PRICE_PERCENTILES
+        ]
+    
+    @staticmethod
+    def _percentiles_from_row(values):
+        """
+        Convierte los valores de percentiles de una fila en diccionario.
+        
+        Args:
+            values (tuple): Valores en el orden de PRICE_PERCENTILES
+            
+        Returns:
+            dict: Percentiles por nombre (p25, p50...)
+        """
+        return {
+            f'p{int(fraction * 100)}': float(value) if value is not None else 0
+            for fraction, value in zip(PRICE_PERCENTILES, values)
+        }
+    
+    @staticmethod
+    def _compute_percentiles(stats, breakdown=None):
+        """
+        Calcula los percentiles del precio en Python para motores sin percentile_cont.
+        
+        Lee solo la columna de precio ordenada y usa interpolación lineal,
+        igual que percentile_cont de PostgreSQL.
+        
+        Args:
+            stats (dict): Estadísticas globales a completar
+            breakdown (list): Estadísticas por categoría a completar
+        """
+        stmt = select(Videojuego.categoria, Videojuego.precio).order_by(Videojuego.precio)
+        all_prices = []
+        prices_by_category = {}
+        for categoria, precio in db.session.execute(stmt):
+            all_prices.append(float(precio))
+            prices_by_category.setdefault(categoria, []).append(float(precio))
+        
+        stats['percentiles_precio'] = VideojuegoService._interpolate_percentiles(all_prices)
+        for item in breakdown or []:
+            item['percentiles_precio'] = VideojuegoService._interpolate_percentiles(
+                prices_by_category.get(item['categoria'], [])
+            )
+    
+    @staticmethod
+    def _interpolate_percentiles(sorted_values):
+        """
+        Calcula percentiles con interpolación lineal sobre valores ordenados.
+        
+        Args:
+            sorted_values (list): Valores ordenados de menor a mayor
+            
+        Returns:
+            dict: Percentiles por nombre (p25, p50...)
+        """
+        percentiles = {}
+        for fraction in PRICE_PERCENTILES:
+            name = f'p{int(fraction * 100)}'
+            if not sorted_values:
+                percentiles[name] = 0
+                continue
+            
+            position = fraction * (len(sorted_values) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(sorted_values) - 1)
+            weight = position - lower
+            percentiles[name] = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * weight
+        
+        return percentiles
+    
+    # Lecturas del modo asíncrono (src/wsgi/asgi.py). Comparten consultas,
+    # claves de caché y formato de resultado con sus versiones síncronas
+    
+    @staticmethod
+    async def get_page_async(session, categoria=None, buscar=None, limit=50, cursor=None, include_total=True, fields=None):
+        """
+        Versión asíncrona de get_page.
+        
+        Args:
+            session (AsyncSession): Sesión asíncrona de la petición
+            categoria (str): Filtro por categoría
+            buscar (str): Búsqueda en nombre y categoría
+            limit (int): Elementos por página
+            cursor (tuple): Posición (fecha_creacion, id) del último elemento visto
+            include_total (bool): Ejecutar el COUNT para obtener el total
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados de la página y cursor siguiente codificado
+        """
+        async def load():
+            # Deja calculada la disponibilidad de los índices para _categoria_filter
+            await is_search_available_async(session)
+            total = (await session.execute(VideojuegoService._count_statement(categoria, buscar))).scalar() if include_total else None
+            stmt, keys = VideojuegoService._page_statement(categoria, buscar, limit, cursor, fields)
+            rows = (await session.execute(stmt)).all()
+            return VideojuegoService._page_result(rows, keys, total, limit)
+        
+        return await response_cache.get_or_set_async(
+            'pagina',
+            load,
+            params={
+                'categoria': categoria,
+                'buscar': buscar,
+                'limit': limit,
+                'cursor': encode_cursor(*cursor) if cursor else None,
+                'include_total': include_total,
+                'fields': ','.join(fields) if fields else None
+            }
+        )
+    
+    @staticmethod
+    async def search_async(session, buscar, categoria=None, limit=50, include_total=True, fields=None):
+        """
+        Versión asíncrona de search.
+        
+        Args:
+            session (AsyncSession): Sesión asíncrona de la petición
+            buscar (str): Texto a buscar (cada palabra se trata como prefijo)
+            categoria (str): Filtro por categoría
+            limit (int): Número máximo de resultados
+            include_total (bool): Contar el total de coincidencias
+            fields (tuple): Campos a devolver (None para todos)
+            
+        Returns:
+            dict: Resultados ordenados por relevancia
+        """
+        async def load():
+            available = await is_search_available_async(session)
+            total = None
+            if include_total:
+                stmt = VideojuegoService._search_count_statement(buscar, categoria, available)
+                total = (await session.execute(stmt)).scalar()
+            stmt, keys = VideojuegoService._search_statement(buscar, categoria, limit, fields, available)
+            rows = (await session.execute(stmt)).all()
+            return VideojuegoService._search_result(rows, keys, total, limit)
+        
+        return await response_cache.get_or_set_async(
+            'busqueda',
+            load,
+            params={
+                'buscar': buscar,
+                'categoria': categoria,
+                'limit': limit,
+                'include_total': include_total,
+                'fields': ','.join(fields) if fields else None
+            }
+        )
+    
+    @staticmethod
+    async def get_dto_by_id_async(session, videojuego_id, fields=None):
+        """
+        Versión asíncrona de get_dto_by_id (comparte la caché del proceso).
+        
+        Args:
+            session (AsyncSession): Sesión asíncrona de la petición
+            videojuego_id (int): ID del videojuego
+            fields (tuple): Campos a leer (None para todos)
+            
+        Returns:
+            VideojuegoDTO or None: Videojuego o None si no existe
+        """
+        version = await response_cache.get_version_async()
+        version, cache_key, videojuego = VideojuegoService._get_cached_dto(videojuego_id, fields, version)
+        if videojuego is not None:
+            return videojuego
+        
+        result = await session.execute(VideojuegoService._dto_statement(videojuego_id, fields))
+        return VideojuegoService._cache_dto(version, cache_key, result.mappings().first())
+    
+    @staticmethod
+    async def get_catalog_validator_async(session):
+        """
+        Versión asíncrona de get_catalog_validator.
+        
+        Args:
+            session (AsyncSession): Sesión asíncrona de la petición
+            
+        Returns:
+            dict: Validador creado con build_validator
+        """
+        async def load():
+            last_modified = (await session.execute(VideojuegoService._last_modified_statement())).scalar()
+            return VideojuegoService._catalog_state(await EstadisticasService.get_summary_async(session), last_modified)
+        
+        version = await response_cache.get_version_async()
+        if catalog_check.due():
+            version = await response_cache.run_async(VideojuegoService._check_catalog_state, version, await load())
+        
+        state = await response_cache.get_or_set_async('validador', load, version=version)
+        return VideojuegoService._catalog_validator(version, state)
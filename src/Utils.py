@@ -1,28 +1,51 @@
 """
 Utilidades generales para la API.
 """
-from datetime import datetime
-from flask import jsonify
+from datetime import datetime, timezone
+from flask import Response, jsonify, request
+from src.Config.Json import json_response
+import base64
+import hashlib
+import json
 import os
 
-def create_response(success=True, message="", data=None, count=None, status_code=200):
+# Fecha usada como marca de tiempo de las respuestas de un catálogo vacío
+EPOCH = datetime(1970, 1, 1)
+
+# Sufijos que el middleware de compresión añade al ETag de cada codificación
+ETAG_ENCODING_SUFFIXES = ('gzip', 'br')
+
+def create_response(success=True, message="", data=None, count=None, status_code=200, pagination=None, validator=None):
     """
     Crea una respuesta estándar para la API.
     
+    Con un validador, la respuesta incluye las cabeceras ETag y
+    Last-Modified y el timestamp pasa a ser la fecha de la última
+    modificación de los datos, de modo que el cuerpo es idéntico mientras
+    los datos no cambien (requisito de un ETag fuerte). Si data es un
+    RawJSON (texto ya serializado) se inserta sin volver a serializarlo.
+    
     Args:
         success (bool): Indica si la operación fue exitosa
         message (str): Mensaje descriptivo de la operación
         data: Datos a incluir en la respuesta
         count (int): Número de elementos (para listas)
         status_code (int): Código de estado HTTP
+        pagination (dict): Metadatos de paginación por cursor
+        validator (dict): Validador creado con build_validator
         
     Returns:
         tuple: (response, status_code)
     """
+    if validator is not None:
+        timestamp = _to_naive_utc(validator['last_modified'] or EPOCH)
+    else:
+        timestamp = datetime.now()
+    
     response = {
         'success': success,
         'message': message,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': timestamp.isoformat()
     }
     
     if data is not None:
@@ -31,7 +54,126 @@ def create_response(success=True, message="", data=None, count=None, status_code
     if count is not None:
         response['count'] = count
     
-    return jsonify(response), status_code
+    if pagination is not None:
+        response['pagination'] = pagination
+    
+    response = json_response(response)
+    if validator is not None:
+        set_validator_headers(response, validator)
+    
+    return response, status_code
+
+def _to_naive_utc(value):
+    """
+    Convierte una fecha a UTC sin zona horaria (las fechas sin zona se asumen UTC).
+    
+    Args:
+        value (datetime): Fecha a convertir
+        
+    Returns:
+        datetime: Fecha en UTC sin zona horaria
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def build_validator(last_modified, *parts):
+    """
+    Crea el validador de una respuesta condicional.
+    
+    Args:
+        last_modified (datetime or str): Última modificación de los datos (None si no hay)
+        *parts: Valores que identifican la versión de los datos
+        
+    Returns:
+        dict: Validador con el ETag (sin comillas) y la fecha de modificación
+    """
+    if isinstance(last_modified, str):
+        last_modified = datetime.fromisoformat(last_modified)
+    
+    key = '|'.join(str(part) for part in parts)
+    return {
+        'etag': hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest(),
+        'last_modified': last_modified
+    }
+
+def set_validator_headers(response, validator):
+    """
+    Añade las cabeceras ETag, Last-Modified y Cache-Control a una respuesta.
+    
+    Cache-Control: no-cache permite a clientes y CDN guardar la respuesta
+    pero obliga a revalidarla, que es lo que produce las respuestas 304.
+    
+    Args:
+        response: Respuesta de Flask
+        validator (dict): Validador creado con build_validator
+    """
+    response.set_etag(validator['etag'])
+    if validator['last_modified'] is not None:
+        response.last_modified = _to_naive_utc(validator['last_modified']).replace(tzinfo=timezone.utc)
+    response.headers['Cache-Control'] = 'no-cache'
+
+def is_not_modified(validator):
+    """
+    Comprueba si la petición condicional coincide con la versión actual.
+    
+    If-None-Match tiene prioridad sobre If-Modified-Since, que solo se
+    evalúa si el cliente no envía ETags. Last-Modified tiene resolución
+    de segundos, por eso la fecha se trunca antes de comparar.
+    
+    Args:
+        validator (dict): Validador creado con build_validator
+        
+    Returns:
+        bool: True si se puede responder 304 Not Modified
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    
+    if request.if_none_match:
+        return _matching_etag(validator) is not None
+    
+    if validator['last_modified'] is not None and request.if_modified_since is not None:
+        last_modified = _to_naive_utc(validator['last_modified']).replace(microsecond=0, tzinfo=timezone.utc)
+        return last_modified <= request.if_modified_since
+    
+    return False
+
+def _matching_etag(validator):
+    """
+    Busca en If-None-Match el ETag del validador o una de sus variantes comprimidas.
+    
+    Args:
+        validator (dict): Validador creado con build_validator
+        
+    Returns:
+        str or None: ETag que envió el cliente o None si no coincide
+    """
+    etag = validator['etag']
+    for candidate in (etag, *(f'{etag}-{suffix}' for suffix in ETAG_ENCODING_SUFFIXES)):
+        if request.if_none_match.contains_weak(candidate):
+            return candidate
+    return None
+
+def create_not_modified_response(validator):
+    """
+    Crea una respuesta 304 Not Modified sin cuerpo.
+    
+    Args:
+        validator (dict): Validador creado con build_validator
+        
+    Returns:
+        tuple: (response, status_code)
+    """
+    response = Response(status=304)
+    set_validator_headers(response, validator)
+    
+    # Se devuelve la variante que tiene el cliente (por ejemplo la comprimida)
+    matched = _matching_etag(validator) if request.if_none_match else None
+    if matched:
+        response.set_etag(matched)
+    
+    return response, 304
 
 def create_error_response(message, status_code=400, errors=None):
     """
@@ -69,10 +211,15 @@ def get_api_info():
         'description': os.getenv('API_DESCRIPTION', 'API REST para gestión de videojuegos'),
         'endpoints': {
             'info': 'GET /api/',
+            'metrics': 'GET /api/metrics',
+            'prometheus': 'GET /metrics',
             'swagger': 'GET /apidocs/',
             'videojuegos': {
                 'list': 'GET /api/videojuegos',
+                'export': 'GET /api/videojuegos/export',
+                'autocomplete': 'GET /api/videojuegos/autocomplete?q={texto}',
                 'create': 'POST /api/videojuegos',
+                'bulk': 'POST /api/videojuegos/bulk',
                 'get': 'GET /api/videojuegos/{id}',
                 'update': 'PUT /api/videojuegos/{id}',
                 'delete': 'DELETE /api/videojuegos/{id}'
@@ -103,6 +250,115 @@ def validate_pagination_params(page=1, per_page=10):
         
     return page, per_page
 
+def validate_limit_param(limit, default=50, max_limit=500):
+    """
+    Valida y normaliza el parámetro limit de la paginación por cursor.
+    
+    Args:
+        limit: Valor recibido en la petición
+        default (int): Valor por defecto si no es válido
+        max_limit (int): Máximo de elementos permitidos por página
+        
+    Returns:
+        int: Límite normalizado
+    """
+    try:
+        return max(1, min(max_limit, int(limit)))
+    except (ValueError, TypeError):
+        return default
+
+def parse_bool_param(value, default=False):
+    """
+    Interpreta un parámetro de consulta como booleano.
+    
+    Args:
+        value (str): Valor recibido en la petición
+        default (bool): Valor si el parámetro no está presente
+        
+    Returns:
+        bool: Valor booleano interpretado
+    """
+    if value is None or value == '':
+        return default
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'si', 'sí')
+
+def parse_fields_param(value, allowed):
+    """
+    Interpreta el parámetro fields (lista de campos separados por comas).
+    
+    Los campos se devuelven en el orden de allowed y sin duplicados, de
+    modo que la misma selección produce siempre la misma consulta y la
+    misma clave de caché.
+    
+    Args:
+        value (str): Valor recibido en la petición
+        allowed (tuple): Campos válidos en su orden canónico
+    
+    Returns:
+        tuple or None: Campos pedidos o None si se piden todos
+    
+    Raises:
+        ValueError: Si algún campo no es válido
+    """
+    if value is None or not value.strip():
+        return None
+    
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    unknown = sorted(requested.difference(allowed))
+    if unknown:
+        raise ValueError(f"Campos no válidos: {', '.join(unknown)}")
+    
+    fields = tuple(field for field in allowed if field in requested)
+    return None if len(fields) == len(allowed) else fields
+
+def encode_cursor(fecha_creacion, videojuego_id):
+    """
+    Codifica la posición (fecha_creacion, id) como un cursor opaco.
+    
+    Args:
+        fecha_creacion (datetime): Fecha de creación del último elemento
+        videojuego_id (int): ID del último elemento
+        
+    Returns:
+        str: Cursor codificado en base64 url-safe
+    """
+    payload = json.dumps([fecha_creacion.isoformat(), videojuego_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor opaco generado por encode_cursor.
+    
+    Args:
+        cursor (str): Cursor recibido en la petición
+        
+    Returns:
+        tuple: (fecha_creacion, videojuego_id)
+        
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        fecha, videojuego_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(fecha), int(videojuego_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError('Cursor inválido') from e
+
+def chunked(items, size):
+    """
+    Divide una lista en bloques de tamaño fijo.
+    
+    Args:
+        items (list): Elementos a dividir
+        size (int): Tamaño máximo de cada bloque
+        
+    Yields:
+        list: Bloque de elementos
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 def clean_string(value):
     """
     Limpia y normaliza una cadena de texto.
@@ -0,0 +1,196 @@
+"""
+Punto de entrada ASGI (modo asíncrono opcional).
+
+Las lecturas más frecuentes (listado y detalle de videojuegos) se sirven
+con vistas asíncronas sobre una AsyncSession, de modo que un solo proceso
+mantiene muchas consultas en curso a la vez sin bloquear un hilo por
+petición. El resto de rutas (escrituras, exportación, documentación...)
+se ejecutan con la aplicación WSGI en el pool de hilos de asgiref.
+
+Requiere los paquetes opcionales de requirements-async.txt (asgiref,
+uvicorn y los drivers asíncronos asyncpg y aiosqlite):
+
+    pip install -r requirements-async.txt
+    uvicorn src.wsgi.asgi:application --host 0.0.0.0 --port 5000
+"""
+import io
+import sys
+from pathlib import Path
+
+# Agregar el directorio raíz del proyecto al path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import request
+from werkzeug.exceptions import HTTPException
+from app import create_app
+from src.Config.AsyncDatabase import close_async_session, dispose_async_engine, init_async_db
+from src.Controllers.VideojuegoController import VideojuegoController
+
+# Crear la aplicación Flask y el motor asíncrono
+flask_app = create_app()
+init_async_db(flask_app)
+
+# Vistas asíncronas por endpoint de Flask; el resto usa la ruta WSGI
+ASYNC_VIEWS = {
+    'videojuegos.get_videojuegos': VideojuegoController.get_all_async,
+    'videojuegos.get_videojuego': VideojuegoController.get_by_id_async,
+}
+
+# Métodos que pueden servir las vistas asíncronas
+ASYNC_METHODS = ('GET', 'HEAD')
+
+wsgi_application = WsgiToAsgi(flask_app)
+
+def build_environ(scope):
+    """
+    Construye el entorno WSGI de una petición ASGI sin cuerpo.
+    
+    Args:
+        scope (dict): Scope HTTP de ASGI
+    
+    Returns:
+        dict: Entorno WSGI para el contexto de petición de Flask
+    """
+    script_name = scope.get('root_path', '').encode('utf-8').decode('latin-1')
+    path_info = scope['path'].encode('utf-8').decode('latin-1')
+    if path_info.startswith(script_name):
+        path_info = path_info[len(script_name):]
+    
+    server = scope.get('server') or ('localhost', 80)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': script_name,
+        'PATH_INFO': path_info,
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+    
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        key = name if name in ('CONTENT_TYPE', 'CONTENT_LENGTH') else f'HTTP_{name}'
+        value = value.decode('latin-1')
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+def match_async_view(environ):
+    """
+    Busca la vista asíncrona que corresponde a una petición.
+    
+    Args:
+        environ (dict): Entorno WSGI de la petición
+    
+    Returns:
+        callable or None: Vista asíncrona o None si la ruta usa la aplicación WSGI
+    """
+    if environ['REQUEST_METHOD'] not in ASYNC_METHODS:
+        return None
+    try:
+        endpoint, _ = flask_app.url_map.bind_to_environ(environ).match()
+    except HTTPException:
+        return None
+    return ASYNC_VIEWS.get(endpoint)
+
+async def dispatch_async(view, environ):
+    """
+    Ejecuta una vista asíncrona con el ciclo de petición de Flask.
+    
+    Los before_request y after_request registrados (réplicas, perfilado,
+    métricas, compresión, log de acceso...) se aplican igual que en WSGI.
+    
+    Args:
+        view (callable): Vista asíncrona
+        environ (dict): Entorno WSGI de la petición
+    
+    Returns:
+        Response: Respuesta de Flask ya procesada
+    """
+    with flask_app.request_context(environ):
+        try:
+            rv = flask_app.preprocess_request()
+            if rv is None:
+                rv = await view(**request.view_args)
+        except Exception as e:
+            rv = flask_app.handle_user_exception(e)
+        finally:
+            await close_async_session()
+        return flask_app.finalize_request(rv)
+
+async def send_response(response, send, head=False):
+    """
+    Envía una respuesta de Flask por ASGI.
+    
+    Args:
+        response (Response): Respuesta procesada
+        send (callable): Canal de envío de ASGI
+        head (bool): No enviar el cuerpo (peticiones HEAD)
+    """
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': response.status_code,
+            'headers': [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in response.headers.items()
+            ]
+        })
+        if not head:
+            for chunk in response.iter_encoded():
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    finally:
+        response.close()
+
+async def lifespan(receive, send):
+    """
+    Atiende los eventos de arranque y parada del servidor ASGI.
+    
+    Args:
+        receive (callable): Canal de recepción de ASGI
+        send (callable): Canal de envío de ASGI
+    """
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await dispose_async_engine(flask_app)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def application(scope, receive, send):
+    """
+    Aplicación ASGI: vistas asíncronas o, para el resto de rutas, la aplicación WSGI.
+    
+    Args:
+        scope (dict): Scope de ASGI
+        receive (callable): Canal de recepción de ASGI
+        send (callable): Canal de envío de ASGI
+    """
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    
+    if scope['type'] == 'http':
+        environ = build_environ(scope)
+        view = match_async_view(environ)
+        if view is not None:
+            response = await dispatch_async(view, environ)
+            return await send_response(response, send, head=scope['method'] == 'HEAD')
+    
+    return await wsgi_application(scope, receive, send)
+
+# Variable que buscan algunos servidores ASGI
+app = application
@@ -1,15 +1,15 @@
 #!/bin/bash
 # Script de inicio para Railway
 
-# Configurar variables por defecto
+# Configurar variables por defecto (el resto de ajustes en gunicorn.conf.py)
 export PORT=${PORT:-5000}
-export WORKERS=${WORKERS:-4}
 export TIMEOUT=${TIMEOUT:-120}
+export GUNICORN_WORKER_CLASS=${GUNICORN_WORKER_CLASS:-gthread}
 
 echo "🚀 Iniciando aplicación Flask en Railway"
 echo "📍 Puerto: $PORT"
-echo "👥 Workers: $WORKERS"
+echo "👥 Workers: ${WORKERS:-automático} ($GUNICORN_WORKER_CLASS)"
 echo "⏱️  Timeout: $TIMEOUT"
 
 # Ejecutar Gunicorn
-exec gunicorn --bind "0.0.0.0:$PORT" --workers "$WORKERS" --timeout "$TIMEOUT" src.wsgi.wsgi:application
+exec gunicorn -c gunicorn.conf.py src.wsgi.wsgi:application